@@ -100,8 +100,7 @@ class Report:
             ``False`` otherwise.
         """
         success = False
-        all_reports = self.service.serverobj.get_objects(objtype=report_objects.TemplateREST)
-        report_objs = [x for x in all_reports if x.name == self.report_name]
+        report_objs = self.service.serverobj.get_templates_by_name(self.report_name)
         if len(report_objs) > 0:
             all_top_levels = [x for x in report_objs if x.parent is None]
             if len(all_top_levels) > 0:
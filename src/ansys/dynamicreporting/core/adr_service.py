@@ -694,11 +694,11 @@ class Service:
             raise ConnectionToServiceError
         url = self._url + "/reports/report_display/?"
         if report_name:
-            all_reports = self.serverobj.get_objects(objtype=report_objects.TemplateREST)
-            if report_name not in [x.name for x in all_reports]:
+            matching_reports = self.serverobj.get_templates_by_name(report_name)
+            if not matching_reports:
                 self.logger.error("report_name must exist")
                 raise MissingReportError
-            reportobj = [x for x in all_reports if x.name == report_name][0]
+            reportobj = matching_reports[0]
             url += "view=" + reportobj.guid + "&"
         url += "usemenus=off"
         query_str = ""
@@ -1028,11 +1028,10 @@ class Service:
                 break
 
         # 2. Compare with the existing root template(s)
-        templates = self.serverobj.get_objects(objtype=report_objects.TemplateREST)
-        existing_root_names = set()
-        for template in templates:
-            if template.master:
-                existing_root_names.add(template.name)
+        templates = self.serverobj.get_templates_by_name(
+            loaded_root_name, root_only=True, startswith=True
+        )
+        existing_root_names = {template.name for template in templates}
 
         if loaded_root_name in existing_root_names:
             num_copies = 1
@@ -1059,10 +1058,8 @@ class Service:
             )
 
             # Clean up already-put template objects
-            all_templates = self.serverobj.get_objects(objtype=report_objects.TemplateREST)
-            for template in all_templates:
-                if template.name == loaded_root_name:
-                    self.serverobj.del_objects(template)
+            for template in self.serverobj.get_templates_by_name(loaded_root_name):
+                self.serverobj.del_objects(template)
 
     def __checkport__(self):
         """
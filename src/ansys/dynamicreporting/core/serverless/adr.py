@@ -80,6 +80,7 @@ from ..exceptions import (
     StaticFilesCollectionError,
 )
 from ..utils import report_utils
+from ..utils.asset_cache import DEFAULT_MAX_BYTES, AssetCache
 from ..utils.geofile_processing import file_is_3d_geometry, rebuild_3d_geometry
 
 
@@ -239,6 +240,8 @@ class ADR:
         )
         self._tmp_dirs: list[tempfile.TemporaryDirectory] = []
         self._in_memory = in_memory
+        # Optional on-disk cache of HTML export static assets, see enable_asset_cache().
+        self._asset_cache: AssetCache | None = None
 
         # Apply extra environment variables early.
         if opts is None:
@@ -1708,6 +1711,45 @@ class ADR:
             f.write(pptx_stream)
         self._logger.info(f"Successfully exported report to: {output_path}")
 
+    def enable_asset_cache(
+        self,
+        directory: str | Path | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        link: bool = True,
+    ) -> AssetCache:
+        """Reuse the static files of HTML exports across exports and processes.
+
+        The static files copied into every export (MathJax, threejs, draco, fonts
+        and the viewer bundle) are stored in a content-addressed cache keyed by
+        Ansys version and asset path. Later exports hard link or copy them from
+        the cache, so only report-specific media is written again.
+
+        Parameters
+        ----------
+        directory : str or Path, optional
+            Cache directory. The default is a per-user cache directory.
+        max_bytes : int, default: 512 MB
+            Size above which the least recently used cached files are evicted.
+        link : bool, default: True
+            If ``True``, cached files are hard linked into the export when possible.
+            Linked files share their content with the cache and must not be edited.
+
+        Returns
+        -------
+        AssetCache
+            The cache used by HTML exports of this ADR instance.
+        """
+        self._asset_cache = AssetCache(
+            directory=str(directory) if directory is not None else None,
+            max_bytes=max_bytes,
+            link=link,
+        )
+        return self._asset_cache
+
+    def disable_asset_cache(self) -> None:
+        """Stop using the HTML export asset cache."""
+        self._asset_cache = None
+
     def export_report_as_html(
         self,
         output_directory: str | Path,
@@ -1803,6 +1845,7 @@ class ADR:
             dark_mode=dark_mode,
             debug=self._debug,
             logger=self._logger,
+            asset_cache=self._asset_cache,
         )
         exporter.export()
 
@@ -72,6 +72,7 @@ class ServerlessReportExporter:
         dark_mode: bool = True,
         debug: bool = False,
         logger: Any = None,
+        asset_cache: Any = None,
     ):
         """
         Initializes the serverless exporter.
@@ -88,6 +89,8 @@ class ServerlessReportExporter:
         self._no_inline = no_inline_files
         self._ansys_version = ansys_version
         self._dark_mode = dark_mode
+        # Optional AssetCache shared across exports for the static files
+        self._asset_cache = asset_cache
 
         # State tracking properties
         self._filemap: dict[str, str] = {}
@@ -398,6 +401,8 @@ class ServerlessReportExporter:
         self._copy_static_file(
             "website/scripts/jquery.min.js", f"ansys{self._ansys_version}/nexus/utils/jquery.min.js"
         )
+        if self._asset_cache is not None:
+            self._asset_cache.trim()
 
     def _copy_static_file(self, source_rel_path: str, target_rel_path: str, silent: bool = False):
         """Helper to copy a single file from the static source to the output directory.
@@ -416,11 +421,26 @@ class ServerlessReportExporter:
         source_file = self._static_dir / source_rel_path
         target_file = self._output_dir / target_rel_path
         if source_file.is_file():
+            # The cached copy is only reused while the source file is unchanged.
+            asset_path = f"{self._static_url}{source_rel_path}"
+            stat = source_file.stat()
+            stamp = f"{stat.st_size}-{stat.st_mtime_ns}"
+            if self._asset_cache is not None and self._asset_cache.materialize(
+                self._ansys_version, asset_path, str(target_file), stamp=stamp
+            ):
+                return
             target_file.parent.mkdir(parents=True, exist_ok=True)
             content = source_file.read_bytes()
             # Patch some viewer JS internals (loader/paths) if needed
             content = self._fix_viewer_component_paths(str(target_file), content)
+            if self._asset_cache is not None:
+                # never write through a hard link into the cache
+                target_file.unlink(missing_ok=True)
             target_file.write_bytes(content)
+            if self._asset_cache is not None:
+                self._asset_cache.store(
+                    self._ansys_version, asset_path, str(target_file), stamp=stamp
+                )
         elif not silent:
             self._logger.warning(f"Warning: Static source file not found: {source_file}")
 
@@ -0,0 +1,221 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""On-disk, content-addressed cache of the static assets of HTML exports."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+# Default upper bound of the cached content, in bytes.
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def default_cache_directory():
+    """Return the per-user directory used when no cache directory is given."""
+    if os.name == "nt":  # pragma: no cover
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "ansys", "dynamicreporting", "html_assets")
+
+
+class AssetCache:
+    """
+    Persistent cache of the static files copied into every exported HTML report.
+
+    Assets such as MathJax, threejs, draco, the fonts and the viewer bundle are keyed
+    by Ansys version and asset path, and carry a stamp identifying the version of their
+    source: the size and modification time of a local file, or the ETag and
+    Last-Modified validators of a server response, which are revalidated by the caller. Their content is stored once under its SHA-256
+    digest, so a file published at several paths is kept only once. Cached assets are
+    materialized into an export directory with a hard link when both are on the same
+    file system and with a copy otherwise. Once the cached content exceeds
+    ``max_bytes``, :meth:`trim` evicts the least recently used files. All writes are
+    atomic renames, so several processes can share one cache directory.
+
+    Hard-linked files share their content with the cache. Exported static assets must
+    therefore not be edited in place; pass ``link=False`` if they need to be.
+
+    Parameters
+    ----------
+    directory : str, optional
+        Cache directory. The default is a per-user cache directory.
+    max_bytes : int, optional
+        Size above which :meth:`trim` evicts cached content.
+    link : bool, optional
+        Whether to materialize assets with hard links when possible.
+    """
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES, link=True):
+        if max_bytes < 0:
+            raise ValueError("The cache size limit cannot be negative.")
+        self.directory = os.path.abspath(directory or default_cache_directory())
+        self.max_bytes = max_bytes
+        self.link = link
+        self._objects = os.path.join(self.directory, "objects")
+        self._refs = os.path.join(self.directory, "refs")
+
+    def _ref_path(self, ansys_version, asset_path):
+        key = hashlib.sha256(asset_path.encode("utf-8")).hexdigest()
+        return os.path.join(self._refs, f"v{ansys_version or 'none'}", key)
+
+    def _object_path(self, digest):
+        return os.path.join(self._objects, digest[:2], digest)
+
+    def get_stamp(self, ansys_version, asset_path):
+        """Return the stamp an asset was stored with, or None if it is not cached."""
+        try:
+            with open(self._ref_path(ansys_version, asset_path), encoding="utf-8") as f:
+                ref = json.load(f)
+            if not os.path.exists(self._object_path(ref["digest"])):
+                return None
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return ref.get("stamp")
+
+    def lookup(self, ansys_version, asset_path, stamp=None):
+        """
+        Return the cached file of an asset, or None.
+
+        ``stamp`` is an optional fingerprint of the asset source (e.g. its size and
+        modification time). If given, it must match the one the asset was stored with.
+        """
+        try:
+            with open(self._ref_path(ansys_version, asset_path), encoding="utf-8") as f:
+                ref = json.load(f)
+            if ref.get("stamp") != stamp:
+                return None
+            filename = self._object_path(ref["digest"])
+            # the modification time records the last use for eviction
+            os.utime(filename)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return filename
+
+    def materialize(self, ansys_version, asset_path, target, stamp=None):
+        """
+        Place the cached copy of an asset at target.
+
+        Returns
+        -------
+        bool
+            False if the asset is not cached or could not be placed.
+        """
+        filename = self.lookup(ansys_version, asset_path, stamp=stamp)
+        if filename is None:
+            return False
+        try:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            if os.path.lexists(target):
+                os.unlink(target)
+            if self.link:
+                try:
+                    os.link(filename, target)
+                    return True
+                except OSError:
+                    # different file systems, or no hard link support
+                    pass
+            shutil.copyfile(filename, target)
+        except OSError:
+            return False
+        return True
+
+    def store(self, ansys_version, asset_path, source, stamp=None):
+        """
+        Add the content of the file source to the cache under an asset key.
+
+        Failures to write the cache are ignored; the cache is an optimization only.
+
+        Returns
+        -------
+        str or None
+            The cached file, or None if it could not be stored.
+        """
+        try:
+            os.makedirs(self._objects, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self._objects, prefix=".tmp_")
+            try:
+                digest = hashlib.sha256()
+                with os.fdopen(fd, "wb") as dst, open(source, "rb") as src:
+                    while chunk := src.read(65536):
+                        digest.update(chunk)
+                        dst.write(chunk)
+                # mkstemp creates private files, exported assets must stay readable
+                os.chmod(tmp_name, 0o644)
+                filename = self._object_path(digest.hexdigest())
+                os.makedirs(os.path.dirname(filename), exist_ok=True)
+                os.replace(tmp_name, filename)
+            except BaseException:
+                if os.path.exists(tmp_name):
+                    os.unlink(tmp_name)
+                raise
+            ref_path = self._ref_path(ansys_version, asset_path)
+            os.makedirs(os.path.dirname(ref_path), exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=os.path.dirname(ref_path), prefix=".tmp_")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"path": asset_path, "digest": digest.hexdigest(), "stamp": stamp}, f)
+            os.replace(tmp_name, ref_path)
+        except OSError:
+            return None
+        return filename
+
+    def _iter_objects(self):
+        for dirpath, _, filenames in os.walk(self._objects):
+            for name in filenames:
+                if name.startswith(".tmp_"):
+                    continue
+                filename = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(filename)
+                except OSError:
+                    continue
+                yield filename, stat
+
+    def size(self):
+        """Return the number of bytes of cached content."""
+        return sum(stat.st_size for _, stat in self._iter_objects())
+
+    def trim(self, max_bytes=None):
+        """
+        Evict the least recently used content until at most max_bytes are cached.
+
+        References to evicted content are dropped lazily by :meth:`lookup`.
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        objects = sorted(self._iter_objects(), key=lambda item: item[1].st_mtime)
+        total = sum(stat.st_size for _, stat in objects)
+        for filename, stat in objects:
+            if total <= max_bytes:
+                break
+            try:
+                os.unlink(filename)
+            except OSError:
+                continue
+            total -= stat.st_size
+
+    def clear(self):
+        """Remove every cached asset."""
+        shutil.rmtree(self._objects, ignore_errors=True)
+        shutil.rmtree(self._refs, ignore_errors=True)
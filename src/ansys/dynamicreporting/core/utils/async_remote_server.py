@@ -0,0 +1,439 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Asyncio interface to an ADR report server.
+
+``AsyncServer`` mirrors the main methods of ``report_remote_server.Server`` with
+coroutines running on the ``httpx`` asynchronous client, so many concurrent pushes can
+share one event loop and one pool of connections. ``httpx`` is an optional dependency
+that is only imported when the first request is made::
+
+    async with AsyncServer("http://localhost:8000", "nexus", "cei") as server:
+        await server.put_objects(items)
+        templates = await server.get_objects(objtype=report_objects.TemplateREST)
+"""
+
+import asyncio
+import collections.abc
+import functools
+import logging
+
+import requests
+
+from . import exceptions, report_objects
+from .multipart import MultipartFileEncoder
+from .report_remote_server import Server
+
+logger = logging.getLogger("ansys.dynamicreporting.core")
+
+
+@functools.lru_cache(maxsize=1)
+def _import_httpx():
+    """Import the optional httpx package only when an async request is made."""
+    try:
+        import httpx
+    except ImportError as e:  # pragma: no cover
+        raise ImportError(
+            "AsyncServer requires the 'httpx' package. "
+            "Install it with 'pip install ansys-dynamicreporting-core[async]'."
+        ) from e
+    return httpx
+
+
+class AsyncServer:
+    """
+    Asynchronous report server interface.
+
+    The requests share a pooled ``httpx.AsyncClient`` and at most ``max_concurrency`` of
+    them are in flight at any time, whatever the number of coroutines pushing objects.
+    Close the server with ``aclose()`` or use it as an async context manager.
+
+    Parameters
+    ----------
+    url : str, optional
+        The URL of the server.
+    username : str, optional
+        The user name.
+    password : str, optional
+        The password.
+    max_connections : int, optional
+        The maximum number of connections kept open to the server.
+    max_concurrency : int, optional
+        The maximum number of requests in flight.
+    timeout : float, optional
+        The timeout of each request in seconds. ``None`` disables it.
+    transport : httpx.AsyncBaseTransport, optional
+        Transport of the client, for example to mock the server in tests.
+    """
+
+    DEFAULT_MAX_CONNECTIONS = 100
+    DEFAULT_MAX_CONCURRENCY = 64
+
+    def __init__(
+        self,
+        url=None,
+        username=None,
+        password=None,
+        max_connections=DEFAULT_MAX_CONNECTIONS,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+        timeout=None,
+        transport=None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("The maximum concurrency must be a positive integer.")
+        # the blocking server holds the connection details and the default session and
+        # dataset and builds the URLs and bodies of the requests. It never does I/O here.
+        self._server = Server(url=url, username=username, password=password)
+        self._max_connections = max_connections
+        self._timeout = timeout
+        self._transport = transport
+        self._client = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._web_session_lock = asyncio.Lock()
+        self._web_session_ready = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the connections to the server."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._web_session_ready = False
+
+    @property
+    def server(self):
+        """
+        The blocking ``Server`` sharing the connection details of this server.
+
+        It can be used to create items and templates with ``create_item()`` and
+        ``create_template()`` once ``validate()`` has been awaited, so that it does
+        not need to query the version of the server itself.
+        """
+        return self._server
+
+    def get_URL(self):
+        return self._server.get_URL()
+
+    def get_auth(self):
+        return self._server.get_auth()
+
+    def valid_database(self):
+        return self._server.valid_database()
+
+    @property
+    def api_version(self):
+        """Read only version var, known once ``validate()`` has been awaited."""
+        return self._server._api_version
+
+    def _get_client(self):
+        if self._client is None:
+            httpx = _import_httpx()
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections,
+                ),
+                timeout=self._timeout,
+                transport=self._transport,
+            )
+        return self._client
+
+    async def _request(self, method, url, **kwargs):
+        async with self._semaphore:
+            return await self._get_client().request(method, url, **kwargs)
+
+    async def validate(self):
+        """Fetch the api_version of the server, returning its version number."""
+        url = self.get_URL()
+        if url is None:
+            raise Exception("No server URL selected")
+        r = await self._request("GET", url + "/item/api_version/", auth=self.get_auth())
+        if r.status_code == requests.codes.forbidden:
+            raise exceptions.PermissionDenied("Invalid credentials to access the report server")
+        if r.status_code != requests.codes.ok:
+            raise Exception("Unable to access the remote report server")
+        server_info = r.json()
+        if "server_name" in server_info:
+            self._server.cur_servername = server_info["server_name"]
+        self._server._api_info = server_info
+        self._server._api_version = float(server_info["version"])
+        return self._server._api_version
+
+    async def _ensure_validated(self):
+        if self._server._api_info is None:
+            await self.validate()
+
+    async def get_objects(self, objtype=report_objects.Template, query=None, fields=None):
+        """
+        Get the objects matching a query.
+
+        See ``Server.get_objects()``. Deferred payloads are not supported since they are
+        loaded by blocking requests.
+        """
+        if not self.valid_database():
+            return []
+        await self._ensure_validated()
+        projection = self._server._get_projection(objtype, fields, False)
+        uri = self._server._get_list_uri(objtype, query, fields=projection)
+        r = await self._request("GET", uri, auth=self.get_auth())
+        if r.status_code != requests.codes.ok:
+            return []
+        try:
+            return [self._server._build_object(objtype, d) for d in r.json()]
+        except Exception as e:
+            logger.debug(f"Warning: {str(e)}")
+            return []
+
+    async def _push_default_objects(self, objects):
+        """Push the default session and dataset if objects reference them and they changed."""
+        server = self._server
+        for digest_attr, ref_attr, default in (
+            ("_default_session_digest", "session", server.get_default_session()),
+            ("_default_dataset_digest", "dataset", server.get_default_dataset()),
+        ):
+            digest = Server.get_object_digest(default)
+            if digest == getattr(server, digest_attr):
+                continue
+            if any(
+                isinstance(o, report_objects.ItemREST) and getattr(o, ref_attr) == default.guid
+                for o in objects
+            ):
+                ret = await self._push_object(default)
+                if ret != requests.codes.ok:
+                    return ret
+                setattr(server, digest_attr, digest)
+        return requests.codes.ok
+
+    async def _send_push(self, o):
+        method, obj_uri, obj_data = self._server._get_push_request_spec(o)
+        data, headers = self._server._encode_push_body(obj_data)
+        body = {"content": data} if isinstance(data, (str, bytes)) else {"data": data}
+        return await self._request(
+            method.upper(),
+            self._server.build_request_url(obj_uri),
+            auth=self.get_auth(),
+            headers=headers,
+            **body,
+        )
+
+    async def _push_file(self, obj, upload_progress=None):
+        """Stream the file payload of obj to the server. Returns the response or None."""
+        file_data = obj.get_url_file()
+        if not file_data:
+            return None
+        progress = None
+        if upload_progress is not None:
+            progress = functools.partial(upload_progress, obj)
+        body = MultipartFileEncoder(
+            "file",
+            file_data[1],
+            file_data[2],
+            chunk_size=Server.UPLOAD_CHUNK_SIZE,
+            progress=progress,
+        )
+        headers = {"Content-Type": body.content_type}
+        if len(body):
+            headers["Content-Length"] = str(len(body))
+
+        async def chunks():
+            # the file is read in a worker thread so the event loop never blocks on disk
+            parts = iter(body)
+            while True:
+                chunk = await asyncio.to_thread(next, parts, None)
+                if chunk is None:
+                    return
+                yield chunk
+
+        return await self._request(
+            "PUT",
+            self._server.cur_url + file_data[0],
+            auth=self.get_auth(),
+            content=chunks(),
+            headers=headers,
+        )
+
+    async def _push_object(self, o, upload_progress=None):
+        """Push a single object (and its file payload) and return the resulting status code."""
+        r = await self._send_push(o)
+        if r.status_code == requests.codes.bad_request:
+            # the default session/dataset may have been deleted behind our back, so
+            # push them again and retry once
+            if isinstance(o, report_objects.ItemREST) and "Invalid pk" in r.text:
+                self._server._default_session_digest = ""
+                self._server._default_dataset_digest = ""
+                error = await self._push_default_objects([o])
+                if error != requests.codes.ok:
+                    return error
+                r = await self._send_push(o)
+            else:
+                self._server._last_error = r.text
+                exceptions.raise_bad_request_error(r)
+        elif r.status_code == requests.codes.forbidden:
+            raise exceptions.PermissionDenied(
+                r.json().get("detail", "You do not have permission to perform this action.")
+            )
+        file_response = await self._push_file(o, upload_progress=upload_progress)
+        if file_response is not None:
+            r = file_response
+        ret = Server._normalize_push_status(r.status_code)
+        if ret != requests.codes.ok:
+            if ret == requests.codes.forbidden:
+                raise exceptions.PermissionDenied(
+                    r.json().get("detail", "You do not have permission to perform this action.")
+                )
+            self._server._last_error = r.text
+        return ret
+
+    async def put_objects(self, in_objects, upload_progress=None):
+        """
+        Push objects to the server.
+
+        The objects of each dependency level (see ``Server.put_objects()``) are pushed
+        concurrently, within the concurrency limit of the server. File payloads are
+        streamed and ``upload_progress`` has the same meaning as in
+        ``Server.put_objects()``.
+        """
+        if not self.valid_database():
+            return requests.codes.service_unavailable
+        objects = in_objects
+        if not isinstance(in_objects, collections.abc.Iterable):
+            objects = [in_objects]
+        objects = list(objects)
+        await self._ensure_validated()
+        error = await self._push_default_objects(objects)
+        if error != requests.codes.ok:
+            return error
+        success = requests.codes.ok
+        for level in Server._get_push_levels(objects):
+            results = await asyncio.gather(
+                *(self._push_object(o, upload_progress=upload_progress) for o in level)
+            )
+            for ret in results:
+                if ret != requests.codes.ok:
+                    success = ret
+        return success
+
+    async def _delete_object(self, o):
+        obj_uri, _ = o.get_url_data()
+        r = await self._request(
+            "DELETE", self._server.build_request_url(obj_uri), auth=self.get_auth()
+        )
+        ret = r.status_code
+        # the output should be 204 no_content
+        if ret != requests.codes.no_content:
+            if ret == requests.codes.bad_request:
+                exceptions.raise_bad_request_error(r)
+            if ret == requests.codes.forbidden:
+                raise exceptions.PermissionDenied(
+                    r.json().get("detail", "You do not have permission to perform this action.")
+                )
+        return ret
+
+    async def del_objects(self, in_objects):
+        """Delete objects from the server concurrently, child templates before their parents."""
+        if not self.valid_database():
+            return requests.codes.service_unavailable
+        objects = in_objects
+        if not isinstance(in_objects, collections.abc.Iterable):
+            objects = [in_objects]
+        success = requests.codes.ok
+        for level in reversed(Server._get_push_levels(list(objects))):
+            for ret in await asyncio.gather(*(self._delete_object(o) for o in level)):
+                if ret != requests.codes.no_content:
+                    success = ret
+        return success
+
+    async def _login_web_session(self):
+        """Log the client into the web (non-REST) views of the server, once."""
+        async with self._web_session_lock:
+            if self._web_session_ready:
+                return True
+            username, passwd = self.get_auth()
+            login_url = self._server.build_request_url("/login/")
+            client = self._get_client()
+            init_response = await self._request("GET", login_url)
+            csrf_token = init_response.cookies.get("csrftoken") or client.cookies.get("csrftoken")
+            if not csrf_token:
+                return False
+            login_response = await self._request(
+                "POST",
+                login_url,
+                data={
+                    "username": username,
+                    "password": passwd,
+                    "csrfmiddlewaretoken": csrf_token,
+                    "next": "/",
+                },
+                follow_redirects=True,
+            )
+            self._web_session_ready = login_response.status_code == requests.codes.ok
+            return self._web_session_ready
+
+    async def get_file(self, obj, fileobj, chunk_size=None):
+        """Download the file payload of obj into fileobj, returning the status code."""
+        if chunk_size is None:
+            chunk_size = Server.DOWNLOAD_CHUNK_SIZE
+        file_url = getattr(obj, "fileurl", None)
+        if not self.valid_database() or file_url is None:
+            return requests.codes.service_unavailable
+        if not await self._login_web_session():
+            return requests.codes.service_unavailable
+        url = self._server.build_request_url(file_url)
+        async with self._semaphore:
+            async with self._get_client().stream("GET", url) as r:
+                if r.status_code == requests.codes.ok:
+                    async for chunk in r.aiter_bytes(chunk_size):
+                        fileobj.write(chunk)
+                return r.status_code
+
+    async def export_report_as_html(
+        self,
+        report_guid,
+        directory_name,
+        query=None,
+        item_filter=None,
+        filename="index.html",
+        no_inline_files=False,
+        ansys_version=None,
+    ):
+        """
+        Export a report as a standalone HTML bundle.
+
+        See ``Server.export_report_as_html()``. The bundle is assembled by the blocking
+        downloader in a worker thread, so the event loop keeps running meanwhile.
+        """
+        await asyncio.to_thread(
+            self._server.export_report_as_html,
+            report_guid,
+            directory_name,
+            query=query,
+            item_filter=item_filter,
+            filename=filename,
+            no_inline_files=no_inline_files,
+            ansys_version=ansys_version,
+        )
@@ -20,8 +20,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import base64
 import datetime
 import json
+import struct
 import uuid
 
 from .report_utils import nexus_array
@@ -33,6 +35,13 @@ try:
 except ImportError:
     has_numpy = False
 
+try:
+    import orjson
+
+    has_orjson = True
+except ImportError:
+    has_orjson = False
+
 
 class BaseEncoder(json.JSONEncoder):
     """
@@ -92,3 +101,132 @@ class PayloaddataEncoder(BaseEncoder):
             return obj.to_2dlist()
 
         return super().default(obj)
+
+
+# Serializers selectable with set_json_backend().
+JSON_BACKENDS = ("json", "orjson")
+
+_json_backend = "json"
+
+
+def set_json_backend(backend):
+    """
+    Select the serializer of push request bodies and item payloads.
+
+    ``"json"`` uses the standard library with :class:`PayloaddataEncoder`. ``"orjson"``
+    serializes datetimes, UUIDs and numpy arrays natively in compiled code and requires
+    the optional ``orjson`` package. Note that orjson writes non-finite floats as
+    ``null`` where the standard library writes ``NaN``.
+    """
+    global _json_backend
+    if backend not in JSON_BACKENDS:
+        raise ValueError(
+            f"Unsupported JSON backend '{backend}'. Use one of {', '.join(JSON_BACKENDS)}."
+        )
+    if backend == "orjson" and not has_orjson:
+        raise ImportError("The 'orjson' JSON backend requires the orjson package.")
+    _json_backend = backend
+
+
+def get_json_backend():
+    return _json_backend
+
+
+# orjson only calls its default hook for the types it does not serialize natively,
+# e.g. nexus arrays and numpy arrays that are not contiguous or of a byte string dtype
+_orjson_default = PayloaddataEncoder().default
+
+_ORJSON_OPTIONS = 0
+if has_orjson:
+    # UTC datetimes end with 'Z' and dict keys are stringified, as with BaseEncoder
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def dumps(obj, sort_keys=False):
+    """
+    Serialize obj to a JSON string in a single pass with the selected backend.
+
+    Item payloads (numpy and nexus arrays, datetimes, UUIDs) are handled by both
+    backends, see :func:`set_json_backend`.
+    """
+    if _json_backend == "orjson":
+        option = _ORJSON_OPTIONS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, default=_orjson_default, option=option).decode("utf-8")
+    return json.dumps(obj, cls=PayloaddataEncoder, sort_keys=sort_keys)
+
+
+# Key of the JSON object that carries a table array as a base64 encoded buffer.
+BINARY_ARRAY_KEY = "__ndarray__"
+
+# struct formats of the numeric dtypes, used to decode buffers without numpy. Only
+# these dtypes and fixed-size byte strings are sent as raw buffers.
+_BINARY_ARRAY_FORMATS = {
+    "b1": "?",
+    "i1": "b",
+    "u1": "B",
+    "i2": "h",
+    "u2": "H",
+    "i4": "i",
+    "u4": "I",
+    "i8": "q",
+    "u8": "Q",
+    "f2": "e",
+    "f4": "f",
+    "f8": "d",
+}
+
+
+def encode_binary_array(value):
+    """
+    Encode a numpy table array as a little-endian buffer with its dtype and shape.
+
+    The result is a small JSON object, ``{"__ndarray__": <base64 buffer>, "dtype": ...,
+    "shape": [...]}``, that replaces the nested list of the JSON table format.
+
+    Returns None if the value is not a numpy array of a fixed-size numeric or byte
+    string dtype, in which case the caller should fall back to the JSON format.
+    """
+    if not has_numpy or not isinstance(value, numpy.ndarray):
+        return None
+    if value.dtype.kind != "S" and value.dtype.str[1:] not in _BINARY_ARRAY_FORMATS:
+        return None
+    dtype = value.dtype.newbyteorder("<") if value.dtype.kind != "S" else value.dtype
+    data = numpy.ascontiguousarray(value, dtype=dtype).tobytes()
+    return {
+        BINARY_ARRAY_KEY: base64.b64encode(data).decode("ascii"),
+        "dtype": dtype.str,
+        "shape": list(value.shape),
+    }
+
+
+def is_binary_array(value):
+    return isinstance(value, dict) and BINARY_ARRAY_KEY in value
+
+
+def decode_binary_array(value):
+    """
+    Rebuild a table array from the output of :func:`encode_binary_array`.
+
+    Returns a writeable numpy array if numpy is available. Otherwise the nested lists
+    of the JSON table format are returned, with byte strings decoded to ``str``.
+    """
+    data = base64.b64decode(value[BINARY_ARRAY_KEY])
+    dtype = value["dtype"]
+    shape = tuple(value["shape"])
+    if has_numpy:
+        # a bytearray keeps the array writeable without another copy
+        return numpy.frombuffer(bytearray(data), dtype=numpy.dtype(dtype)).reshape(shape)
+    kind = dtype.lstrip("<>|=")
+    if kind.startswith("S"):
+        width = int(kind[1:])
+        items = [
+            data[i : i + width].rstrip(b"\0").decode("utf-8") for i in range(0, len(data), width)
+        ]
+    else:
+        fmt = _BINARY_ARRAY_FORMATS[kind]
+        count = len(data) // struct.calcsize("<" + fmt)
+        items = list(struct.unpack(f"<{count}{fmt}", data))
+    if len(shape) < 2:
+        return items
+    columns = shape[1]
+    return [items[i : i + columns] for i in range(0, len(items), columns)]
@@ -0,0 +1,129 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""In-process cache of GET responses from an ADR server."""
+
+import collections
+import threading
+import time
+
+
+class _CacheEntry:
+    __slots__ = ("response", "etag", "last_modified", "timestamp")
+
+    def __init__(self, response, etag, last_modified, timestamp):
+        self.response = response
+        self.etag = etag
+        self.last_modified = last_modified
+        self.timestamp = timestamp
+
+
+class ResponseCache:
+    """
+    LRU cache of successful GET responses keyed by URL and query.
+
+    Entries younger than ``ttl`` seconds are served without contacting the server.
+    Older entries are revalidated with a conditional request built from the ETag and
+    Last-Modified headers of the cached response. The least recently used entries are
+    evicted once ``max_entries`` are stored. The cache is safe to use from several
+    threads.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        Maximum number of responses kept in the cache.
+    ttl : float, optional
+        Number of seconds a response is served without revalidation.
+    """
+
+    def __init__(self, max_entries=256, ttl=30.0):
+        if max_entries < 1:
+            raise ValueError("The cache must be able to hold at least one entry.")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        # bumped by every invalidation, see put()
+        self._generation = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the cached entry for key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def is_fresh(self, entry):
+        return (time.monotonic() - entry.timestamp) < self.ttl
+
+    def revalidation_headers(self, entry):
+        """Return the headers of a conditional request for a stale entry."""
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def touch(self, entry):
+        """Mark an entry as just validated by the server."""
+        entry.timestamp = time.monotonic()
+
+    @property
+    def generation(self):
+        """Number of invalidations so far, to be read before sending a request."""
+        return self._generation
+
+    def put(self, key, response, generation=None):
+        """
+        Store the response of key.
+
+        If ``generation`` is set and the cache was invalidated since it was read, the
+        response may predate the change that caused the invalidation and is dropped.
+        """
+        entry = _CacheEntry(
+            response,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            time.monotonic(),
+        )
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, fragment=None):
+        """Drop the entries whose URL contains fragment, or all of them if it is None."""
+        with self._lock:
+            self._generation += 1
+            if fragment is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if fragment in k[0]]:
+                del self._entries[key]
@@ -0,0 +1,239 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Resumable ingestion of large object sets into an ADR server."""
+
+import collections
+import hashlib
+import json
+import logging
+import os
+import time
+
+import requests
+
+from . import exceptions, report_utils
+
+logger = logging.getLogger("ansys.dynamicreporting.core")
+
+# fields generated anew each time the same objects are built: GUIDs, dates and the
+# GUID references between objects
+VOLATILE_FIELDS = ("guid", "date", "session", "dataset", "parent", "children", "children_order")
+
+
+def _stable_value(value):
+    # JSON hook of content_key(): sets have no order and binary data is hashed
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    if isinstance(value, (bytes, bytearray)):
+        return hashlib.sha256(value).hexdigest()
+    if isinstance(value, report_utils.nexus_array):
+        return [value.dtype, list(value.shape), hashlib.sha256(value.to_bytes()).hexdigest()]
+    if hasattr(value, "tobytes"):
+        # numpy arrays
+        return [str(value.dtype), list(value.shape), hashlib.sha256(value.tobytes()).hexdigest()]
+    return str(value)
+
+
+def content_key(obj):
+    """
+    Return a key identifying an object by its type and content.
+
+    The fields in ``VOLATILE_FIELDS`` are left out, so objects built again by a later
+    run get the same key. File payloads are identified by their file name and image
+    payloads by their data.
+    """
+    fields = {k: getattr(obj, k, None) for k in obj.get_json_keys() if k not in VOLATILE_FIELDS}
+    fields["fileurl"] = getattr(obj, "fileurl", None)
+    fields["image_data"] = getattr(obj, "image_data", None)
+    content = json.dumps(fields, sort_keys=True, default=_stable_value)
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    return f"{obj.get_url_base_name()}:{digest}"
+
+
+class IngestionRunner:
+    """
+    Push objects to a server in batches, checkpointing the progress to a journal.
+
+    The journal is a JSON-lines file recording the key of every object pushed or
+    failed. Running again with the same journal skips the objects already pushed, so an
+    interrupted upload resumes where it stopped. Objects failing on a network error or a
+    transient server error (429 or 5xx) are retried with exponential backoff. Objects
+    still failing, or rejected by the server, are journaled as failed and retried on the
+    next run.
+
+    Parameters
+    ----------
+    server : Server
+        The server to push the objects to.
+    journal_path : str
+        Path of the journal file, created if needed.
+    batch_size : int, optional
+        Number of objects per ``put_objects()`` call.
+    max_retries : int, optional
+        Number of retries of each failed object.
+    backoff_factor : float, optional
+        Delay in seconds before the first retry, doubled on each retry.
+    key : callable, optional
+        Function returning the stable identity of an object in the journal. Defaults
+        to :func:`content_key`, numbered by occurrence so that objects with the same
+        content in one run are told apart, as long as they are passed in the same
+        order on every run.
+    max_workers : int, optional
+        Number of concurrent pushes per batch, see ``Server.put_objects()``.
+
+    Examples
+    --------
+    ::
+
+        runner = IngestionRunner(server, "study.journal")
+        result = runner.run(create_items())
+    """
+
+    def __init__(
+        self,
+        server,
+        journal_path,
+        batch_size=100,
+        max_retries=3,
+        backoff_factor=1.0,
+        key=None,
+        max_workers=None,
+    ):
+        if batch_size < 1:
+            raise ValueError("The batch size must be a positive integer.")
+        self._server = server
+        self.journal_path = journal_path
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.key = key if key is not None else content_key
+        self._number_duplicates = key is None
+        self.max_workers = max_workers
+
+    def load_journal(self):
+        """Return the keys of the pushed objects and the last error of the failed ones."""
+        pushed = set()
+        failed = {}
+        if not os.path.exists(self.journal_path):
+            return pushed, failed
+        with open(self.journal_path, encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # a record cut short by a crash
+                    continue
+                if entry["status"] == "pushed":
+                    pushed.add(entry["key"])
+                    failed.pop(entry["key"], None)
+                else:
+                    failed[entry["key"]] = entry.get("error")
+        return pushed, failed
+
+    def run(self, objects):
+        """
+        Push the objects not yet recorded as pushed in the journal.
+
+        Parameters
+        ----------
+        objects : iterable
+            The objects to push. It is consumed lazily, one batch at a time.
+
+        Returns
+        -------
+        dict
+            The number of objects ``"pushed"`` and ``"skipped"`` by this run and the
+            keys and errors of the ``"failed"`` ones.
+        """
+        pushed, _ = self.load_journal()
+        result = {"pushed": 0, "skipped": 0, "failed": {}}
+        with open(self.journal_path, "a", encoding="utf-8") as journal:
+            if journal.tell() and not self._ends_with_newline():
+                # terminate the record cut short by a crash
+                journal.write("\n")
+            batch = []
+            occurrences = collections.Counter()
+            for obj in objects:
+                key = self.key(obj)
+                if self._number_duplicates:
+                    occurrences[key] += 1
+                    if occurrences[key] > 1:
+                        key = f"{key}#{occurrences[key]}"
+                if key in pushed:
+                    result["skipped"] += 1
+                    continue
+                batch.append((key, obj))
+                if len(batch) >= self.batch_size:
+                    self._run_batch(batch, journal, result)
+                    batch = []
+            if batch:
+                self._run_batch(batch, journal, result)
+        return result
+
+    def _ends_with_newline(self):
+        with open(self.journal_path, "rb") as journal:
+            journal.seek(-1, os.SEEK_END)
+            return journal.read(1) == b"\n"
+
+    def _run_batch(self, batch, journal, result):
+        """Push a batch of (key, object) pairs and journal the outcome of each object."""
+        try:
+            ret = self._server.put_objects([obj for _, obj in batch], max_workers=self.max_workers)
+        except (requests.RequestException, exceptions.BadRequestError) as e:
+            logger.debug(f"Warning: {str(e)}")
+            ret = None
+        if ret == requests.codes.ok:
+            records = [(key, None) for key, _ in batch]
+        else:
+            # find out which objects failed by retrying them one at a time
+            records = [(key, self._push_with_retries(obj)) for key, obj in batch]
+        for key, error in records:
+            entry = {"key": key, "status": "pushed" if error is None else "failed"}
+            if error is None:
+                result["pushed"] += 1
+            else:
+                entry["error"] = error
+                result["failed"][entry["key"]] = error
+            journal.write(json.dumps(entry) + "\n")
+        journal.flush()
+        os.fsync(journal.fileno())
+
+    def _push_with_retries(self, obj):
+        """Push a single object, returning None on success or the last error."""
+        error = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(self.backoff_factor * 2 ** (attempt - 1))
+            try:
+                ret = self._server.put_objects([obj])
+            except requests.RequestException as e:
+                error = str(e)
+                continue
+            except exceptions.BadRequestError as e:
+                return str(e)
+            if ret == requests.codes.ok:
+                return None
+            error = f"HTTP status {ret}"
+            if ret != requests.codes.too_many_requests and ret < 500:
+                return error
+        return error
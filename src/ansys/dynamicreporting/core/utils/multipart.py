@@ -0,0 +1,128 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Streaming ``multipart/form-data`` encoding for large file uploads."""
+
+import io
+import uuid
+
+# size of the chunks read from the file object and sent on the wire
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class MultipartFileEncoder:
+    """
+    Stream a single file as a ``multipart/form-data`` request body.
+
+    ``requests`` builds the complete multipart body in memory before sending it, which
+    is not an option for multi-GB scene or animation payloads. Passing an instance of
+    this class as the ``data`` of a request sends the body in chunks read from the file
+    object instead, so memory use stays constant regardless of the file size.
+
+    Parameters
+    ----------
+    field_name : str
+        Name of the form field holding the file.
+    filename : str
+        File name reported to the server.
+    fileobj : file-like
+        Binary file object to upload, read from its current position. Streams that
+        cannot seek may report their size through a ``len`` attribute, the same
+        convention used by ``requests``.
+    chunk_size : int, optional
+        Number of bytes read from ``fileobj`` per chunk.
+    progress : callable, optional
+        Called with ``(bytes_sent, total_bytes)`` after every chunk of the file is
+        produced. ``total_bytes`` is ``None`` if the file size cannot be determined.
+    """
+
+    def __init__(self, field_name, filename, fileobj, chunk_size=DEFAULT_CHUNK_SIZE, progress=None):
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be a positive integer.")
+        self.boundary = uuid.uuid4().hex
+        self._fileobj = fileobj
+        self._chunk_size = chunk_size
+        self._progress = progress
+        field_name = field_name.replace('"', "%22")
+        filename = filename.replace('"', "%22")
+        self._header = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; filename="{filename}"\r\n'
+            "\r\n"
+        ).encode("utf-8")
+        self._footer = f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+        self._start, self._file_size = self._get_file_extent(fileobj)
+        self._started = False
+
+    @staticmethod
+    def _get_file_extent(fileobj):
+        # the start position and remaining size of the file, if it can seek
+        length = getattr(fileobj, "len", None)
+        if length is not None:
+            return None, length
+        try:
+            start = fileobj.tell()
+            end = fileobj.seek(0, io.SEEK_END)
+            fileobj.seek(start)
+        except (AttributeError, OSError, ValueError):
+            return None, None
+        return start, end - start
+
+    @property
+    def content_type(self):
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def file_size(self):
+        return self._file_size
+
+    @property
+    def rewindable(self):
+        """Whether the body can be sent again, for instance when the request is retried."""
+        return self._start is not None
+
+    def __len__(self):
+        # requests uses this to set the Content-Length header.  Zero makes it fall
+        # back to a chunked transfer when the size of the file is not known.
+        if self._file_size is None:
+            return 0
+        return len(self._header) + self._file_size + len(self._footer)
+
+    def __iter__(self):
+        # rewind, so the body can be sent again if the request is retried
+        if self._start is not None:
+            self._fileobj.seek(self._start)
+        elif self._started:
+            # the file was (partially) consumed, sending it again would corrupt the upload
+            raise io.UnsupportedOperation("The file cannot be rewound to send the body again.")
+        self._started = True
+        yield self._header
+        sent = 0
+        while True:
+            chunk = self._fileobj.read(self._chunk_size)
+            if not chunk:
+                break
+            sent += len(chunk)
+            yield chunk
+            if self._progress is not None:
+                self._progress(sent, self._file_size)
+        yield self._footer
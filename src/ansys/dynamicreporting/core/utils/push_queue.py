@@ -0,0 +1,217 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Write-behind queue pushing objects to an ADR server from a background thread."""
+
+import atexit
+import collections
+import logging
+import pickle  # nosec B403
+import struct
+import tempfile
+import threading
+
+import requests
+
+logger = logging.getLogger("ansys.dynamicreporting.core")
+
+# length prefix of the records of the spill file
+_RECORD_HEADER = struct.Struct("<Q")
+
+
+class PushQueue:
+    """
+    Push objects to a server from a worker thread.
+
+    ``enqueue()`` returns immediately and the worker pushes the queued objects in order,
+    ``batch_size`` objects per ``Server.put_objects()`` call. At most ``max_pending``
+    objects are kept in memory. Beyond that, objects are pickled to a temporary spill
+    file and read back once the worker catches up, so memory stays bounded when the
+    producer outpaces the network. Objects holding an open file cannot be pickled and
+    instead wait for room in memory.
+
+    Objects must not be modified once queued. Failed pushes do not stop the queue: they
+    are reported to ``on_error(objects, error)``, where ``error`` is the failing status
+    code or the raised exception, or are logged if no callback is set. The callback may
+    queue the objects again, but an object that can neither be kept in memory nor
+    spilled is then rejected with a ``RuntimeError`` instead of waiting for room.
+
+    The queue is closed, pushing the remaining objects, when the interpreter exits.
+
+    Parameters
+    ----------
+    server : Server
+        The server to push the objects to.
+    max_pending : int, optional
+        The maximum number of objects held in memory.
+    batch_size : int, optional
+        The maximum number of objects per push.
+    spill_dir : str, optional
+        Directory of the spill file. Defaults to the system temporary directory.
+    on_error : callable, optional
+        Called from the worker thread with the objects of a failed push and the error.
+    """
+
+    def __init__(self, server, max_pending=1000, batch_size=100, spill_dir=None, on_error=None):
+        if max_pending < 1 or batch_size < 1:
+            raise ValueError("The queue and batch sizes must be positive integers.")
+        self._server = server
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.on_error = on_error
+        self._spill_dir = spill_dir
+        self._pending = collections.deque()
+        self._spill = None
+        self._spill_read_pos = 0
+        self._spill_count = 0
+        self._in_flight = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="ADRPushQueue", daemon=True)
+        self._thread.start()
+        # the worker is a daemon thread, so push what is left before it is stopped
+        atexit.register(self.close)
+
+    def __len__(self):
+        """Number of objects waiting to be pushed, including the ones being pushed."""
+        with self._cond:
+            return len(self._pending) + self._spill_count + self._in_flight
+
+    @property
+    def spilled(self):
+        """Number of objects currently waiting in the spill file."""
+        return self._spill_count
+
+    def enqueue(self, obj):
+        """Queue obj to be pushed by the worker thread."""
+        # the worker, e.g. running on_error, keeps draining the queue while it is closed
+        on_worker = threading.current_thread() is self._thread
+        with self._cond:
+            if self._closed and not on_worker:
+                raise RuntimeError("The push queue is closed.")
+            # once objects are spilled, newer ones go behind them to keep the order
+            if self._spill_count == 0 and len(self._pending) < self.max_pending:
+                self._pending.append(obj)
+            else:
+                try:
+                    self._spill_write(obj)
+                except (pickle.PicklingError, TypeError, AttributeError):
+                    if on_worker:
+                        # only the worker makes room, it cannot wait for itself
+                        raise RuntimeError(
+                            "The push queue is full and the object cannot be spilled."
+                        )
+                    while self._spill_count or len(self._pending) >= self.max_pending:
+                        self._cond.wait()
+                    self._pending.append(obj)
+            self._cond.notify_all()
+
+    def flush(self, timeout=None):
+        """
+        Wait until every queued object has been pushed.
+
+        Returns ``False`` if the timeout, in seconds, expired first.
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not (self._pending or self._spill_count or self._in_flight), timeout
+            )
+
+    def close(self):
+        """Push the remaining objects and stop the worker thread."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        atexit.unregister(self.close)
+        self._thread.join()
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    def _spill_write(self, obj):
+        data = pickle.dumps(obj)  # nosec B301
+        if self._spill is None:
+            self._spill = tempfile.TemporaryFile(dir=self._spill_dir)
+        self._spill.seek(0, 2)
+        self._spill.write(_RECORD_HEADER.pack(len(data)))
+        self._spill.write(data)
+        self._spill_count += 1
+
+    def _spill_read(self):
+        self._spill.seek(self._spill_read_pos)
+        (size,) = _RECORD_HEADER.unpack(self._spill.read(_RECORD_HEADER.size))
+        obj = pickle.loads(self._spill.read(size))  # nosec B301
+        self._spill_read_pos = self._spill.tell()
+        self._spill_count -= 1
+        if self._spill_count == 0:
+            # reuse the file from the start for the next spill
+            self._spill.seek(0)
+            self._spill.truncate()
+            self._spill_read_pos = 0
+        return obj
+
+    def _take_batch(self):
+        batch = []
+        while self._pending and len(batch) < self.batch_size:
+            batch.append(self._pending.popleft())
+        # the spilled objects were all queued after the ones in memory
+        while not self._pending and self._spill_count and len(batch) < self.batch_size:
+            batch.append(self._spill_read())
+        return batch
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._spill_count or self._closed)
+                batch = self._take_batch()
+                if not batch:
+                    # closed and drained
+                    return
+                self._in_flight = len(batch)
+                # room was made for producers waiting on memory
+                self._cond.notify_all()
+            try:
+                self._push(batch)
+            finally:
+                with self._cond:
+                    self._in_flight = 0
+                    self._cond.notify_all()
+
+    def _push(self, batch):
+        try:
+            ret = self._server.put_objects(batch)
+        except Exception as e:
+            self._report_error(batch, e)
+            return
+        if ret != requests.codes.ok:
+            self._report_error(batch, ret)
+
+    def _report_error(self, batch, error):
+        if self.on_error is None:
+            logger.error(f"Unable to push {len(batch)} queued object(s): {error}")
+            return
+        try:
+            self.on_error(batch, error)
+        except Exception as e:
+            logger.error(f"Error in the push queue error callback: {str(e)}")
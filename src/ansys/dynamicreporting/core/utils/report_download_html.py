@@ -21,12 +21,16 @@
 # SOFTWARE.
 
 import base64
+from concurrent.futures import ThreadPoolExecutor
 import os
 import os.path
 import re
+import shutil
+import tempfile
 import urllib.parse
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ..compatibility import DEFAULT_STATIC_ASSET_VERSION as CURRENT_VERSION
 from .html_export_constants import (
@@ -43,6 +47,32 @@ from .html_export_mathjax import detect_mathjax_version_from_html
 # server version is supplied.
 ANSYS_VERSION_FALLBACK = CURRENT_VERSION
 
+# Number of asset downloads that may be in flight at once.
+DEFAULT_MAX_WORKERS = 8
+
+# Downloads are read in chunks of this size to avoid zip bomb attacks.
+CHUNK_SIZE = 65536
+
+
+class _SpooledResponse:
+    """Minimal stand-in for a streamed response whose body was prefetched to disk.
+
+    It exposes just the ``status_code`` and ``iter_content`` surface that
+    ``_get_file`` consumes, so prefetched and on-demand downloads share the
+    same substitution code.
+    """
+
+    def __init__(self, status_code, filename=None):
+        self.status_code = status_code
+        self.filename = filename
+
+    def iter_content(self, chunk_size=1):
+        if self.filename is None:
+            return
+        with open(self.filename, "rb") as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+
 
 class ReportDownloadHTML:
     def __init__(
@@ -53,6 +83,9 @@ class ReportDownloadHTML:
         filename="index.html",
         no_inline_files=False,
         ansys_version=None,
+        session=None,
+        max_workers=DEFAULT_MAX_WORKERS,
+        asset_cache=None,
     ):
         # Make sure that the print query has been specified.  Set it to html if not set
         if url:
@@ -96,6 +129,38 @@ class ReportDownloadHTML:
         # repeating the same detection work only adds network I/O.
         self._report_html: str | None = None
         self._mathjax_version: str | None = None
+        # All fetches go through one session so connections to the ADR server are
+        # reused across the hundreds of small asset requests an export makes.
+        # Callers such as ``Server`` may hand in their own pooled session.
+        self._max_workers = max(1, int(max_workers or 1))
+        self._session = session if session is not None else self._create_session()
+        # Optional AssetCache for the static files that are identical across reports
+        self._asset_cache = asset_cache
+        # Futures for special-file downloads submitted during _download_special_files()
+        self._executor = None
+        self._pending = []
+        # Report assets fetched ahead of the (serial) substitution pass, keyed by the
+        # query-less pathname.  ``None`` while collecting pathnames in a dry run.
+        self._prefetched = dict()
+        self._collected = None
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._max_workers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _server_url(self, path: str) -> str:
+        tmp = urllib.parse.urlsplit(self._url)
+        return tmp.scheme + "://" + tmp.netloc + path
+
+    def _submit(self, func, *args, **kwargs) -> None:
+        # Run on the special-file pool when one is active, otherwise inline.
+        if self._executor is None:
+            func(*args, **kwargs)
+        else:
+            self._pending.append(self._executor.submit(func, *args, **kwargs))
 
     def _should_use_data_uri(self, size: int) -> bool:
         self._inline_size_exception = False
@@ -161,6 +226,21 @@ class ReportDownloadHTML:
             current = idx1 + len(new_path)
 
     def _download_special_files(self):
+        # The special files are independent of each other and of the report HTML,
+        # so they are downloaded concurrently on a bounded pool.  Every download is
+        # finished (and any error re-raised) before returning.
+        self._pending = []
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            self._executor = executor
+            try:
+                self._queue_special_files()
+            finally:
+                self._executor = None
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+    def _queue_special_files(self):
         # The remote path resolves the page's MathJax version before downloads
         # begin, so only the matching asset tree needs to be fetched.  Avoiding
         # the other tree keeps the export quiet and removes unnecessary GETs.
@@ -325,9 +405,60 @@ class ReportDownloadHTML:
         file-handle handling deterministic and avoids duplicating mkdir logic.
         """
         os.makedirs(os.path.dirname(filename), exist_ok=True)
+        # Never write through an existing file, it may be a hard link into an asset cache.
+        if os.path.lexists(filename):
+            os.unlink(filename)
         with open(filename, "wb") as file_handle:
             file_handle.write(data)
 
+    @staticmethod
+    def _write_chunks(filename: str, chunks, head: bytes = b"") -> None:
+        """Stream ``head`` followed by the remaining response chunks to a file.
+
+        Nothing beyond one chunk is held in memory, so large media such as AVZ
+        scenes and movies are saved in time and memory linear in their size.
+        """
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        if os.path.lexists(filename):
+            os.unlink(filename)
+        with open(filename, "wb") as file_handle:
+            file_handle.write(head)
+            for chunk in chunks:
+                if chunk:
+                    file_handle.write(chunk)
+
+    @staticmethod
+    def _read_chunks(chunks, limit=None, buffer=None) -> tuple[bytearray, bool]:
+        """Buffer response chunks in memory.
+
+        Parameters
+        ----------
+        chunks : iterator of bytes
+            Chunk iterator of a streamed response.  It is shared with the caller,
+            so an interrupted read can be resumed, e.g. by :meth:`_write_chunks`.
+        limit : int, optional
+            Stop reading as soon as more than this many bytes have been buffered.
+        buffer : bytearray, optional
+            Buffer to append to.  A new one is created by default.
+
+        Returns
+        -------
+        tuple[bytearray, bool]
+            The buffered bytes and whether the response was read completely.
+        """
+        buffer = bytearray() if buffer is None else buffer
+        for chunk in chunks:
+            if chunk:
+                buffer += chunk
+            if limit is not None and len(buffer) > limit:
+                return buffer, False
+        return buffer, True
+
+    @staticmethod
+    def _rewrites_viewer_paths(filename: str) -> bool:
+        # the files that fix_viewer_component_paths() edits
+        return filename.endswith("ANSYSViewer_min.js") or filename.endswith("viewer-loader.js")
+
     def _download_mathjax_files(self, files: tuple[str, ...], *, silent: bool) -> None:
         """Download one MathJax asset set into the offline export tree.
 
@@ -339,46 +470,83 @@ class ReportDownloadHTML:
             When ``True``, missing files are ignored because version detection
             failed and neither asset tree can be treated as authoritative.
         """
-        tmp = urllib.parse.urlsplit(self._url)
-        mathjax_root_url = tmp.scheme + "://" + tmp.netloc + "/static/"
-
         for source_rel_path in files:
-            url = mathjax_root_url + source_rel_path
-            resp = requests.get(url, allow_redirects=True, stream=True, timeout=300)
-            if resp.status_code == requests.codes.ok:
-                filename = os.path.join(self._directory, self._mathjax_media_path(source_rel_path))
-                try:
-                    # Read in chunks to avoid zip bomb attacks
-                    content = b""
-                    for chunk in resp.iter_content(chunk_size=65536):
-                        if chunk:
-                            content += chunk
-                    self._write_binary_file(filename, content)
-                except OSError as e:
-                    print(f"Unable to download MathJax file: {source_rel_path}\nError {e}")
-            elif not (silent or source_rel_path in MATHJAX_OPTIONAL_FILES):
-                print(f"Unable to get: {url}")
+            self._submit(self._download_mathjax_file, source_rel_path, silent=silent)
+
+    def _download_mathjax_file(self, source_rel_path: str, *, silent: bool) -> None:
+        url = self._server_url("/static/" + source_rel_path)
+        filename = os.path.join(self._directory, self._mathjax_media_path(source_rel_path))
+        resp = self._get_static_file(url, filename)
+        if resp is None:
+            return
+        if resp.status_code == requests.codes.ok:
+            try:
+                self._write_chunks(filename, resp.iter_content(chunk_size=CHUNK_SIZE))
+                self._store_cached(url, filename, resp)
+            except OSError as e:
+                print(f"Unable to download MathJax file: {source_rel_path}\nError {e}")
+        elif not (silent or source_rel_path in MATHJAX_OPTIONAL_FILES):
+            print(f"Unable to get: {url}")
 
     def _download_static_files(self, files, source_path, target_path, comment):
-        tmp = urllib.parse.urlsplit(self._url)
         for f in files:
-            url = tmp.scheme + "://" + tmp.netloc + source_path + f
-            resp = requests.get(url, allow_redirects=True, stream=True, timeout=300)
-            if resp.status_code == requests.codes.ok:
-                filename = self._directory + os.sep + target_path + os.sep + f
-                filename = os.path.normpath(filename)
-                try:
-                    # Read in chunks to avoid zip bomb attacks
-                    content = b""
-                    for chunk in resp.iter_content(chunk_size=65536):
-                        if chunk:
-                            content += chunk
-                    data = self.fix_viewer_component_paths(
-                        str(filename), content, self._ansys_version
-                    )
+            self._submit(self._download_static_file, f, source_path, target_path, comment)
+
+    def _download_static_file(self, f, source_path, target_path, comment):
+        url = self._server_url(source_path + f)
+        filename = self._directory + os.sep + target_path + os.sep + f
+        filename = os.path.normpath(filename)
+        resp = self._get_static_file(url, filename)
+        if resp is None:
+            return
+        if resp.status_code == requests.codes.ok:
+            try:
+                chunks = resp.iter_content(chunk_size=CHUNK_SIZE)
+                if self._rewrites_viewer_paths(filename):
+                    content, _ = self._read_chunks(chunks)
+                    data = self.fix_viewer_component_paths(filename, content, self._ansys_version)
                     self._write_binary_file(filename, data)
-                except Exception as e:
-                    print(f"Unable to download {comment}: {f}\nError: {e}")
+                else:
+                    self._write_chunks(filename, chunks)
+                self._store_cached(url, filename, resp)
+            except Exception as e:
+                print(f"Unable to download {comment}: {f}\nError: {e}")
+
+    def _get_static_file(self, url: str, filename: str):
+        """GET a static asset, or return None once a cached copy is placed at filename.
+
+        Cached copies are keyed by their full URL, so every server has its own entries,
+        and are only used after the server confirms them with a 304 response to a
+        conditional request.
+        """
+        if self._asset_cache is not None:
+            stamp = self._asset_cache.get_stamp(self._ansys_version, url)
+            headers = {}
+            if stamp and stamp.get("etag"):
+                headers["If-None-Match"] = stamp["etag"]
+            if stamp and stamp.get("last_modified"):
+                headers["If-Modified-Since"] = stamp["last_modified"]
+            if headers:
+                resp = self._session.get(
+                    url, headers=headers, allow_redirects=True, stream=True, timeout=300
+                )
+                if resp.status_code != requests.codes.not_modified:
+                    return resp
+                resp.close()
+                if self._asset_cache.materialize(self._ansys_version, url, filename, stamp=stamp):
+                    return None
+        return self._session.get(url, allow_redirects=True, stream=True, timeout=300)
+
+    def _store_cached(self, url: str, filename: str, resp) -> None:
+        # without validators a cached copy could never be revalidated
+        if self._asset_cache is None:
+            return
+        stamp = {
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        }
+        if stamp["etag"] or stamp["last_modified"]:
+            self._asset_cache.store(self._ansys_version, url, filename, stamp=stamp)
 
     def _make_unique_basename(self, name: str) -> str:
         # check to see if the filename has already been used (and hence we are headed toward
@@ -404,27 +572,36 @@ class ReportDownloadHTML:
     def _get_file(self, path_plus_queries: str, pathname: str, inline: bool = False) -> str:
         if pathname in self._filemap:
             return self._filemap[pathname]
-        tmp = urllib.parse.urlsplit(self._url)
-        url = tmp.scheme + "://" + tmp.netloc + path_plus_queries
-        resp = requests.get(url, allow_redirects=True, stream=True, timeout=300)
+        if self._collected is not None:
+            # dry run: record the asset and leave the text untouched
+            self._collected.setdefault(pathname, path_plus_queries)
+            return path_plus_queries
+        url = self._server_url(path_plus_queries)
+        resp = self._prefetched.pop(pathname, None)
+        if resp is None:
+            resp = self._session.get(url, allow_redirects=True, stream=True, timeout=300)
         results = pathname
         if resp.status_code == requests.codes.ok:
             basename = os.path.basename(pathname)
             # "basename" is used in the media directory, avoid collisions.
             basename = self._make_unique_basename(basename)
             try:
-                # Read in chunks to avoid zip bomb attacks
-                content = b""
-                for chunk in resp.iter_content(chunk_size=65536):
-                    if chunk:
-                        content += chunk
-                tmp = content
+                chunks = resp.iter_content(chunk_size=CHUNK_SIZE)
+                # Only data URI candidates are buffered, and only up to the remaining
+                # inline budget.  Everything else is streamed to its target file.
                 # 4/3 is roughly the expansion factor of base64 encoding (3bytes encode to 4)
                 # Note: we will also inline any "scene" 3D file.  This can happen when processing
                 # a slider view "key_image" array.
-                if (inline or self.is_scene_file(pathname)) and self._should_use_data_uri(
-                    len(tmp) * (4.0 / 3.0)
-                ):
+                tmp = None
+                use_data_uri = False
+                if inline or self.is_scene_file(pathname):
+                    limit = 0
+                    if not self._no_inline:
+                        limit = int((self._max_inline_size - self._total_data_uri_size) * 0.75)
+                    tmp, complete = self._read_chunks(chunks, limit=limit)
+                    # an incomplete read is over the budget, which flags the size exception
+                    use_data_uri = self._should_use_data_uri(len(tmp) * (4.0 / 3.0)) and complete
+                if use_data_uri:
                     # convert to inline data domain URI. Prefix:  'data:application/octet-stream;base64,'
                     results = "data:application/octet-stream;base64," + base64.b64encode(
                         tmp
@@ -438,15 +615,18 @@ class ReportDownloadHTML:
                     # <script src="/media/b4bb7a9e-aa4d-11e9-a8ef-44850048bb82_scene/scene.js"></script>
                     # The downloaded file may have binary loader references like this:
                     # load_binary_block('/media/b4bb7a9e-aa4d-11e9-a8ef-44850048bb82_scene/p0_t0_b4_m0.bin', mesh0);
+                    # These small text files are edited, so they are read completely.
+                    data = None
                     if basename.endswith("scene.js"):
-                        tmp = tmp.decode("utf-8")
-                        tmp = self._replace_blocks(
-                            tmp, "load_binary_block(", ");", inline=True
+                        tmp, _ = self._read_chunks(chunks, buffer=tmp)
+                        data = self._replace_blocks(
+                            tmp.decode("utf-8"), "load_binary_block(", ");", inline=True
                         ).encode("utf-8")
                         # we need to prefix the .bin file and scene.js file with the GUID
                         basename = f"{os.path.basename(os.path.dirname(pathname))}_{basename}"
-                    else:
-                        tmp = self.fix_viewer_component_paths(basename, tmp, self._ansys_version)
+                    elif self._rewrites_viewer_paths(basename):
+                        tmp, _ = self._read_chunks(chunks, buffer=tmp)
+                        data = self.fix_viewer_component_paths(basename, tmp, self._ansys_version)
                     # get the output filename
                     if pathname.startswith(f"/static/ansys{self._ansys_version}/"):
                         # if the content is part of the /ansys/ namespace, we keep the namespace,
@@ -456,7 +636,14 @@ class ReportDownloadHTML:
                     else:
                         results = f"./media/{basename}"
                     filename = os.path.join(self._directory, "media", basename)
-                    self._write_binary_file(filename, tmp)
+                    if data is not None:
+                        self._write_binary_file(filename, data)
+                    elif tmp is None and isinstance(resp, _SpooledResponse):
+                        # the prefetched body is already on disk, just move it into place
+                        os.makedirs(os.path.dirname(filename), exist_ok=True)
+                        os.replace(resp.filename, filename)
+                    else:
+                        self._write_chunks(filename, chunks, head=tmp or b"")
             except Exception as e:
                 print(f"Unable to write downloaded file: {basename}\nError: {str(e)}")
         else:
@@ -584,11 +771,10 @@ class ReportDownloadHTML:
         chain. Treating only the direct HEAD response as authoritative avoids
         false-positive version detection in those deployments.
         """
-        tmp = urllib.parse.urlsplit(self._url)
-        base = tmp.scheme + "://" + tmp.netloc + "/static/website/scripts/mathjax/"
+        base = self._server_url("/static/website/scripts/mathjax/")
         for version, sentinel in MATHJAX_VERSION_SENTINELS:
             try:
-                resp = requests.head(base + sentinel, allow_redirects=False, timeout=300)
+                resp = self._session.head(base + sentinel, allow_redirects=False, timeout=300)
                 if resp.status_code == requests.codes.ok:
                     return version
             except (requests.ConnectionError, requests.Timeout, requests.RequestException):
@@ -708,7 +894,7 @@ class ReportDownloadHTML:
         # Read the rendered report first so MathJax detection can follow the
         # loader the page actually uses instead of guessing from installation
         # layout alone.
-        resp = requests.get(self._url, timeout=300)
+        resp = self._session.get(self._url, timeout=300)
         if resp.status_code != requests.codes.ok:
             raise RuntimeError(f"Unable to access {self._url} ({resp.status_code})")
         self._report_html = resp.text
@@ -754,8 +940,26 @@ class ReportDownloadHTML:
         #    const tiff_promise_6ad0cc989c414473a4823bf42b2c4d92 = GeoTIFF.fromArrayBuffer(arrayBuffer);
         #    tiff_promise_6ad0cc989c414473a4823bf42b2c4d92.then( nexus_image_load_tiff_image.bind(null, "nexus_image_6ad0cc989c414473a4823bf42b2c4d92"), nexus_image_general_error);
         # }
-
+        #
+        # The report assets are fetched concurrently up front, then substituted
+        # serially in document order so that collision prefixes, data URI budget
+        # decisions and the resulting HTML do not depend on download timing.
         html = self._report_html
+        spool_dir = self._prefetch_files(html)
+        try:
+            html = self._rewrite_html(html)
+        finally:
+            self._prefetched = dict()
+            if spool_dir is not None:
+                shutil.rmtree(spool_dir, ignore_errors=True)
+
+        # save the results
+        with open(os.path.join(self._directory, self._filename), "wb") as f:
+            f.write(html.encode("utf8"))
+        if self._asset_cache is not None:
+            self._asset_cache.trim()
+
+    def _rewrite_html(self, html: str) -> str:
         html = self._replace_blocks(html, "<link", "/>")
         html = self._replace_blocks(html, "<img id='guiicon", ">")
         html = self._replace_blocks(html, "e.src = '", "';")
@@ -767,7 +971,56 @@ class ReportDownloadHTML:
         html = self._replace_blocks(html, "GLTFViewer", ");", inline=True)
         html = self._inline_ansys_viewer(html)
         html = self._replace_blocks(html, "await fetch(", ");", inline=True)
+        return html
 
-        # save the results
-        with open(os.path.join(self._directory, self._filename), "wb") as f:
-            f.write(html.encode("utf8"))
+    def _prefetch_files(self, html: str) -> str | None:
+        """Download the assets referenced by the report HTML concurrently.
+
+        A dry run of :meth:`_rewrite_html` collects the asset paths in document
+        order without touching the output.  Each asset is then streamed into a
+        spool directory under the export directory on a bounded pool.  Assets that
+        fail to prefetch are simply fetched again by the serial pass, which keeps
+        its error reporting unchanged.
+
+        Returns
+        -------
+        str or None
+            The spool directory to remove once the HTML has been rewritten, or
+            ``None`` when there was nothing to prefetch.
+        """
+        self._collected = dict()
+        try:
+            self._rewrite_html(html)
+        finally:
+            collected, self._collected = self._collected, None
+        self._replaced_file_ext = None
+        self._inline_size_exception = False
+        if not collected:
+            return None
+        spool_dir = tempfile.mkdtemp(prefix=".prefetch_", dir=self._directory)
+        jobs = [
+            (pathname, path_plus_queries, os.path.join(spool_dir, str(index)))
+            for index, (pathname, path_plus_queries) in enumerate(collected.items())
+        ]
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            results = list(executor.map(lambda job: self._prefetch_file(*job[1:]), jobs))
+        for (pathname, _, _), resp in zip(jobs, results):
+            if resp is not None:
+                self._prefetched[pathname] = resp
+        return spool_dir
+
+    def _prefetch_file(self, path_plus_queries: str, spool_name: str) -> _SpooledResponse | None:
+        try:
+            resp = self._session.get(
+                self._server_url(path_plus_queries), allow_redirects=True, stream=True, timeout=300
+            )
+            if resp.status_code != requests.codes.ok:
+                return _SpooledResponse(resp.status_code)
+            with open(spool_name, "wb") as f:
+                for chunk in resp.iter_content(chunk_size=CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+        except (OSError, requests.RequestException):
+            # leave it to the serial pass, which reports the failure
+            return None
+        return _SpooledResponse(resp.status_code, spool_name)
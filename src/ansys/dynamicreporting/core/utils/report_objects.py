@@ -46,7 +46,7 @@ import pytz
 from . import extremely_ugly_hacks, report_utils
 from ..common_utils import check_dictionary_for_html
 from ..exceptions import TemplateDoesNotExist, TemplateReorderOutOfBounds
-from .encoders import PayloaddataEncoder
+from .encoders import decode_binary_array, dumps, encode_binary_array, is_binary_array
 
 QtCore = None
 QtGui = None
@@ -61,6 +61,17 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Number of distinct strings whose HTML check result is remembered.
+HTML_CHECK_MEMO_SIZE = 65536
+# Number of table rows converted at a time by ItemREST.iter_payload_rows().
+TABLE_ROW_CHUNK_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=HTML_CHECK_MEMO_SIZE)
+def _contains_html(value):
+    # bleach is slow, and tables and trees repeat the same labels many times
+    return bleach.clean(value, strip=True) != value
+
 
 @functools.lru_cache(maxsize=1)
 def _load_qt():
@@ -902,6 +913,16 @@ class ItemREST(BaseRESTObject):
         self.width = 0
         self.height = 0
         self._payloaddata = None
+        # fetches the payload of an item read without it, see Server.get_objects(defer_payload)
+        self._payload_loader = None
+        # (payload, content) of the last readonly table read, see get_payload_content()
+        self._table_view = None
+        # wire format of table arrays: None for JSON lists or "binary" for base64 buffers.
+        # Set by the server before a push, from the features listed in its api_version.
+        self.table_encoding = None
+        # wire format of payloaddata: None for a JSON string or "object" to embed it in
+        # the request body, which is then encoded once. Set by the server like table_encoding.
+        self.payload_encoding = None
         # extra fields used by file I/O
         self.fileurl = None
         self.fileobj = None
@@ -910,8 +931,29 @@ class ItemREST(BaseRESTObject):
     @property
     def payloaddata(self):
         # NOTE: this param will be read-only from now on.
+        self._load_deferred_payload()
         return self._payloaddata
 
+    @property
+    def payload_deferred(self):
+        """True if the payload has not been fetched from the server yet."""
+        return self._payload_loader is not None
+
+    def set_payload_loader(self, loader):
+        """
+        Defer the payload of this item.
+
+        The loader is called with the item the first time the payload is accessed
+        and must return the payload data.
+        """
+        self._payload_loader = loader
+
+    def _load_deferred_payload(self):
+        loader = self._payload_loader
+        if loader is not None:
+            self._payload_loader = None
+            self._payloaddata = loader(self)
+
     def _validate_and_get_category(self, category):
         if category:
             if isinstance(category, str):
@@ -971,6 +1013,7 @@ class ItemREST(BaseRESTObject):
         # Before API 1.0, the encoding of the payload data may have used an older
         # scheme.
         if (self.server_api_version is not None) and (self.server_api_version < 1.0):
+            self._load_deferred_payload()
             # note: unpickling a numpy array requires numpy to be available or will fail.
             content = extremely_ugly_hacks.safe_unpickle(self._payloaddata, item_type=self.type)
             # for non-table objects, the unpickle is all that is needed.  newer servers
@@ -1005,10 +1048,22 @@ class ItemREST(BaseRESTObject):
                     pickle.dumps(data_dict["payloaddata"], protocol=0)
                 ).decode("utf-8")
             else:
-                # otherwise future versions use json dumps.
-                data_dict["payloaddata"] = json.dumps(
-                    data_dict["payloaddata"], cls=PayloaddataEncoder
-                )
+                # otherwise future versions use json dumps, or send the payload as is
+                # to be encoded once along with the request body.
+                payload = data_dict["payloaddata"]
+                if (
+                    self.table_encoding == "binary"
+                    and self.type == ItemREST.type_tbl
+                    and isinstance(payload, dict)
+                ):
+                    # send the array as a raw buffer instead of nested float lists
+                    encoded = encode_binary_array(payload.get("array"))
+                    if encoded is not None:
+                        payload = {**payload, "array": encoded}
+                if self.payload_encoding == "object":
+                    data_dict["payloaddata"] = payload
+                else:
+                    data_dict["payloaddata"] = dumps(payload)
 
         return detail_url, data_dict
 
@@ -1024,14 +1079,26 @@ class ItemREST(BaseRESTObject):
         # which can later be loaded on demand using get_payload_content(),
         # just as before.
         # for newer servers, this will give the actual payload
+        self._payload_loader = None
         self._payloaddata = json_dict.pop("payloaddata", None)
         # base call
         super().from_json(json_dict)
 
-    def get_payload_content(self, as_list=False):
+    def get_payload_content(self, as_list=False, readonly=False):
+        """
+        Get the payload of the item.
+
+        With ``readonly=True``, the array of a table payload is returned as a read-only
+        view of the stored numpy array instead of a new array. Arrays received as lists
+        are converted once and cached apart from the payload, so that later readonly
+        reads are views too. ``as_list`` takes precedence, as lists are always new
+        objects.
+        """
+        if readonly and not as_list and has_numpy and self.type == ItemREST.type_tbl:
+            return self._get_table_view()
         # if you dont copy.copy, it'll modify the array in the original variable
         # which we dont want.
-        ret = copy.copy(self._payloaddata)
+        ret = copy.copy(self.payloaddata)
         # for response from older servers
         # has to expect a pickled string
         if (self.server_api_version is not None) and (self.server_api_version < 1.0):
@@ -1046,6 +1113,14 @@ class ItemREST(BaseRESTObject):
             if isinstance(ret, dict):
                 # now get the actual array.
                 array = ret.get("array")
+                if is_binary_array(array):
+                    # table sent as a raw buffer, see encode_binary_array()
+                    array = decode_binary_array(array)
+                    ret["array"] = array
+                    if has_numpy:
+                        ret.update(
+                            {"shape": array.shape, "size": array.size, "dtype": str(array.dtype)}
+                        )
                 if array is not None:
                     # if its a nexus_array, the flag as_list is always assumed to be true
                     # because the user never knows there's a nexus_array yet and always
@@ -1087,6 +1162,55 @@ class ItemREST(BaseRESTObject):
 
         return ret
 
+    def _get_table_view(self):
+        payload = self.payloaddata
+        if self._table_view is not None and self._table_view[0] is payload:
+            ret = dict(self._table_view[1])
+        else:
+            ret = self.get_payload_content()
+            array = ret.get("array") if isinstance(ret, dict) else None
+            if not isinstance(array, numpy.ndarray):
+                return ret
+            # valid as long as the payload is not replaced
+            self._table_view = (payload, dict(ret))
+        view = ret["array"].view()
+        view.flags.writeable = False
+        ret["array"] = view
+        return ret
+
+    def iter_payload_rows(self, chunk_size=TABLE_ROW_CHUNK_SIZE):
+        """
+        Iterate lazily over the rows of a table payload, as lists.
+
+        The rows are converted ``chunk_size`` at a time, so scanning a large table does
+        not build a list of the whole array like ``get_payload_content(as_list=True)``.
+        """
+        if self.type != ItemREST.type_tbl:
+            raise ValueError("Payload rows are only available for table items.")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+        payload = self.payloaddata
+        if (self.server_api_version is not None) and (self.server_api_version < 1.0):
+            payload = extremely_ugly_hacks.safe_unpickle(payload, item_type=self.type)
+        array = payload.get("array") if isinstance(payload, dict) else None
+        if is_binary_array(array):
+            array = decode_binary_array(array)
+        return self._iter_rows(array, chunk_size)
+
+    @staticmethod
+    def _iter_rows(array, chunk_size):
+        if array is None:
+            return
+        if isinstance(array, report_utils.nexus_array):
+            for start in range(0, array.shape[0], chunk_size):
+                yield from array.get_rows(start, start + chunk_size)
+        elif has_numpy and isinstance(array, numpy.ndarray):
+            for start in range(0, len(array), chunk_size):
+                yield from array[start : start + chunk_size].tolist()
+        else:
+            # rows received as lists
+            yield from array
+
     def get_url_file(self):
         if self.fileurl and self.fileobj:
             url = "/item/api_payload/" + self.guid
@@ -1119,6 +1243,7 @@ class ItemREST(BaseRESTObject):
 
     def set_payload_none(self):
         self.type = ItemREST.type_none
+        self._payload_loader = None
         self._payloaddata = ""
 
     @staticmethod
@@ -1132,19 +1257,42 @@ class ItemREST(BaseRESTObject):
             raise ValueError(f"Payload {description} must be a valid UTF-8 string.")
 
         if os.getenv("ADR_VALIDATION_BETAFLAG_ANSYS") == "1":
-            if sanitize_html:
-                cleaned_string = bleach.clean(input_string, strip=True)
-                if cleaned_string != input_string:
-                    raise ValueError(f"Payload {description} contains HTML content.")
+            if sanitize_html and _contains_html(input_string):
+                raise ValueError(f"Payload {description} contains HTML content.")
+
+    @classmethod
+    def validate_table_strings(cls, array):
+        """
+        Validate the cells of a byte-string table array as UTF-8 text without HTML.
+
+        Only done when ``ADR_VALIDATION_BETAFLAG_ANSYS`` is set, other tables are pushed
+        as is. Each distinct cell value is decoded and validated once, so the cost grows
+        with the number of distinct values rather than with the number of cells.
+        """
+        if os.getenv("ADR_VALIDATION_BETAFLAG_ANSYS") != "1":
+            return
+        if has_numpy and isinstance(array, numpy.ndarray):
+            cells = numpy.unique(array)
+        else:
+            # nexus_array: a flat index walks the cells in storage order
+            cells = {array[i] for i in range(array.count())}
+        for cell in cells:
+            try:
+                text = bytes(cell).decode("utf-8")
+            except UnicodeDecodeError:
+                raise ValueError("Payload Table array element must be a valid UTF-8 string.")
+            cls.validate_string(text, "Table array element", sanitize_html=True)
 
     def set_payload_string(self, s):
         self.validate_string(s, "string")
         self.type = ItemREST.type_str
+        self._payload_loader = None
         self._payloaddata = s
 
     def set_payload_html(self, s):
         self.validate_string(s, "HTML")
         self.type = ItemREST.type_html
+        self._payload_loader = None
         self._payloaddata = s
 
     @staticmethod
@@ -1207,6 +1355,7 @@ class ItemREST(BaseRESTObject):
     def set_payload_tree(self, t):
         self.validate_tree(t)
         self.type = ItemREST.type_tree
+        self._payload_loader = None
         self._payloaddata = t
 
     def set_payload_table(self, table_input):
@@ -1241,6 +1390,7 @@ class ItemREST(BaseRESTObject):
         if payloaddata is not None:
             validated_payload = self.validate_and_clean_table(payloaddata)
             self.type = ItemREST.type_tbl
+            self._payload_loader = None
             self._payloaddata = validated_payload
         else:
             raise TypeError("The input value must be a dictionary or None")
@@ -1294,10 +1444,7 @@ class ItemREST(BaseRESTObject):
             raise ValueError("Table array must be a bytes or float type.")
 
         if kind == "S":  # Check if the array contains strings
-            for i in range(array.shape[0]):
-                for j in range(array.shape[1]):
-                    if isinstance(array[i, j], str):
-                        self.validate_string(array[i, j], "Table array element", sanitize_html=True)
+            self.validate_table_strings(array)
 
         shape = array.shape
         size = array.size
@@ -1344,6 +1491,7 @@ class ItemREST(BaseRESTObject):
         return value
 
     def set_payload_image(self, img):
+        self._payload_loader = None
         if _load_qt():  # pragma: no cover
             if isinstance(img, QtGui.QImage):
                 tmpimg = img
@@ -1458,6 +1606,7 @@ class ItemREST(BaseRESTObject):
         # filename is required to be UTF8, but the low-level I/O may not take UTF-8
         self.validate_file(mp4_filename, "animation file", ["mp4"])
         self.type = ItemREST.type_anim
+        self._payload_loader = None
         self.fileobj = open(mp4_filename, "rb")
         self.fileurl = mp4_filename
 
@@ -1465,6 +1614,7 @@ class ItemREST(BaseRESTObject):
         # filename is required to be UTF8, but the low-level I/O may not take UTF-8
         self.validate_file(filename, "file")
         self.type = ItemREST.type_file
+        self._payload_loader = None
         self.fileobj = open(filename, "rb")
         self.fileurl = filename
 
@@ -1476,6 +1626,7 @@ class ItemREST(BaseRESTObject):
             ["stl", "ply", "csf", "avz", "scdoc", "scdocx", "dsco", "glb", "obj"],
         )
         self.type = ItemREST.type_scn
+        self._payload_loader = None
         self.fileobj = open(filename, "rb")
         self.fileurl = filename
 
@@ -21,11 +21,14 @@
 # SOFTWARE.
 
 import collections
+import concurrent.futures
 import configparser
 import functools
+import gzip
 import hashlib
 from http.cookiejar import Cookie
 import inspect
+import io
 import json
 import logging
 import os
@@ -37,10 +40,12 @@ import shutil
 import subprocess  # nosec B78 B603 B404
 import sys
 import tempfile
+import threading
 import time
 import urllib
-from urllib.parse import urlparse
+from urllib.parse import quote, urlparse
 import uuid
+import zlib
 
 import requests
 from requests import JSONDecodeError
@@ -54,7 +59,11 @@ from ..compatibility import DEFAULT_ANSYS_INSTALL_VERSION
 from ..constants import JSON_ATTR_KEYS
 from ..exceptions import ADRException, InvalidAnsysPath
 from . import exceptions, filelock, report_objects, report_utils
-from .encoders import BaseEncoder
+from .asset_cache import DEFAULT_MAX_BYTES, AssetCache
+from .encoders import dumps
+from .http_cache import ResponseCache
+from .multipart import DEFAULT_CHUNK_SIZE, MultipartFileEncoder
+from .push_queue import PushQueue
 
 QtCore = None
 QtGui = None
@@ -147,6 +156,87 @@ def run_nexus_utility(args, use_software_gl=False, exec_basis=None, ansys_versio
     subprocess.call(args=cmd, **params)  # nosec B603 B78
 
 
+class _ResponseFile(io.RawIOBase):
+    """
+    Forward-only, read-only file object over the body of a streamed response.
+
+    Used to pipe a file downloaded from one server straight into the upload to another
+    server without going through the disk. The size of the body is exposed as ``len``
+    so the upload can set its Content-Length.
+    """
+
+    def __init__(self, response, length, chunk_size):
+        super().__init__()
+        self._response = response
+        self._chunks = response.iter_content(chunk_size)
+        self._buffer = b""
+        self._pos = 0
+        self.len = length
+
+    def readable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        # only "seeking" to the current position is possible
+        if (whence == io.SEEK_SET and offset == self._pos) or (
+            whence == io.SEEK_CUR and offset == 0
+        ):
+            return self._pos
+        raise io.UnsupportedOperation("The response stream can only be read forward.")
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            data = self._buffer + b"".join(self._chunks)
+            self._buffer = b""
+        else:
+            while len(self._buffer) < size:
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    break
+                self._buffer += chunk
+            data = self._buffer[:size]
+            self._buffer = self._buffer[size:]
+        self._pos += len(data)
+        return data
+
+    def close(self):
+        self._response.close()
+        super().close()
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter applying a default timeout to the requests that do not set one.
+
+    Streamed bodies that cannot be rewound are sent through ``stream_adapter``, if
+    set, whose retry policy must not send them again.
+    """
+
+    def __init__(self, *args, timeout=None, stream_adapter=None, **kwargs):
+        self.timeout = timeout
+        self.stream_adapter = stream_adapter
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        if (
+            self.stream_adapter is not None
+            and isinstance(request.body, MultipartFileEncoder)
+            and not request.body.rewindable
+        ):
+            return self.stream_adapter.send(request, **kwargs)
+        return super().send(request, **kwargs)
+
+    def close(self):
+        super().close()
+        if self.stream_adapter is not None:
+            self.stream_adapter.close()
+
+
 class Server:
     """
     Report Server interface.
@@ -154,7 +244,52 @@ class Server:
     Implements REST protocols.
     """
 
-    def __init__(self, url=None, username=None, password=None, ansys_version=None):
+    # endpoint accepting multi-object pushes, advertised as 'bulk_push' in api_version
+    BULK_PUSH_URL = "/api/bulk-push/"
+    DEFAULT_BULK_BATCH_SIZE = 500
+    DEFAULT_PAGE_SIZE = 1000
+    # number of GUIDs resolved by a single query in get_objects_by_guids()
+    GUID_QUERY_CHUNK_SIZE = 100
+    # characters that delimit the fields of a query and cannot appear in its values
+    QUERY_RESERVED_CHARS = frozenset(",;|")
+    # chunk sizes used to stream file payloads to and from the server
+    UPLOAD_CHUNK_SIZE = DEFAULT_CHUNK_SIZE
+    DOWNLOAD_CHUNK_SIZE = DEFAULT_CHUNK_SIZE
+    # defaults of the HTTP connection pool and retry policy, see __init__()
+    DEFAULT_POOL_CONNECTIONS = 10
+    DEFAULT_POOL_MAXSIZE = 10
+    DEFAULT_MAX_RETRIES = 3
+    DEFAULT_BACKOFF_FACTOR = 0.5
+    # (connect, read) timeouts in seconds, None lets long exports and uploads take as long
+    # as they need
+    DEFAULT_TIMEOUT = None
+    # request body encodings, used if the server lists them in 'request_encodings'
+    REQUEST_ENCODINGS = ("gzip", "deflate")
+    # smaller bodies are not worth compressing
+    COMPRESSION_MIN_SIZE = 1024
+    COMPRESSION_LEVEL = 6
+    # transient overload responses worth retrying, honoring their Retry-After header
+    RETRY_STATUS_CODES = (
+        requests.codes.too_many_requests,
+        requests.codes.bad_gateway,
+        requests.codes.service_unavailable,
+    )
+
+    def __init__(
+        self,
+        url=None,
+        username=None,
+        password=None,
+        ansys_version=None,
+        cache_size=0,
+        cache_ttl=30.0,
+        pool_connections=None,
+        pool_maxsize=None,
+        max_retries=None,
+        backoff_factor=None,
+        timeout=DEFAULT_TIMEOUT,
+        compression=None,
+    ):
         # Check on the validity of url formatting
         if url is not None:
             o = urlparse(url)
@@ -176,29 +311,253 @@ class Server:
         self._last_error = ""
         # track the target server's version
         self._api_version = None
+        # the full api_version response, used to detect optional server features
+        self._api_info = None
 
         self._magic_token = None
+        self.set_compression(compression)
+        # background write-behind queue, see enqueue()
+        self._push_queue = None
+        # digests of the last successful push of each object, see put_objects()
+        self.push_digests = {}
+        # pushes and deletes may run on worker threads, see put_objects(max_workers)
+        self._push_digests_lock = threading.Lock()
 
         # Keep an http session around for caching and retries
-        self._http_session = self._create_http_session()
+        self._http_session = None
+        self.configure_http(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            timeout=timeout,
+        )
+        # optional cache of GET responses, see enable_cache()
+        self._response_cache = None
+        if cache_size:
+            self.enable_cache(max_entries=cache_size, ttl=cache_ttl)
+        # optional on-disk cache of HTML export static assets, see enable_asset_cache()
+        self._asset_cache = None
+
+    def _create_http_session(self) -> requests.Session:
+        """
+        Create a requests session configured with ADR's pooling and retry policy.
 
-    @staticmethod
-    def _create_http_session() -> requests.Session:
-        """Create a requests session configured with ADR's retry policy."""
+        Connection errors are retried, as well as idempotent requests failing on a read
+        error or a transient overload status (429, 502 and 503). Retries back off
+        exponentially and wait for the Retry-After delay requested by the server. Once
+        the retries are exhausted, the last response is returned as is.
+        """
         session = requests.Session()
-        retry_strategy = Retry(connect=3, backoff_factor=0.5)
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # list responses compress very well, make sure we ask for it
+        session.headers["Accept-Encoding"] = "gzip, deflate"
+        retry_strategy = Retry(
+            connect=self.max_retries,
+            read=self.max_retries,
+            status=self.max_retries,
+            status_forcelist=self.RETRY_STATUS_CODES,
+            backoff_factor=self.backoff_factor,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        # a streamed body can only be sent once: only retry connection errors, which
+        # happen before it is read, and return any other failure as is
+        stream_adapter = _TimeoutHTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry_strategy.new(read=0, status=0, other=0),
+            timeout=self.timeout,
+        )
+        adapter = _TimeoutHTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry_strategy,
+            timeout=self.timeout,
+            stream_adapter=stream_adapter,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         return session
 
+    def configure_http(
+        self,
+        pool_connections=None,
+        pool_maxsize=None,
+        max_retries=None,
+        backoff_factor=None,
+        timeout=DEFAULT_TIMEOUT,
+    ):
+        """
+        Change the connection pool, retry policy and default timeout of the server.
+
+        Parameters
+        ----------
+        pool_connections : int, optional
+            Number of hosts whose connections are pooled.
+        pool_maxsize : int, optional
+            Maximum number of connections kept per host. When pushing with
+            ``max_workers``, make it at least as large as the number of workers.
+        max_retries : int, optional
+            Number of retries of connection errors, read errors of idempotent requests
+            and 429/502/503 responses.
+        backoff_factor : float, optional
+            Factor of the exponential delay between retries.
+        timeout : float or tuple, optional
+            Default (connect, read) timeout in seconds of the requests that do not set
+            one, for instance ``(10, 300)``. The default, ``None``, waits forever.
+
+        Unset arguments revert to the ``Server.DEFAULT_*`` values. The HTTP session,
+        along with its cookies, is replaced.
+        """
+        self.pool_connections = (
+            self.DEFAULT_POOL_CONNECTIONS if pool_connections is None else pool_connections
+        )
+        self.pool_maxsize = self.DEFAULT_POOL_MAXSIZE if pool_maxsize is None else pool_maxsize
+        self.max_retries = self.DEFAULT_MAX_RETRIES if max_retries is None else max_retries
+        self.backoff_factor = (
+            self.DEFAULT_BACKOFF_FACTOR if backoff_factor is None else backoff_factor
+        )
+        self.timeout = timeout
+        old_session = self._http_session
+        self._http_session = self._create_http_session()
+        if old_session is not None:
+            old_session.close()
+
+    def set_compression(self, compression):
+        """
+        Set the encoding used to compress the bodies of push requests.
+
+        Parameters
+        ----------
+        compression : str or None
+            ``"gzip"``, ``"deflate"`` or ``None`` to send uncompressed bodies. The bodies
+            are only compressed if the server lists the encoding in the
+            'request_encodings' of its api_version, and are otherwise sent as is.
+        """
+        if compression is not None and compression not in self.REQUEST_ENCODINGS:
+            raise ValueError(
+                f"Unsupported compression '{compression}'. "
+                f"Use one of {', '.join(self.REQUEST_ENCODINGS)} or None."
+            )
+        self.compression = compression
+
+    def _get_request_encoding(self):
+        """Return the encoding to compress request bodies with, or None."""
+        if self.compression is None:
+            return None
+        if self._api_info is None:
+            self.validate()
+        if self.compression in self._api_info.get("request_encodings", ()):
+            return self.compression
+        return None
+
+    @classmethod
+    def _compress_body(cls, data, encoding):
+        if encoding == "gzip":
+            return gzip.compress(data, compresslevel=cls.COMPRESSION_LEVEL, mtime=0)
+        # the HTTP 'deflate' coding is the zlib format
+        return zlib.compress(data, cls.COMPRESSION_LEVEL)
+
+    def _get_table_encoding(self):
+        """Return the wire format of table arrays: "binary" if the server accepts it, or None."""
+        if self.api_version < 1 or not self._has_server_feature("binary_tables"):
+            return None
+        return "binary"
+
+    def _get_payload_encoding(self):
+        """
+        Return the wire format of item payloads: "object" if the server accepts them
+        embedded in the request body, or None to send them as JSON strings.
+        """
+        if self.api_version < 1 or not self._has_server_feature("payload_objects"):
+            return None
+        return "object"
+
+    def enable_cache(self, max_entries=256, ttl=30.0):
+        """
+        Cache the object list and detail responses of the server in this process.
+
+        Responses are kept for ``ttl`` seconds and then revalidated with conditional
+        requests (If-None-Match/If-Modified-Since). Up to ``max_entries`` responses are
+        kept, evicting the least recently used ones. Pushing or deleting objects through
+        this server invalidates the cached responses of their type.
+        """
+        self._response_cache = ResponseCache(max_entries=max_entries, ttl=ttl)
+
+    def disable_cache(self):
+        self._response_cache = None
+
+    def enable_asset_cache(self, directory=None, max_bytes=DEFAULT_MAX_BYTES, link=True):
+        """
+        Reuse the static files of HTML exports across exports and processes.
+
+        MathJax, threejs, draco, the fonts and the viewer bundle are stored in a
+        content-addressed cache keyed by Ansys version and asset path, and are linked
+        or copied into later exports instead of being downloaded again. See
+        :class:`~ansys.dynamicreporting.core.utils.asset_cache.AssetCache`.
+
+        Returns
+        -------
+        AssetCache
+            The cache used by this server.
+        """
+        self._asset_cache = AssetCache(directory=directory, max_bytes=max_bytes, link=link)
+        return self._asset_cache
+
+    def disable_asset_cache(self):
+        self._asset_cache = None
+
+    def _cached_get(self, uri, auth):
+        """GET uri, going through the response cache if it is enabled."""
+        cache = self._response_cache
+        if cache is None:
+            return self._http_session.get(uri, auth=auth)
+        key = (uri, self.get_username())
+        entry = cache.get(key)
+        if entry is not None and cache.is_fresh(entry):
+            return entry.response
+        # a push or delete finishing while the request is in flight discards its response
+        generation = cache.generation
+        if entry is None:
+            r = self._http_session.get(uri, auth=auth)
+        else:
+            r = self._http_session.get(uri, auth=auth, headers=cache.revalidation_headers(entry))
+            if r.status_code == requests.codes.not_modified:
+                cache.touch(entry)
+                return entry.response
+        if r.status_code == requests.codes.ok:
+            cache.put(key, r, generation)
+        return r
+
+    def _invalidate_cached(self, obj, cascade=False):
+        """
+        Drop the cached responses affected by a change to obj.
+
+        Called both before and after the request changing obj, so that responses
+        fetched while it is in flight are not served once it has completed.
+        """
+        cache = self._response_cache
+        if cache is None:
+            return
+        # deleting sessions and datasets also deletes the items referring to them
+        if cascade and isinstance(obj, (report_objects.SessionREST, report_objects.DatasetREST)):
+            cache.invalidate()
+        else:
+            cache.invalidate(f"/{obj.get_url_base_name()}/")
+
     @property
     def api_version(self):
         """Read only version var."""
         if self._api_version is None:
-            self._api_version = float(self.get_api_version()["version"])
+            self.validate()
         return self._api_version
 
+    def _has_server_feature(self, feature):
+        """Check if the server advertises an optional REST feature in its api_version."""
+        if self._api_info is None:
+            self.validate()
+        return bool(self._api_info.get(feature, False))
+
     @property
     def acls_enabled(self):
         """Read only var to check if server has acls turned ON."""
@@ -267,6 +626,10 @@ class Server:
             return
         self.cur_url = url
         self.cur_servername = None
+        self._api_info = None
+        # the digests describe the content of the previous server
+        with self._push_digests_lock:
+            self.push_digests.clear()
 
     def get_URL(self):
         return self.cur_url
@@ -330,6 +693,7 @@ class Server:
         server_info = self.get_api_version()
         if "server_name" in server_info:
             self.cur_servername = server_info["server_name"]
+        self._api_info = server_info
         self._api_version = float(server_info["version"])
         return self._api_version
 
@@ -402,7 +766,7 @@ class Server:
             tmp = query.strip("\"'").replace("|", "%7C").replace(";", "%3B").replace("#", "%23")
             uri = self.add_query_to_url(uri, f"query={tmp}")
         auth = self.get_auth()
-        r = self._http_session.get(uri, auth=auth)
+        r = self._cached_get(uri, auth)
         if r.status_code != requests.codes.ok:
             return []
         try:
@@ -414,42 +778,259 @@ class Server:
             logger.debug(f"Warning: {str(e)}")
             return []
 
-    def get_objects(self, objtype=report_objects.Template, query=None):
-        if not self.valid_database():
-            return []
+    @staticmethod
+    def _get_objtype_class(objtype):
         if inspect.ismethod(objtype):
-            obj_uri = getattr(
+            return getattr(
                 inspect.getmodule(objtype),
                 objtype.__qualname__.split(".<locals>", 1)[0].rsplit(".", 1)[0],
-            ).get_list_url()
-        else:
-            obj_uri = objtype.get_list_url()
-        uri = self.build_request_url(obj_uri)
+            )
+        return objtype
+
+    def _get_list_uri(self, objtype, query=None, fields=None):
+        uri = self.build_request_url(self._get_objtype_class(objtype).get_list_url())
+        # only ask for a subset of the fields if the server knows how to select them
+        if fields and ("/api/" in uri or self._has_server_feature("field_selection")):
+            uri = self.add_query_to_url(uri, "fields=" + ",".join(fields))
         # treat None and "" as having no query specified
         if query:
             # translate raw queries into URL savvy text
             tmp = query.strip("\"'").replace("|", "%7C").replace(";", "%3B").replace("#", "%23")
             uri = self.add_query_to_url(uri, f"query={tmp}")
+        return uri
+
+    def _build_object(self, objtype, data, defer_payload=False):
+        if inspect.ismethod(objtype):
+            t = objtype(data)
+        else:
+            t = objtype()
+        t.server_api_version = self.api_version
+        deferred = defer_payload and "payloaddata" not in data
+        t.from_json(data)
+        if deferred and isinstance(t, report_objects.ItemREST):
+            t.set_payload_loader(self._fetch_item_payload)
+        return t
+
+    def _get_projection(self, objtype, fields, defer_payload):
+        """Return the list of fields to request, or None to request all of them."""
+        if not fields and not defer_payload:
+            return None
+        obj_cls = self._get_objtype_class(objtype)
+        fields = list(fields or obj_cls.get_json_keys())
+        # the guid is needed to identify the object (and to fetch its payload later)
+        if "guid" not in fields:
+            fields.insert(0, "guid")
+        if defer_payload:
+            fields = [f for f in fields if f != "payloaddata"]
+        return fields
+
+    def _fetch_item_payload(self, item):
+        """Fetch the payload of an item that was listed without it."""
+        obj = self.get_object_from_guid(item.guid, objtype=report_objects.ItemREST)
+        if obj is None:
+            return None
+        return obj.payloaddata
+
+    def get_objects(
+        self, objtype=report_objects.Template, query=None, fields=None, defer_payload=False
+    ):
+        """
+        Get the objects matching a query.
+
+        Parameters
+        ----------
+        objtype : type, optional
+            The class of the objects to query.
+        query : str, optional
+            ADR query string used to filter the objects.
+        fields : list of str, optional
+            Names of the fields to fetch from the server. The GUID is always included and
+            attributes that are not fetched keep their default values. By default, all
+            fields are fetched. This requires a server supporting field selection and is
+            otherwise ignored.
+        defer_payload : bool, optional
+            If True, the payload of items is not transferred with the list. Instead, it is
+            fetched from the server the first time it is accessed on each item. This makes
+            listing the names, tags or dates of a large set of items much cheaper.
 
+        Returns
+        -------
+        list
+            The matching objects.
+        """
+        if not self.valid_database():
+            return []
+        projection = self._get_projection(objtype, fields, defer_payload)
+        uri = self._get_list_uri(objtype, query, fields=projection)
         auth = self.get_auth()
-        r = self._http_session.get(uri, auth=auth)
+        r = self._cached_get(uri, auth)
         if r.status_code != requests.codes.ok:
             return []
         try:
-            ret = []
-            for d in r.json():
-                if inspect.ismethod(objtype):
-                    t = objtype(d)
-                else:
-                    t = objtype()
-                t.server_api_version = self.api_version
-                t.from_json(d)
-                ret.append(t)
-            return ret
+            return [self._build_object(objtype, d, defer_payload=defer_payload) for d in r.json()]
         except Exception as e:
             logger.debug(f"Warning: {str(e)}")
             return []
 
+    def iter_objects(
+        self,
+        objtype=report_objects.Template,
+        query=None,
+        page_size=None,
+        fields=None,
+        defer_payload=False,
+    ):
+        """
+        Iterate lazily over the objects matching a query.
+
+        Unlike ``get_objects()``, the objects are requested from the server one page at a
+        time and each page is decoded and turned into objects only when the iteration
+        reaches it, so only a single page is held in memory. Servers that do not advertise
+        'pagination' in their api_version return all of the objects in one response, but
+        the objects are still built one at a time.
+
+        Parameters
+        ----------
+        objtype : type, optional
+            The class of the objects to query.
+        query : str, optional
+            ADR query string used to filter the objects.
+        page_size : int, optional
+            Number of objects requested per page. Defaults to ``Server.DEFAULT_PAGE_SIZE``.
+        fields : list of str, optional
+            Names of the fields to fetch, see ``get_objects()``.
+        defer_payload : bool, optional
+            If True, item payloads are fetched on first access, see ``get_objects()``.
+
+        Returns
+        -------
+        iterator
+            An iterator over the matching objects.
+        """
+        if page_size is None:
+            page_size = self.DEFAULT_PAGE_SIZE
+        if page_size < 1:
+            raise ValueError("The page size must be a positive integer.")
+        if not self.valid_database():
+            return iter(())
+        projection = self._get_projection(objtype, fields, defer_payload)
+        return self._iter_object_pages(objtype, query, page_size, projection, defer_payload)
+
+    def _iter_object_pages(self, objtype, query, page_size, projection, defer_payload):
+        uri = self._get_list_uri(objtype, query, fields=projection)
+        auth = self.get_auth()
+        paginate = self._has_server_feature("pagination")
+        offset = 0
+        while True:
+            page_uri = uri
+            if paginate:
+                page_uri = self.add_query_to_url(uri, f"limit={page_size}&offset={offset}")
+            r = self._cached_get(page_uri, auth)
+            if r.status_code != requests.codes.ok:
+                return
+            try:
+                page = r.json()
+            except Exception as e:
+                logger.debug(f"Warning: {str(e)}")
+                return
+            # paginated responses may wrap the objects with the pagination details
+            results = page.get("results", []) if isinstance(page, dict) else page
+            for d in results:
+                try:
+                    obj = self._build_object(objtype, d, defer_payload=defer_payload)
+                except Exception as e:
+                    logger.debug(f"Warning: {str(e)}")
+                    return
+                yield obj
+            if not paginate or len(results) < page_size:
+                return
+            if isinstance(page, dict) and not page.get("next"):
+                return
+            offset += len(results)
+
+    @classmethod
+    def _get_query_prefix(cls, objtype):
+        # prefix of the object fields in ADR query strings
+        obj_cls = cls._get_objtype_class(objtype)
+        for rest_cls, prefix in (
+            (report_objects.ItemREST, "i_"),
+            (report_objects.SessionREST, "s_"),
+            (report_objects.DatasetREST, "d_"),
+            (report_objects.TemplateREST, "t_"),
+        ):
+            if issubclass(obj_cls, rest_cls):
+                return prefix
+        raise ValueError(f"Objects of type {obj_cls.__name__} cannot be queried by GUID.")
+
+    def get_objects_by_guids(self, guids, objtype=report_objects.TemplateREST):
+        """
+        Get many objects from their GUIDs using a few list queries.
+
+        The GUIDs are resolved ``Server.GUID_QUERY_CHUNK_SIZE`` at a time with a single
+        query each, instead of one request per GUID as with ``get_object_from_guid()``.
+
+        Parameters
+        ----------
+        guids : iterable of str
+            The GUIDs of the objects to get.
+        objtype : type, optional
+            The class of the objects: items, sessions, datasets or templates.
+
+        Returns
+        -------
+        list
+            The objects found, in the order of their GUIDs. GUIDs that do not match
+            any object are skipped.
+        """
+        prefix = self._get_query_prefix(objtype)
+        guids = list(dict.fromkeys(str(g) for g in guids if g))
+        found = {}
+        for start in range(0, len(guids), self.GUID_QUERY_CHUNK_SIZE):
+            chunk = guids[start : start + self.GUID_QUERY_CHUNK_SIZE]
+            query = f"A|{prefix}guid|eq|{','.join(chunk)};"
+            for obj in self.get_objects(objtype=objtype, query=query):
+                found[str(obj.guid).lower()] = obj
+        return [found[g.lower()] for g in guids if g.lower() in found]
+
+    def get_templates_by_name(self, name, root_only=False, startswith=False):
+        """
+        Get the templates with a given name using a server-side name query.
+
+        Parameters
+        ----------
+        name : str
+            The name of the templates.
+        root_only : bool, optional
+            Only return the top level templates.
+        startswith : bool, optional
+            Return the templates whose name starts with ``name`` instead of the
+            ones matching it exactly.
+
+        Returns
+        -------
+        list
+            The matching templates, in the order returned by the server.
+        """
+        name = str(name)
+        if self.QUERY_RESERVED_CHARS.intersection(name):
+            # the name cannot be expressed in a query, filter the full list locally
+            templates = self.get_objects(objtype=report_objects.TemplateREST)
+        else:
+            op = "cont" if startswith else "eq"
+            # percent-encode the name so that '&', '+', '%' or '=' survive the URL
+            value = quote(name, safe="")
+            templates = self.get_objects(
+                objtype=report_objects.TemplateREST, query=f"A|t_name|{op}|{value};"
+            )
+        # the query comparisons may be looser than the requested match
+        if startswith:
+            templates = [t for t in templates if t.name.startswith(name)]
+        else:
+            templates = [t for t in templates if t.name == name]
+        if root_only:
+            templates = [t for t in templates if t.parent is None]
+        return templates
+
     def get_object_from_guid(self, guid, objtype=report_objects.TemplateREST):
         if not self.valid_database():
             return None
@@ -458,7 +1039,7 @@ class Server:
         obj_uri = obj.get_detail_url()
         uri = self.build_request_url(obj_uri)
         auth = self.get_auth()
-        r = self._http_session.get(uri, auth=auth)
+        r = self._cached_get(uri, auth)
         if r.status_code != requests.codes.ok:
             if r.status_code == requests.codes.forbidden:
                 raise exceptions.PermissionDenied(
@@ -476,7 +1057,7 @@ class Server:
             logger.debug(f"Warning: {str(e)}")
             return None
 
-    def _get_push_request_info(self, obj):
+    def _get_push_request_spec(self, obj):
         """
         So we have been using PUT requests for both POST and PUT operations, which is
         wrong and an anti-pattern.
@@ -485,7 +1066,8 @@ class Server:
         we are moving towards doing the right thing beginning with
         ItemCategoryREST objects. We introduce a flag `saved` in the baseREST
         obj which will be used to identify if an obj we have was already
-        saved/pushed or not. Based on this check, we return the right request.<method>
+        saved/pushed or not. Based on this check, we return the name of the HTTP method
+        along with the relative object URI and its data.
         :param obj:
         :return:
         """
@@ -494,37 +1076,123 @@ class Server:
             # not match, convert them (if possible)
             if (obj.server_api_version is not None) and (obj.server_api_version < self.api_version):
                 obj.update_api_version(self.api_version)
+        if (
+            isinstance(obj, report_objects.ItemREST)
+            and obj.type == report_objects.ItemREST.type_tbl
+        ):
+            # raw array buffers are much smaller and faster than nested JSON lists
+            obj.table_encoding = self._get_table_encoding()
+        if isinstance(obj, report_objects.ItemREST):
+            # avoid encoding the payload into a string that is then encoded again
+            obj.payload_encoding = self._get_payload_encoding()
 
         obj_uri, obj_data = obj.get_url_data()
-        uri = self.build_request_url(obj_uri)
-        new_api = "/api/" in uri
+        new_api = "/api/" in obj_uri
         if new_api:
             # in future, this will be applicable to all REST APIs
             if obj.saved:
                 # if it was already saved, it should be an update.
-                method = self._http_session.put
+                method = "put"
             else:
-                method = self._http_session.post
+                method = "post"
         else:
             # to maintain backwards compat with existing/old REST APIs
-            method = self._http_session.put
+            method = "put"
 
-        return method, uri, obj_data
+        return method, obj_uri, obj_data
 
-    def put_objects(self, in_objects):
-        if not self.valid_database():
-            return requests.codes.service_unavailable
-        objects = in_objects
-        if not isinstance(in_objects, collections.abc.Iterable):
-            objects = [in_objects]
-        # Pre-screen the object list.  If any of the objects reference the
-        # current session or dataset and they have not yet been pushed or
-        # have changed from the last time they were pushed, push them first...
+    def _get_push_request_info(self, obj):
+        """Return the session request.<method>, the full URI and the data to push obj."""
+        method, obj_uri, obj_data = self._get_push_request_spec(obj)
+        return getattr(self._http_session, method), self.build_request_url(obj_uri), obj_data
+
+    def _encode_push_body(self, obj_data):
+        """Encode the body of a push request, returning the data and the request headers."""
+        # the new way of json dumping before push might break older APIs so we
+        # fall back to the older way.
+        if self.api_version < 1:
+            return obj_data, {}
+        # we need this because we now push complex structures.
+        data = dumps(obj_data)
+        headers = {"Content-type": "application/json", "Accept": "application/json"}
+        encoding = self._get_request_encoding()
+        if encoding is not None and len(data) >= self.COMPRESSION_MIN_SIZE:
+            data = self._compress_body(data.encode("utf-8"), encoding)
+            headers["Content-Encoding"] = encoding
+        return data, headers
+
+    @staticmethod
+    def _normalize_push_status(status_code):
+        # we map 201 (created) and 202 (accepted) to 200 (ok) to simplify error handling...
+        if status_code in (requests.codes.created, requests.codes.accepted):
+            return requests.codes.ok
+        return status_code
+
+    @staticmethod
+    def _get_push_key(obj):
+        return f"{obj.get_url_base_name()}/{obj.guid}"
+
+    def _get_push_digest(self, obj, body):
+        """
+        Digest the request body and file content of a push of obj.
+
+        Returns None if the file cannot be read twice, in which case the object is
+        always pushed.
+        """
+        m = hashlib.md5()  # nosec B324
+        if not isinstance(body, (str, bytes)):
+            body = dumps(body, sort_keys=True)
+        m.update(body.encode("utf-8") if isinstance(body, str) else body)
+        file_data = obj.get_url_file()
+        if file_data:
+            fileobj = file_data[2]
+            try:
+                # streams that cannot be rewound must only be read by the upload
+                if not fileobj.seekable():
+                    return None
+                start = fileobj.tell()
+                for chunk in iter(lambda: fileobj.read(self.UPLOAD_CHUNK_SIZE), b""):
+                    m.update(chunk)
+                fileobj.seek(start)
+            except (AttributeError, OSError):
+                return None
+        return m.hexdigest()
+
+    def _is_unchanged(self, obj, digest):
+        if digest is None:
+            return False
+        with self._push_digests_lock:
+            return self.push_digests.get(self._get_push_key(obj)) == digest
+
+    def _record_push(self, obj, digest):
+        if digest is not None:
+            with self._push_digests_lock:
+                self.push_digests[self._get_push_key(obj)] = digest
+
+    def _forget_push_digests(self, obj):
+        """Forget the digests of obj and of the objects deleted along with it."""
+        with self._push_digests_lock:
+            if isinstance(obj, (report_objects.SessionREST, report_objects.DatasetREST)):
+                # the items referring to them are deleted too
+                self.push_digests.clear()
+            elif isinstance(obj, report_objects.TemplateREST):
+                # and so are the children of templates
+                prefix = f"{obj.get_url_base_name()}/"
+                for key in [k for k in self.push_digests if k.startswith(prefix)]:
+                    self.push_digests.pop(key, None)
+            else:
+                self.push_digests.pop(self._get_push_key(obj), None)
+
+    def _push_default_objects(self, objects):
+        """
+        Push the default session and dataset ahead of the objects that reference them.
+
+        Only done if either the session or dataset have changed from the last push.
+        """
         session = self.get_default_session()
         session_digest = Server.get_object_digest(session)
         dataset = self.get_default_dataset()
         dataset_digest = Server.get_object_digest(dataset)
-        # only do this if either the session or dataset have changed from the last push...
         if (session_digest != self._default_session_digest) or (
             dataset_digest != self._default_dataset_digest
         ):
@@ -544,86 +1212,399 @@ class Server:
                         if error != requests.codes.ok:
                             return error
                         self._default_dataset_digest = dataset_digest
-        # ok, push the real objects...
+        return requests.codes.ok
 
-        auth = self.get_auth()
-        success = requests.codes.ok
-        for o in objects:
-            request_method, uri, obj_data = self._get_push_request_info(o)
-            # the new way of json dumping before push might break older APIs so we
-            # fall back to the older way.
-            if self.api_version < 1:
-                data = obj_data
-                headers = {}
+    def _push_file(self, obj, auth, upload_progress=None):
+        """
+        Push the file payload of obj, if any. Returns the response or None.
+
+        The multipart body is streamed from the file object in chunks, so large scene
+        or animation files are never held in memory.
+        """
+        file_data = obj.get_url_file()
+        if not file_data:
+            return None
+        progress = None
+        if upload_progress is not None:
+            progress = functools.partial(upload_progress, obj)
+        body = MultipartFileEncoder(
+            "file",
+            file_data[1],
+            file_data[2],
+            chunk_size=self.UPLOAD_CHUNK_SIZE,
+            progress=progress,
+        )
+        url = self.cur_url + file_data[0]
+        try:
+            r = self._http_session.put(
+                url, auth=auth, data=body, headers={"Content-Type": body.content_type}
+            )
+        except Exception as e:
+            logger.debug(f"Warning: {str(e)}")
+            r = requests.Response()
+            r.status_code = requests.codes.client_closed_request
+        return r
+
+    def _push_object(self, o, auth, upload_progress=None, force=False):
+        """Push a single object (and its file payload) and return the resulting status code."""
+        request_method, uri, obj_data = self._get_push_request_info(o)
+        data, headers = self._encode_push_body(obj_data)
+        digest = self._get_push_digest(o, data)
+        if not force and self._is_unchanged(o, digest):
+            return requests.codes.ok
+        self._invalidate_cached(o)
+        # Push the object
+        try:
+            r = request_method(uri, auth=auth, data=data, headers=headers)
+        except Exception as e:
+            if print_allowed():
+                print(f"Unable to push object {o}: {e}")
+            raise
+
+        if r.status_code == requests.codes.bad_request:  # pragma: no cover
+            # One special case: perhaps the session/dataset was deleted and the cache not invalidated?
+            # In this case, we would get a 400 back and the response text would include 'Invalid pk'.  So,
+            # we try to push the dataset and session again and then re-push the object.  Only try this once!
+            if isinstance(o, report_objects.ItemREST) and "Invalid pk" in r.text:
+                repushed = False
+                if o.session == self.get_default_session().guid:
+                    error = self.put_objects([self.get_default_session()], force=True)
+                    if error != requests.codes.ok:
+                        return error
+                    repushed = True
+                if o.dataset == self.get_default_dataset().guid:
+                    error = self.put_objects([self.get_default_dataset()], force=True)
+                    if error != requests.codes.ok:
+                        return error
+                    repushed = True
+                # try one more time..
+                if repushed:
+                    r = request_method(uri, auth=auth, data=data, headers=headers)
             else:
-                # we need this because we now push complex structures.
-                data = json.dumps(obj_data, cls=BaseEncoder)
-                headers = {"Content-type": "application/json", "Accept": "application/json"}
-            # Push the object
-            try:
-                r = request_method(uri, auth=auth, data=data, headers=headers)
-            except Exception as e:
-                if print_allowed():
-                    print(f"Unable to push object {o}: {e}")
-                raise
-
-            if r.status_code == requests.codes.bad_request:  # pragma: no cover
-                # One special case: perhaps the session/dataset was deleted and the cache not invalidated?
-                # In this case, we would get a 400 back and the response text would include 'Invalid pk'.  So,
-                # we try to push the dataset and session again and then re-push the object.  Only try this once!
-                if isinstance(o, report_objects.ItemREST) and "Invalid pk" in r.text:
-                    repushed = False
-                    if o.session == session.guid:
-                        error = self.put_objects([session])
-                        if error != requests.codes.ok:
-                            return error
-                        repushed = True
-                    if o.dataset == dataset.guid:
-                        error = self.put_objects([dataset])
-                        if error != requests.codes.ok:
-                            return error
-                        repushed = True
-                    # try one more time..
-                    if repushed:
-                        r = request_method(uri, auth=auth, data=data, headers=headers)
-                else:
-                    self._last_error = r.text
-                    exceptions.raise_bad_request_error(r)
-            elif r.status_code == requests.codes.forbidden:
+                self._last_error = r.text
+                exceptions.raise_bad_request_error(r)
+        elif r.status_code == requests.codes.forbidden:
+            raise exceptions.PermissionDenied(
+                r.json().get("detail", "You do not have permission to perform this action.")
+            )
+
+        # do we need to push a file?
+        file_response = self._push_file(o, auth, upload_progress=upload_progress)
+        self._invalidate_cached(o)
+        if file_response is not None:
+            r = file_response
+        ret = self._normalize_push_status(r.status_code)
+        # record and errors
+        if ret != requests.codes.ok:
+            if ret == requests.codes.forbidden:
                 raise exceptions.PermissionDenied(
                     r.json().get("detail", "You do not have permission to perform this action.")
                 )
 
-            # do we need to push a file?
-            file_data = o.get_url_file()
-            if file_data:
-                files = {"file": (file_data[1], file_data[2])}
-                url = self.cur_url + file_data[0]
-                try:
-                    r = self._http_session.put(url, auth=auth, files=files)
-                except Exception as e:
-                    logger.debug(f"Warning: {str(e)}")
-                    r = requests.Response()
-                    r.status_code = requests.codes.client_closed_request
-            ret = r.status_code
-            # we map 201 (created) to 200 (ok) to simplify error handling...
-            if ret == requests.codes.created:
-                ret = requests.codes.ok
-            # we map 202 (accepted) to 200 (ok) to simplify error handling...
-            if ret == requests.codes.accepted:
-                ret = requests.codes.ok
-            # record and errors
-            if ret != requests.codes.ok:
-                if ret == requests.codes.forbidden:
-                    raise exceptions.PermissionDenied(
-                        r.json().get("detail", "You do not have permission to perform this action.")
-                    )
+            self._last_error = r.text
+        else:
+            self._record_push(o, digest)
+        return ret
 
-                self._last_error = r.text
+    def put_objects(self, in_objects, max_workers=None, upload_progress=None, force=False):
+        """
+        Push objects to the server.
+
+        If ``max_workers`` is greater than one, independent objects are pushed concurrently
+        by a pool of threads sharing the pooled HTTP session. Ordering constraints still
+        hold: sessions, datasets and item categories are pushed first and templates are
+        always pushed after their parent. The session connection pool should be at least
+        ``max_workers`` connections large to avoid reopening connections.
+
+        File payloads are streamed to the server in chunks. If ``upload_progress`` is
+        set, it is called as ``upload_progress(obj, bytes_sent, total_bytes)`` after every
+        chunk, where ``total_bytes`` is ``None`` if the size of the file is unknown.
+
+        A digest of the request body and file content of every successful push is kept
+        in ``Server.push_digests``, keyed by object type and GUID. Pushing an object
+        that has not changed since is skipped, unless ``force`` is True. The dict can be
+        saved and restored to skip unchanged objects across runs. Deleting an object
+        through this server forgets its digest, and changing the server URL forgets
+        all of them.
+        """
+        if not self.valid_database():
+            return requests.codes.service_unavailable
+        objects = in_objects
+        if not isinstance(in_objects, collections.abc.Iterable):
+            objects = [in_objects]
+        if max_workers is not None and max_workers > 1:
+            objects = list(objects)
+        # Pre-screen the object list.  If any of the objects reference the
+        # current session or dataset and they have not yet been pushed or
+        # have changed from the last time they were pushed, push them first...
+        error = self._push_default_objects(objects)
+        if error != requests.codes.ok:
+            return error
+        # ok, push the real objects...
+        auth = self.get_auth()
+        success = requests.codes.ok
+        if max_workers is not None and max_workers > 1:
+            for level in self._get_push_levels(objects):
+                for ret in self._map_concurrently(
+                    lambda o: self._push_object(
+                        o, auth, upload_progress=upload_progress, force=force
+                    ),
+                    level,
+                    max_workers,
+                ):
+                    if ret != requests.codes.ok:
+                        success = ret
+            return success
+        for o in objects:
+            ret = self._push_object(o, auth, upload_progress=upload_progress, force=force)
+            if ret != requests.codes.ok:
                 success = ret
         return success
 
-    def del_objects(self, in_objects):
+    @staticmethod
+    def _map_concurrently(func, objects, max_workers):
+        """Run func on every object using a thread pool, returning results in order."""
+        if len(objects) < 2:
+            return [func(o) for o in objects]
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(objects))
+        ) as executor:
+            return list(executor.map(func, objects))
+
+    @staticmethod
+    def _get_push_levels(objects):
+        """
+        Split objects into groups that can each be pushed concurrently.
+
+        Sessions, datasets and item categories come first since items refer to them.
+        Templates whose parent is in the list are placed one level after their parent.
+        """
+        first = []
+        levels = collections.defaultdict(list)
+        templates = {t.guid: t for t in objects if isinstance(t, report_objects.TemplateREST)}
+        depths = {}
+        for o in objects:
+            if isinstance(
+                o,
+                (
+                    report_objects.SessionREST,
+                    report_objects.DatasetREST,
+                    report_objects.ItemCategoryREST,
+                ),
+            ):
+                first.append(o)
+                continue
+            depth = 0
+            if isinstance(o, report_objects.TemplateREST):
+                # walk up the ancestors present in the list, guarding against cycles
+                chain = []
+                node = o
+                while node is not None and node.guid not in depths and node not in chain:
+                    chain.append(node)
+                    node = templates.get(node.parent)
+                depth = depths.get(node.guid, -1) + 1 if node is not None else 0
+                for ancestor in reversed(chain):
+                    depths[ancestor.guid] = depth
+                    depth += 1
+                depth = depths[o.guid]
+            levels[depth].append(o)
+        return [level for level in [first] + [levels[k] for k in sorted(levels)] if level]
+
+    def put_objects_bulk(self, in_objects, batch_size=None, upload_progress=None, force=False):
+        """
+        Push objects to the server using chunked, multi-object requests.
+
+        The JSON bodies of up to ``batch_size`` objects are grouped into a single request
+        to the server's bulk endpoint, which greatly reduces the number of round trips
+        when ingesting large numbers of items or templates. File payloads are still
+        pushed individually. If the server does not advertise bulk support in its
+        api_version, each object is pushed with ``put_objects()`` instead.
+
+        Parameters
+        ----------
+        in_objects : iterable or BaseRESTObject
+            The objects to push.
+        batch_size : int, optional
+            The maximum number of objects per bulk request. Defaults to
+            ``Server.DEFAULT_BULK_BATCH_SIZE``.
+        upload_progress : callable, optional
+            Progress callback for file payloads, see ``put_objects()``.
+        force : bool, optional
+            Push the objects even if they have not changed since their last push, see
+            ``put_objects()``.
+
+        Returns
+        -------
+        dict
+            The status code of the push of each object, keyed by object GUID.
+            Successful pushes are reported as ``requests.codes.ok``.
+        """
+        objects = in_objects
+        if not isinstance(in_objects, collections.abc.Iterable):
+            objects = [in_objects]
+        objects = list(objects)
+        if not self.valid_database():
+            return {str(o.guid): requests.codes.service_unavailable for o in objects}
+        if batch_size is None:
+            batch_size = self.DEFAULT_BULK_BATCH_SIZE
+        if batch_size < 1:
+            raise ValueError("The batch size must be a positive integer.")
+        # fall back to one request per object if the server cannot take bulk pushes
+        if self.api_version < 1 or not self._has_server_feature("bulk_push"):
+            return {
+                str(o.guid): self.put_objects([o], upload_progress=upload_progress, force=force)
+                for o in objects
+            }
+        error = self._push_default_objects(objects)
+        if error != requests.codes.ok:
+            return {str(o.guid): error for o in objects}
+        auth = self.get_auth()
+        status = {}
+        for start in range(0, len(objects), batch_size):
+            batch = objects[start : start + batch_size]
+            status.update(
+                self._push_bulk_batch(batch, auth, upload_progress=upload_progress, force=force)
+            )
+        return status
+
+    def _push_bulk_batch(self, batch, auth, upload_progress=None, force=False):
+        """Push one chunk of objects through the bulk endpoint and return their status."""
+        status = {}
+        entries = []
+        digests = []
+        changed = []
+        for o in batch:
+            method, obj_uri, obj_data = self._get_push_request_spec(o)
+            digest = self._get_push_digest(o, obj_data)
+            if not force and self._is_unchanged(o, digest):
+                status[str(o.guid)] = requests.codes.ok
+                continue
+            self._invalidate_cached(o)
+            entries.append({"method": method.upper(), "url": obj_uri, "data": obj_data})
+            digests.append(digest)
+            changed.append(o)
+        if not changed:
+            return status
+        batch = changed
+        data, headers = self._encode_push_body({"objects": entries})
+        uri = self.build_request_url(self.BULK_PUSH_URL)
+        try:
+            r = self._http_session.post(uri, auth=auth, data=data, headers=headers)
+        finally:
+            for o in batch:
+                self._invalidate_cached(o)
+        if r.status_code == requests.codes.forbidden:
+            raise exceptions.PermissionDenied(
+                r.json().get("detail", "You do not have permission to perform this action.")
+            )
+        ret = self._normalize_push_status(r.status_code)
+        if ret != requests.codes.ok:
+            self._last_error = r.text
+            status.update({str(o.guid): ret for o in batch})
+            return status
+        try:
+            results = r.json()
+        except Exception as e:
+            logger.debug(f"Warning: {str(e)}")
+            results = None
+        # the server reports the outcome of each object in the order they were sent.
+        # Anything else, such as an error body sent with a 2xx status, fails the batch.
+        if (
+            not isinstance(results, list)
+            or len(results) != len(batch)
+            or not all(isinstance(result, dict) for result in results)
+        ):
+            self._last_error = r.text
+            status.update({str(o.guid): requests.codes.bad_gateway for o in batch})
+            return status
+        for idx, (o, result) in enumerate(zip(batch, results)):
+            ret = self._normalize_push_status(result.get("status", r.status_code))
+            if ret == requests.codes.ok:
+                file_response = self._push_file(o, auth, upload_progress=upload_progress)
+                if file_response is not None:
+                    self._invalidate_cached(o)
+                    ret = self._normalize_push_status(file_response.status_code)
+                    if ret != requests.codes.ok:
+                        self._last_error = file_response.text
+            elif "detail" in result:
+                self._last_error = str(result["detail"])
+            if ret == requests.codes.ok:
+                self._record_push(o, digests[idx])
+            status[str(o.guid)] = ret
+        return status
+
+    def start_push_queue(self, max_pending=1000, batch_size=100, spill_dir=None, on_error=None):
+        """
+        Start a write-behind queue pushing the objects passed to ``enqueue()``.
+
+        The objects are pushed by a background thread, so producers such as solvers
+        creating items at every time step do not wait on the network. Memory is bounded
+        by spilling to a temporary file beyond ``max_pending`` objects. A previous queue
+        is flushed and closed first. See ``push_queue.PushQueue`` for the arguments.
+        """
+        self.close_push_queue()
+        self._push_queue = PushQueue(
+            self,
+            max_pending=max_pending,
+            batch_size=batch_size,
+            spill_dir=spill_dir,
+            on_error=on_error,
+        )
+        return self._push_queue
+
+    def enqueue(self, obj):
+        """
+        Queue an object to be pushed in the background, starting the queue if needed.
+
+        The object must not be modified afterwards. Call ``flush()`` to wait for the
+        queued objects to reach the server.
+        """
+        if self._push_queue is None:
+            self.start_push_queue()
+        self._push_queue.enqueue(obj)
+
+    def flush(self, timeout=None):
+        """Wait for the queued objects to be pushed. Returns False on timeout."""
+        if self._push_queue is None:
+            return True
+        return self._push_queue.flush(timeout)
+
+    def close_push_queue(self):
+        """Push the queued objects and stop the background push queue."""
+        if self._push_queue is not None:
+            self._push_queue.close()
+            self._push_queue = None
+
+    def _delete_object(self, o, auth):
+        """Delete a single object and return the resulting status code."""
+        obj_uri, obj_data = o.get_url_data()
+        uri = self.build_request_url(obj_uri)
+        self._invalidate_cached(o, cascade=True)
+        self._forget_push_digests(o)
+        # delete the object
+        try:
+            r = self._http_session.delete(uri, auth=auth)
+        finally:
+            self._invalidate_cached(o, cascade=True)
+        ret = r.status_code
+        # the output should be 204 no_content
+        if ret != requests.codes.no_content:
+            if ret == requests.codes.bad_request:
+                exceptions.raise_bad_request_error(r)
+            if ret == requests.codes.forbidden:
+                raise exceptions.PermissionDenied(
+                    r.json().get("detail", "You do not have permission to perform this action.")
+                )
+        return ret
+
+    def del_objects(self, in_objects, max_workers=None):
+        """
+        Delete objects from the server.
+
+        If ``max_workers`` is greater than one, the objects are deleted concurrently by a
+        pool of threads sharing the pooled HTTP session. Child templates are deleted
+        before their parents.
+        """
         if not self.valid_database():
             return requests.codes.service_unavailable
         objects = in_objects
@@ -631,24 +1612,24 @@ class Server:
             objects = [in_objects]
         auth = self.get_auth()
         success = requests.codes.ok
-        for o in objects:
-            obj_uri, obj_data = o.get_url_data()
-            uri = self.build_request_url(obj_uri)
-            # delete the object
-            r = self._http_session.delete(uri, auth=auth)
-            ret = r.status_code
-            # the output should be 204 no_content
-            if ret != requests.codes.no_content:
-                if ret == requests.codes.bad_request:
-                    exceptions.raise_bad_request_error(r)
-                if ret == requests.codes.forbidden:
-                    raise exceptions.PermissionDenied(
-                        r.json().get("detail", "You do not have permission to perform this action.")
+        if max_workers is not None and max_workers > 1:
+            results = []
+            for level in reversed(self._get_push_levels(list(objects))):
+                results.extend(
+                    self._map_concurrently(
+                        lambda o: self._delete_object(o, auth), level, max_workers
                     )
+                )
+        else:
+            results = (self._delete_object(o, auth) for o in objects)
+        for ret in results:
+            if ret != requests.codes.no_content:
                 success = ret
         return success
 
-    def get_file(self, obj, fileobj):
+    def get_file(self, obj, fileobj, chunk_size=None):
+        if chunk_size is None:
+            chunk_size = self.DOWNLOAD_CHUNK_SIZE
         if self.valid_database():
             file_url = getattr(obj, "fileurl", None)
             if file_url is not None:
@@ -656,12 +1637,65 @@ class Server:
                 r = report_utils.run_web_request("GET", self, file_url, stream=True)
                 if r is not None:
                     if r.status_code == requests.codes.ok:
-                        for chunk in r.iter_content(1024):
+                        for chunk in r.iter_content(chunk_size):
                             fileobj.write(chunk)
                     return r.status_code
 
         return requests.codes.service_unavailable
 
+    def _open_file_payload(self, obj, stream=False):
+        """
+        Open the file payload of obj for reading, or return None if it cannot be fetched.
+
+        If stream is True and the size of the file is known, the response is returned as a
+        forward-only file object, so the file never touches the disk. Otherwise it is
+        downloaded into a temporary file.
+        """
+        file_url = getattr(obj, "fileurl", None)
+        if not self.valid_database() or file_url is None:
+            return None
+        r = report_utils.run_web_request("GET", self, file_url, stream=True)
+        if r is None:
+            return None
+        if r.status_code != requests.codes.ok:
+            r.close()
+            return None
+        length = r.headers.get("Content-Length")
+        # the size of a compressed body does not match the decoded content
+        if stream and length is not None and "Content-Encoding" not in r.headers:
+            return _ResponseFile(r, int(length), self.DOWNLOAD_CHUNK_SIZE)
+        fileobj = tempfile.NamedTemporaryFile()
+        try:
+            for chunk in r.iter_content(self.DOWNLOAD_CHUNK_SIZE):
+                fileobj.write(chunk)
+        finally:
+            r.close()
+        return fileobj
+
+    def _copy_object(self, source, obj, stream_files=False):
+        """Push obj, read from the source server, into this server along with its file."""
+        for attempt in range(self.max_retries + 1):
+            streamed = False
+            # special case for items with file payloads
+            if getattr(obj, "fileurl", None):
+                # need to pull the file from this url...
+                obj.fileobj = source._open_file_payload(obj, stream=stream_files)
+                streamed = isinstance(obj.fileobj, _ResponseFile)
+            try:
+                ret = self.put_objects([obj])
+            finally:
+                # clean up temp file
+                fileobj = getattr(obj, "fileobj", None)
+                if fileobj:
+                    fileobj.close()
+            # streamed uploads are not retried by the HTTP session as the download
+            # cannot be rewound, download the file again instead
+            if not streamed or ret not in self.RETRY_STATUS_CODES:
+                break
+            if attempt < self.max_retries:
+                time.sleep(self.backoff_factor * (2**attempt))
+        return obj
+
     # this method will copy all of the object (obj_type=class) that
     # match the passed query into this (self) database...
     # Allowed obj_type are "item", "template"...
@@ -669,8 +1703,19 @@ class Server:
     # setLabelText(), setMaximum(), setValue()
     # if progress_qt is True, text strings will be translated, etc.  Otherwise,
     # the same method are called, but w/o Qt use.
+    # if max_workers is larger than one, file downloads and uploads of several objects
+    # overlap in a pool of threads.  if stream_files is True, file payloads are piped
+    # from the source server into this one without being written to disk.
     def copy_items(
-        self, source, obj_type="item", query=None, progress=None, categories=None, progress_qt=True
+        self,
+        source,
+        obj_type="item",
+        query=None,
+        progress=None,
+        categories=None,
+        progress_qt=True,
+        max_workers=None,
+        stream_files=False,
     ):
         copy_list = []
         # get the items to copy...
@@ -696,26 +1741,22 @@ class Server:
                 progress.setLabelText(text)
                 progress.setMaximum(nobjs)
                 progress.setValue(n)
-            for guid in dataset_set:
-                obj = source.get_object_from_guid(guid, objtype=report_objects.DatasetREST)
-                if obj:
-                    copy_list.insert(0, obj)
-                n += 1
-                if progress:
-                    progress.setValue(n)
+            for obj in source.get_objects_by_guids(dataset_set, objtype=report_objects.DatasetREST):
+                copy_list.insert(0, obj)
+            n += len(dataset_set)
+            if progress:
+                progress.setValue(n)
             # now the associated sessions
             if progress:
                 text = "Scanning sessions..."
                 if progress_qt:
                     text = "Scanning sessions..."
                 progress.setLabelText(text)
-            for guid in session_set:
-                obj = source.get_object_from_guid(guid, objtype=report_objects.SessionREST)
-                if obj:
-                    copy_list.insert(0, obj)
-                n += 1
-                if progress:
-                    progress.setValue(n)
+            for obj in source.get_objects_by_guids(session_set, objtype=report_objects.SessionREST):
+                copy_list.insert(0, obj)
+            n += len(session_set)
+            if progress:
+                progress.setValue(n)
         elif obj_type == "template":
             # get the selected templates
             if progress:
@@ -743,11 +1784,10 @@ class Server:
                 # are we done?
                 if len(add_set) == 0:
                     break
-                for guid in add_set:
-                    obj = source.get_object_from_guid(guid, objtype=report_objects.TemplateREST)
-                    if obj:
-                        copy_list.append(obj)
-                    copy_set.add(guid)  # we at least tried, so avoid infinite loop...
+                copy_list.extend(
+                    source.get_objects_by_guids(add_set, objtype=report_objects.TemplateREST)
+                )
+                copy_set.update(add_set)  # we at least tried, so avoid infinite loop...
             # It takes two passes to save templates, once without children and once with
             # The common case will handle the latter, so we handle the former here
             nobjs = len(copy_list)
@@ -790,6 +1830,16 @@ class Server:
             progress.setLabelText(s)
             progress.setMaximum(nobjs)
 
+        if max_workers is not None and max_workers > 1:
+            return self._copy_objects_concurrently(
+                source,
+                copy_list,
+                skip_count_types,
+                progress,
+                progress_qt,
+                max_workers,
+                stream_files,
+            )
         for obj in copy_list:
             try:
                 if progress:
@@ -797,18 +1847,7 @@ class Server:
                     if progress_qt:
                         if progress.wasCanceled():
                             return False
-                # special case for items with file payloads
-                file_url = getattr(obj, "fileurl", None)
-                if file_url:
-                    # need to pull the file from this url...
-                    obj.fileobj = tempfile.NamedTemporaryFile()
-                    if source.get_file(obj, obj.fileobj) != requests.codes.ok:
-                        obj.fileobj = None
-                self.put_objects([obj])
-                # clean up temp file
-                fileobj = getattr(obj, "fileobj", None)
-                if fileobj:
-                    fileobj.close()
+                self._copy_object(source, obj, stream_files=stream_files)
                 if type(obj) not in skip_count_types:
                     n += 1
             except Exception as e:
@@ -819,6 +1858,37 @@ class Server:
             progress.setValue(nobjs)
         return True
 
+    def _copy_objects_concurrently(
+        self, source, copy_list, skip_count_types, progress, progress_qt, max_workers, stream_files
+    ):
+        # the progress object is only ever used from the calling thread
+        n = 0
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # sessions and datasets are copied before the items that refer to them
+            for level in self._get_push_levels(copy_list):
+                futures = [
+                    executor.submit(self._copy_object, source, obj, stream_files) for obj in level
+                ]
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        obj = future.result()
+                    except Exception as e:
+                        if print_allowed():
+                            print(f"Failure while copying: {e}")
+                        executor.shutdown(wait=True, cancel_futures=True)
+                        return False
+                    if type(obj) not in skip_count_types:
+                        n += 1
+                    if progress:
+                        progress.setValue(n)
+                        if progress_qt:
+                            if progress.wasCanceled():
+                                executor.shutdown(wait=True, cancel_futures=True)
+                                return False
+        if progress:
+            progress.setValue(n)
+        return True
+
     # The server class is the basis of the non-EnSight API
     # to simplify the API, the server maintains a current
     # session and dataset object.  The user may modify these
@@ -966,6 +2036,9 @@ class Server:
             filename=filename,
             no_inline_files=no_inline_files,
             ansys_version=resolved_ansys_version,
+            session=self._http_session,
+            max_workers=self.pool_maxsize,
+            asset_cache=self._asset_cache,
         )
         worker.download()
 
@@ -1276,11 +2349,33 @@ class Server:
             A Python dictionary representation of the template hierarchy.
         """
         templates_data = {}
-        templates = self.get_objects(objtype=report_objects.TemplateREST)
+        templates = self._get_template_subtree(root_guid)
         template_guid_id_map = {root_guid: 0}
         self._build_template_data(root_guid, templates_data, templates, template_guid_id_map)
         return templates_data
 
+    def _get_template_subtree(self, root_guid):
+        """
+        Fetch the templates of the tree rooted at root_guid, one level at a time.
+
+        Returns a dict mapping the GUIDs to the templates. Each level of the tree is
+        resolved with batched GUID queries, so the cost does not depend on the number
+        of unrelated templates in the database.
+        """
+        templates = {}
+        level = [root_guid]
+        while level:
+            level = [guid for guid in level if guid not in templates]
+            for template in self.get_objects_by_guids(level, objtype=report_objects.TemplateREST):
+                templates[template.guid] = template
+            level = [
+                child_guid
+                for guid in level
+                if guid in templates
+                for child_guid in templates[guid].children
+            ]
+        return templates
+
     def store_json(self, root_guid, filename):
         """
         Given a root guid, generate a JSON file rooted this guid, and store the file on disk
@@ -1314,82 +2409,155 @@ class Server:
 
         self.load_templates(templates_json)
 
-    def load_templates(self, templates: dict, logger=None):
+    def load_templates(self, templates: dict, logger=None, max_workers=None, batch_size=None):
         """
         Load templates from a Python dict.
 
+        Every template is validated and built before anything is pushed. The tree is
+        then pushed breadth-first, one level at a time, so each level goes to the server
+        in batched (``put_objects_bulk()``) or concurrent (``put_objects()``) requests.
+
         Parameters
         ----------
         templates : dict
             A dictionary containing the templates to load. Ideally, it is supposed to be converted from JSON.
-        """
-        for template_id_str, template_attr in templates.items():
-            if template_attr["parent"] is None:
-                root_id_str = template_id_str
-                break
+        logger : logging.Logger, optional
+            Logger for validation warnings and the timing of each level.
+        max_workers : int, optional
+            Number of concurrent requests per level when the server does not support bulk pushes.
+        batch_size : int, optional
+            The maximum number of templates per bulk request, see ``put_objects_bulk()``.
 
-        root_attr = templates[root_id_str]
-        root_template = self._populate_template(root_id_str, root_attr, None, logger)
-        self.put_objects(root_template)
-        self._build_templates_from_parent(root_id_str, root_template, templates, logger)
+        Returns
+        -------
+        int
+            ``requests.codes.ok`` if all the templates were pushed, else the first error status.
+        """
+        levels = self._build_template_levels(templates, logger)
+        log = logger if logger is not None else logging.getLogger("ansys.dynamicreporting.core")
+        # Push the levels top-down without children, as the server rejects references
+        # to templates that do not exist yet. The children are added in a second pass.
+        for depth, level in enumerate(levels):
+            start = time.perf_counter()
+            children = [t.children for t in level]
+            for template in level:
+                template.children = []
+            try:
+                ret = self._push_template_level(level, max_workers, batch_size)
+            finally:
+                for template, template_children in zip(level, children):
+                    template.children = template_children
+            log.info(
+                f"Pushed {len(level)} template(s) at depth {depth} in "
+                f"{time.perf_counter() - start:.3f} s"
+            )
+            if ret != requests.codes.ok:
+                return ret
+        parents = [t for level in levels for t in level if t.children]
+        if not parents:
+            return requests.codes.ok
+        start = time.perf_counter()
+        ret = self._push_template_level(parents, max_workers, batch_size)
+        log.info(
+            f"Linked the children of {len(parents)} template(s) in "
+            f"{time.perf_counter() - start:.3f} s"
+        )
+        return ret
 
     def _populate_template(self, id_str, attr, parent_template, logger=None):
         return populate_template(id_str, attr, parent_template, self.create_template, logger)
 
-    def _build_templates_from_parent(
-        self, parent_id_str, parent_template, templates_json, logger=None
-    ):
-        children_id_strs = templates_json[parent_id_str]["children"]
-        if not children_id_strs:
-            return
+    def _build_template_levels(self, templates_json, logger=None):
+        """
+        Validate the JSON templates and build the TemplateREST objects of the tree.
 
-        child_templates = []
-        for child_id_str in children_id_strs:
-            child_attr = templates_json[child_id_str]
-            child_template = self._populate_template(
-                child_id_str, child_attr, parent_template, logger
+        Returns a list of the levels of the tree, starting with the one of the root.
+        """
+        root_id_str = None
+        for template_id_str, template_attr in templates_json.items():
+            if template_attr["parent"] is None:
+                root_id_str = template_id_str
+                break
+        if root_id_str is None:
+            raise exceptions.TemplateEditorJSONLoadingError(
+                "The loaded JSON file does not have a root template."
             )
-            child_templates.append(child_template)
-
-        self.put_objects(child_templates)
-
-        for child_id_str in children_id_strs:
-            self._build_templates_from_parent(child_id_str, child_template, templates_json, logger)
 
-    def _build_template_data(self, guid, templates_data, templates, template_guid_id_map):
-        curr_template = None
-        for template in templates:
-            if template.guid == guid:
-                curr_template = template
-
-        curr_template_key = f"Template_{template_guid_id_map[curr_template.guid]}"
-        templates_data[curr_template_key] = {}
-        for field in JSON_ATTR_KEYS:
-            value = getattr(curr_template, field, None)
-            if value is None:
-                continue
-            templates_data[curr_template_key][field] = value
+        root_template = self._populate_template(
+            root_id_str, templates_json[root_id_str], None, logger
+        )
+        levels = []
+        level = [(root_id_str, root_template)]
+        seen = {root_id_str}
+        while level:
+            levels.append([template for _, template in level])
+            next_level = []
+            for parent_id_str, parent_template in level:
+                for child_id_str in templates_json[parent_id_str]["children"]:
+                    if child_id_str in seen:
+                        raise exceptions.TemplateEditorJSONLoadingError(
+                            f"The template '{child_id_str}' appears more than once in the tree."
+                        )
+                    if child_id_str not in templates_json:
+                        raise exceptions.TemplateEditorJSONLoadingError(
+                            f"The template '{child_id_str}' under the key: 'children' of "
+                            f"'{parent_id_str}' does not exist."
+                        )
+                    seen.add(child_id_str)
+                    child_template = self._populate_template(
+                        child_id_str, templates_json[child_id_str], parent_template, logger
+                    )
+                    next_level.append((child_id_str, child_template))
+            level = next_level
+        return levels
+
+    def _push_template_level(self, templates, max_workers=None, batch_size=None):
+        """Push a group of independent templates and return the first error status, if any."""
+        if self._has_server_feature("bulk_push"):
+            status = self.put_objects_bulk(templates, batch_size=batch_size)
+            for ret in status.values():
+                if ret != requests.codes.ok:
+                    return ret
+            return requests.codes.ok
+        return self.put_objects(templates, max_workers=max_workers)
+
+    def _build_template_data(self, root_guid, templates_data, templates, template_guid_id_map):
+        # Depth-first walk with an explicit stack, so deep trees do not hit the recursion
+        # limit. Children are pushed in reverse to visit them in order.
+        stack = [root_guid]
+        while stack:
+            guid = stack.pop()
+            curr_template = templates.get(guid)
+            if curr_template is None:
+                raise exceptions.TemplateDoesNotExist(f"The template '{guid}' does not exist.")
+
+            curr_template_key = f"Template_{template_guid_id_map[curr_template.guid]}"
+            templates_data[curr_template_key] = {}
+            for field in JSON_ATTR_KEYS:
+                value = getattr(curr_template, field, None)
+                if value is None:
+                    continue
+                templates_data[curr_template_key][field] = value
 
-        templates_data[curr_template_key]["params"] = curr_template.get_params()
-        templates_data[curr_template_key]["sort_selection"] = curr_template.get_sort_selection()
-        if curr_template.parent is None:
-            templates_data[curr_template_key]["parent"] = None
-            templates_data[curr_template_key]["guid"] = str(uuid.uuid4())
-        else:
-            templates_data[curr_template_key]["parent"] = (
-                f"Template_{template_guid_id_map[curr_template.parent]}"
-            )
+            templates_data[curr_template_key]["params"] = curr_template.get_params()
+            templates_data[curr_template_key]["sort_selection"] = curr_template.get_sort_selection()
+            if curr_template.parent is None:
+                templates_data[curr_template_key]["parent"] = None
+                templates_data[curr_template_key]["guid"] = str(uuid.uuid4())
+            else:
+                templates_data[curr_template_key]["parent"] = (
+                    f"Template_{template_guid_id_map[curr_template.parent]}"
+                )
 
-        templates_data[curr_template_key]["children"] = []
-        children_guids = curr_template.children
-        for child_guid in children_guids:
-            curr_size = len(template_guid_id_map)
-            template_guid_id_map[child_guid] = curr_size
-            templates_data[curr_template_key]["children"].append(f"Template_{curr_size}")
+            # Number all the children first, as we want to have consecutive IDs for them
+            templates_data[curr_template_key]["children"] = []
+            children_guids = curr_template.children
+            for child_guid in children_guids:
+                curr_size = len(template_guid_id_map)
+                template_guid_id_map[child_guid] = curr_size
+                templates_data[curr_template_key]["children"].append(f"Template_{curr_size}")
 
-        # Don't combine these 2 for loops, as we want to have consecutive IDs for children
-        for child_guid in children_guids:
-            self._build_template_data(child_guid, templates_data, templates, template_guid_id_map)
+            stack.extend(reversed(children_guids))
 
 
 def create_new_local_database(
@@ -24,6 +24,7 @@ import array
 import base64
 from html.parser import HTMLParser as BaseHTMLParser
 import io
+import itertools
 import json
 import os
 import os.path
@@ -491,6 +492,14 @@ def isSQLite3(filename):
     return header[:16] == b"SQLite format 3\x00"
 
 
+def _array_typecode(size, signed):
+    """Get the array module typecode of an integer with the given size in bytes."""
+    for code in "bhilq" if signed else "BHILQ":
+        if array.array(code).itemsize == size:
+            return code
+    raise ValueError(f"No array typecode for a {size} byte integer")
+
+
 class nexus_array:
     """
     The nexus_array object stores a multi-dimensional array of items of a specific type.
@@ -500,14 +509,33 @@ class nexus_array:
     in a subset of the numpy dtype strings:
         'f4' = float32
         'f8' = double or float64
+        'i2' = int16
+        'u2' = uint16
         'i4' = int32
         'u4' = uint32
         'i8' = int64
-        'u8' = uint32
+        'u8' = uint64
         'S{x}' = string of fixed size {x}
-        'B' = int8
+        'B' = uint8
+
+    The items are stored row-major in a flat array.array, which is exposed through the
+    buffer protocol (see to_memoryview()), so numpy and other consumers can share the
+    memory without copying it.
     """
 
+    # typecodes are picked by item size, as the size of 'l' and 'L' varies by platform
+    _array_type_lookup = {
+        "f4": "f",
+        "f8": "d",
+        "B": "B",
+        "i2": _array_typecode(2, True),
+        "u2": _array_typecode(2, False),
+        "i4": _array_typecode(4, True),
+        "u4": _array_typecode(4, False),
+        "i8": _array_typecode(8, True),
+        "u8": _array_typecode(8, False),
+    }
+
     def __init__(self, dtype="f4", shape=(1, 1)):
         """
         Initialize a nexus_array object.
@@ -532,7 +560,8 @@ class nexus_array:
         state."""
         if (self.array is None) or (self.count(string_size=True) != len(self.array)):
             self.array = array.array(self.numpy_to_array_type(self.dtype))
-            self.array.extend(range(self.count(string_size=True)))
+            # zero-fill with a single frombytes() copy
+            self.array.frombytes(bytes(self.count(string_size=True) * self.array.itemsize))
 
     def count(self, string_size=False):
         """
@@ -590,6 +619,18 @@ class nexus_array:
             index *= self._strlen
         return index
 
+    def _row_length(self):
+        if len(self.shape) > 1:
+            return self.shape[1]
+        return 1
+
+    def _to_string_cell(self, value):
+        # convert any input that is not bytes to bytes of exactly _strlen,
+        # space padded or truncated
+        if not isinstance(value, bytes):
+            value = str(value).encode("utf-8")
+        return (value + (b" " * self._strlen))[: self._strlen]
+
     def __getitem__(self, key):
         idx = self._index(key)
         if self.dtype[0] != "S":
@@ -602,15 +643,18 @@ class nexus_array:
             # further encoding needed only for byte-string dtype
             self.array[idx] = value
             return
-        # since we only handle byte-strings from here on.
-        # convert any input that is not bytes to bytes
-        tmp = value
-        if not isinstance(tmp, bytes):
-            tmp = str(tmp).encode("utf-8")
-        tmp = tmp + (b" " * self._strlen)
-        tmp_arr = array.array("B")
-        tmp_arr.frombytes(tmp)
-        self.array[idx : idx + self._strlen] = tmp_arr[0 : self._strlen]
+        self.array[idx : idx + self._strlen] = array.array("B", self._to_string_cell(value))
+
+    def __array__(self, dtype=None, copy=None):
+        # numpy.asarray() shares the buffer, numpy.array() copies it
+        a = self.to_numpy(writeable=True) if copy else self._numpy_view()
+        if dtype is not None:
+            a = a.astype(dtype, copy=False)
+        return a
+
+    def __buffer__(self, flags):
+        # Python 3.12+ buffer protocol: memoryview(nexus_array)
+        return self.to_memoryview()
 
     @classmethod
     def numpy_to_array_type(cls, np_dtype):
@@ -624,23 +668,11 @@ class nexus_array:
         else:
             dtype_str = np_dtype
 
-        np_array_lookup = {
-            "f4": "f",
-            "f8": "d",
-            "B": "B",
-            "i2": "i",
-            "u2": "I",
-            "i4": "l",
-            "u4": "L",
-            "i8": "q",
-            "u8": "Q",
-        }
-
         if isinstance(dtype_str, text_type):
             if dtype_str.startswith("S"):
                 return "B"
-            elif dtype_str in np_array_lookup:
-                return np_array_lookup[dtype_str]
+            elif dtype_str in cls._array_type_lookup:
+                return cls._array_type_lookup[dtype_str]
 
         raise ValueError("Not a valid numpy dtype")
 
@@ -686,23 +718,96 @@ class nexus_array:
         self.update_array()
         return self.array.tobytes()
 
+    def to_memoryview(self):
+        """
+        Get a memoryview on the storage of the array, without copying it.
+
+        Numeric multi-dimensional arrays are exposed with their shape.  Byte-string and
+        empty arrays are exposed as a flat view of the storage.
+
+        :returns: memoryview
+        """
+        view = memoryview(self.array)
+        if self.dtype[0] == "S" or len(self.shape) < 2 or not len(self.array):
+            return view
+        if self.count() != len(self.array):
+            return view
+        return view.cast("B").cast(self.array.typecode, self.shape)
+
+    def get_rows(self, start=0, stop=None):
+        """
+        Get a range of rows of the array as lists.
+
+        The rows are converted in bulk from the underlying storage instead of one item
+        at a time.
+
+        :param start: The first row to return.
+        :type start: int
+        :param stop: The row to stop before, defaults to the number of rows.
+        :type stop: int
+        :returns: list of rows, each a list of items
+        """
+        ncols = self._row_length()
+        nrows = self.shape[0] if self.shape else 1
+        start, stop, _ = slice(start, stop).indices(nrows)
+        if stop <= start:
+            return []
+        if self.dtype[0] == "S":
+            width = self._strlen
+            row_width = ncols * width
+            raw = memoryview(self.array)[start * row_width : stop * row_width].tobytes()
+            cells = [raw[k : k + width] for k in range(0, len(raw), width)]
+        else:
+            cells = memoryview(self.array)[start * ncols : stop * ncols].tolist()
+        return [cells[k : k + ncols] for k in range(0, len(cells), ncols)]
+
+    def set_rows(self, rows, start=0):
+        """
+        Store a sequence of rows into the array, starting at the given row.
+
+        :param rows: The rows to store, each a sequence with one item per column.
+        :type rows: list
+        :param start: The row to store the first of the rows into.
+        :type start: int
+        """
+        ncols = self._row_length()
+        for row in rows:
+            if len(row) != ncols:
+                raise ValueError(f"Rows of the array must have {ncols} items")
+        if self.dtype[0] == "S":
+            data = b"".join(self._to_string_cell(v) for row in rows for v in row)
+            values = array.array("B", data)
+            offset = start * ncols * self._strlen
+        else:
+            values = array.array(self.array.typecode, itertools.chain.from_iterable(rows))
+            offset = start * ncols
+        if offset + len(values) > len(self.array):
+            raise IndexError("Rows do not fit in the array")
+        self.array[offset : offset + len(values)] = values
+
     def to_2dlist(self):
-        to_list = list()
-        for i in range(self.shape[0]):
-            to_list.append(list())
-            for j in range(self.shape[1]):
-                to_list[i].append(self.__getitem__((i, j)))
-        return to_list
+        return self.get_rows()
 
-    def to_numpy(self, writeable=False):
+    def _numpy_view(self):
         if not has_numpy:
             raise ImportError
-        a = numpy.frombuffer(self.array.tobytes(), dtype=self.dtype)
+        a = numpy.frombuffer(self.array, dtype=self.dtype)
         a.shape = self.shape
-        if writeable:
-            import copy
+        return a
+
+    def to_numpy(self, writeable=False):
+        """
+        Get the array as a numpy array.
 
-            return copy.deepcopy(a)
+        :param writeable: If true, return a writeable copy of the data.  Otherwise a
+            read-only view sharing the storage of this object is returned.
+        :type writeable: bool
+        :returns: numpy.ndarray
+        """
+        a = self._numpy_view()
+        if writeable:
+            return a.copy()
+        a.flags.writeable = False
         return a
 
     def to_json(self):
@@ -719,9 +824,13 @@ class nexus_array:
         }
 
     def from_bytes(self, value):
-        self.array = array.array(self.dtype)
+        if self.dtype in array.typecodes:
+            typecode = self.dtype
+        else:
+            typecode = self.numpy_to_array_type(self.dtype)
+        self.array = array.array(typecode)
         self.array.frombytes(value)
-        self.shape = (len(self.array), 1)
+        self.shape = (len(self.array) // self._strlen, 1)
 
     def from_2dlist(self, value):
         dx = len(value)
@@ -733,17 +842,23 @@ class nexus_array:
         self.set_size(self.shape)
         # note: it is not possible/recommended to
         # guess the dtype from the elements here
-        for i in range(self.shape[0]):
-            for j in range(self.shape[1]):
-                self.__setitem__((i, j), value[i][j])
+        self.set_rows(value)
 
     def from_numpy(self, value):
         if not has_numpy:
             raise ImportError
-        self.dtype = self.numpy_to_na_type(value.dtype)
+        if value.dtype.kind == "S":
+            self.dtype = f"S{value.dtype.itemsize}"
+            self._strlen = value.dtype.itemsize
+        else:
+            self.dtype = self.numpy_to_na_type(value.dtype)
+            self._strlen = 1
+        # the array module always stores items in native byte order
+        value = numpy.ascontiguousarray(value, dtype=value.dtype.newbyteorder("="))
         self.array = array.array(self.numpy_to_array_type(self.dtype))
-        self.array.frombytes(value.tobytes())
+        self.array.frombytes(memoryview(value).cast("B"))
         self.shape = value.shape
+        self.set_size(self.shape)
 
     @classmethod
     def unit_test(cls):
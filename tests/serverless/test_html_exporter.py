@@ -30,6 +30,7 @@ from unittest.mock import patch
 import pytest
 
 from ansys.dynamicreporting.core.serverless.html_exporter import ServerlessReportExporter
+from ansys.dynamicreporting.core.utils.asset_cache import AssetCache
 
 # ----------------------------
 # helpers
@@ -586,3 +587,26 @@ def test_make_output_dirs_unknown_version_skips_version_specific_dirs(tmp_path:
             "media/images",
         ),
     )
+
+
+def test_copy_static_file_reuses_asset_cache(tmp_path: Path):
+    cache = AssetCache(directory=str(tmp_path / "cache"))
+    source = tmp_path / "static" / "website" / "images" / "nexus_logo.png"
+    _write(source, b"logo")
+
+    targets = []
+    for export in ("first", "second"):
+        exporter = _make_exporter_for_mathjax_detection(tmp_path)
+        exporter._output_dir = tmp_path / export
+        exporter._asset_cache = cache
+        exporter._copy_static_file("website/images/nexus_logo.png", "media/nexus_logo.png")
+        targets.append(tmp_path / export / "media" / "nexus_logo.png")
+
+    assert targets[1].read_bytes() == b"logo"
+    # the second export is a hard link to the cached copy
+    assert targets[1].stat().st_nlink == 2
+
+    # an updated static tree is not served from the cache
+    _write(source, b"new logo")
+    exporter._copy_static_file("website/images/nexus_logo.png", "media/nexus_logo.png")
+    assert targets[1].read_bytes() == b"new logo"
@@ -0,0 +1,100 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+
+import pytest
+
+from ansys.dynamicreporting.core.utils.asset_cache import AssetCache
+
+
+def _write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_store_and_materialize_links_content(tmp_path) -> None:
+    cache = AssetCache(directory=str(tmp_path / "cache"))
+    source = _write(tmp_path / "src" / "three.js", b"three")
+
+    cached = cache.store("271", "/ansys271/nexus/threejs/three.js", source)
+    target = tmp_path / "out" / "threejs" / "three.js"
+
+    assert cache.materialize("271", "/ansys271/nexus/threejs/three.js", str(target))
+    assert target.read_bytes() == b"three"
+    assert os.path.samefile(cached, target)
+
+
+def test_materialize_copies_when_linking_is_disabled(tmp_path) -> None:
+    cache = AssetCache(directory=str(tmp_path / "cache"), link=False)
+    cached = cache.store("271", "/static/a.png", _write(tmp_path / "a.png", b"png"))
+    target = tmp_path / "out" / "a.png"
+    _write(target, b"stale")
+
+    assert cache.materialize("271", "/static/a.png", str(target))
+    assert target.read_bytes() == b"png"
+    assert not os.path.samefile(cached, target)
+
+
+def test_lookup_is_keyed_by_version_path_and_stamp(tmp_path) -> None:
+    cache = AssetCache(directory=str(tmp_path / "cache"))
+    cache.store("271", "/static/a.png", _write(tmp_path / "a.png", b"png"), stamp="3-1")
+
+    assert cache.lookup("271", "/static/a.png", stamp="3-1") is not None
+    assert cache.lookup("271", "/static/a.png", stamp="3-2") is None
+    assert cache.lookup("261", "/static/a.png", stamp="3-1") is None
+    assert cache.lookup("271", "/static/b.png", stamp="3-1") is None
+    assert not cache.materialize("261", "/static/a.png", str(tmp_path / "out.png"))
+
+
+def test_identical_content_is_stored_once(tmp_path) -> None:
+    cache = AssetCache(directory=str(tmp_path / "cache"))
+    first = cache.store("271", "/static/website/images/close.png", _write(tmp_path / "x", b"x"))
+    second = cache.store("271", "/ansys271/nexus/images/close.png", _write(tmp_path / "y", b"x"))
+
+    assert first == second
+    assert cache.size() == 1
+
+
+def test_trim_evicts_least_recently_used_content(tmp_path) -> None:
+    cache = AssetCache(directory=str(tmp_path / "cache"), max_bytes=10)
+    old = cache.store("271", "/static/old", _write(tmp_path / "old", b"o" * 6))
+    new = cache.store("271", "/static/new", _write(tmp_path / "new", b"n" * 6))
+    os.utime(old, (1, 1))
+    os.utime(new, (2, 2))
+
+    cache.trim()
+
+    assert cache.size() == 6
+    assert cache.lookup("271", "/static/old") is None
+    assert cache.lookup("271", "/static/new") == new
+
+
+def test_clear_and_invalid_limit(tmp_path) -> None:
+    cache = AssetCache(directory=str(tmp_path / "cache"))
+    cache.store("271", "/static/a", _write(tmp_path / "a", b"a"))
+    cache.clear()
+    assert cache.size() == 0
+    assert cache.lookup("271", "/static/a") is None
+    with pytest.raises(ValueError):
+        AssetCache(directory=str(tmp_path), max_bytes=-1)
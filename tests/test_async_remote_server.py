@@ -0,0 +1,161 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import asyncio
+import io
+import json
+
+import pytest
+import requests
+
+from ansys.dynamicreporting.core.utils import report_objects as ro
+from ansys.dynamicreporting.core.utils.async_remote_server import AsyncServer
+
+httpx = pytest.importorskip("httpx")
+
+URL = "http://127.0.0.1:8000"
+
+
+def _server(handler, **kwargs):
+    return AsyncServer(
+        url=URL, username="nexus", password="cei", transport=httpx.MockTransport(handler), **kwargs
+    )
+
+
+def _api_version(request):
+    if request.url.path == "/item/api_version/":
+        return httpx.Response(200, json={"version": "1.0", "server_name": "test"})
+    return None
+
+
+def test_put_objects_pushes_levels_concurrently() -> None:
+    pushed = []
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        response = _api_version(request)
+        if response is not None:
+            return response
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        pushed.append(json.loads(request.content))
+        return httpx.Response(201)
+
+    async def run():
+        async with _server(handler, max_concurrency=2) as server:
+            root = server.server.create_template(name="root")
+            children = [server.server.create_template(name=f"c{i}", parent=root) for i in range(4)]
+            return await server.put_objects([*children, root])
+
+    assert asyncio.run(run()) == requests.codes.ok
+    assert [p["name"] for p in pushed][0] == "root"
+    assert len(pushed) == 5
+    # the concurrency limit holds
+    assert peak == 2
+
+
+def test_put_objects_streams_files_and_default_objects(tmp_path) -> None:
+    requests_seen = []
+
+    async def handler(request):
+        response = _api_version(request)
+        if response is not None:
+            return response
+        body = b""
+        async for chunk in request.stream:
+            body += chunk
+        requests_seen.append((request.method, request.url.path, body))
+        return httpx.Response(200)
+
+    scene = tmp_path / "scene.avz"
+    scene.write_bytes(b"x" * 100)
+
+    async def run():
+        async with _server(handler) as server:
+            await server.validate()
+            item = server.server.create_item(name="scene")
+            item.set_payload_scene(str(scene))
+            try:
+                return await server.put_objects(item)
+            finally:
+                item.fileobj.close()
+
+    assert asyncio.run(run()) == requests.codes.ok
+    paths = [path for _, path, _ in requests_seen]
+    assert paths[0].startswith("/session/") and paths[1].startswith("/dataset/")
+    assert paths[2].startswith("/item/")
+    # the last request uploads the file
+    assert b"x" * 100 in requests_seen[-1][2]
+
+
+def test_get_and_delete_objects() -> None:
+    root = ro.TemplateREST()
+    root.name = "root"
+    listing = [root.get_url_data()[1] | {"date": "2024-01-01T00:00:00Z"}]
+    deleted = []
+
+    async def handler(request):
+        response = _api_version(request)
+        if response is not None:
+            return response
+        if request.method == "DELETE":
+            deleted.append(request.url.path)
+            return httpx.Response(204)
+        return httpx.Response(200, json=listing)
+
+    async def run():
+        async with _server(handler) as server:
+            templates = await server.get_objects(objtype=ro.TemplateREST)
+            ret = await server.del_objects(templates)
+            return templates, ret
+
+    templates, ret = asyncio.run(run())
+    assert [t.name for t in templates] == ["root"]
+    assert templates[0].guid == root.guid
+    assert ret == requests.codes.ok
+    assert deleted == [f"/reports/api_detail/{root.guid}"]
+
+
+def test_get_file_logs_in_and_streams() -> None:
+    async def handler(request):
+        if request.url.path == "/login/":
+            if request.method == "GET":
+                return httpx.Response(200, headers={"Set-Cookie": "csrftoken=abc; Path=/"})
+            return httpx.Response(200)
+        return httpx.Response(200, content=b"payload" * 10)
+
+    async def run():
+        async with _server(handler) as server:
+            item = ro.ItemREST()
+            item.fileurl = "/media/file.bin"
+            out = io.BytesIO()
+            status = await server.get_file(item, out, chunk_size=4)
+            return status, out.getvalue()
+
+    status, data = asyncio.run(run())
+    assert status == requests.codes.ok
+    assert data == b"payload" * 10
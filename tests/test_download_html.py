@@ -26,6 +26,7 @@ from unittest.mock import MagicMock, patch
 import requests
 
 from ansys.dynamicreporting.core.compatibility import DEFAULT_STATIC_ASSET_VERSION
+from ansys.dynamicreporting.core.utils.asset_cache import AssetCache
 from ansys.dynamicreporting.core.utils import report_download_html as rd
 from ansys.dynamicreporting.core.utils.html_export_constants import (
     MATHJAX_2X_FILES,
@@ -117,11 +118,12 @@ def _build_mathjax_url(source_rel_path: str) -> str:
     return f"http://localhost:8000/static/{source_rel_path}"
 
 
-def _make_response(status_code: int, content: bytes = b"asset") -> MagicMock:
+def _make_response(status_code: int, content: bytes = b"asset", headers=None) -> MagicMock:
     """Create a small fake ``requests`` response for MathJax download tests."""
     response = MagicMock()
     response.status_code = status_code
     response.content = content
+    response.headers = headers or {}
     # Mock iter_content to properly yield chunks like the real requests library
     response.iter_content = lambda chunk_size: iter([content]) if content else iter([])
     return response
@@ -160,7 +162,7 @@ def test_detect_mathjax_version_4x(tmp_path: Path) -> None:
     downloader = _make_downloader(tmp_path)
     mock_resp = MagicMock()
     mock_resp.status_code = requests.codes.ok
-    with patch("requests.head", return_value=mock_resp) as mock_head:
+    with patch("requests.Session.head", return_value=mock_resp) as mock_head:
         version = downloader._detect_mathjax_version()
     assert version == "4"
     # Only one HEAD call needed once the 4.x sentinel matches
@@ -179,7 +181,7 @@ def test_detect_mathjax_version_2x(tmp_path: Path) -> None:
             resp.status_code = requests.codes.ok
         return resp
 
-    with patch("requests.head", side_effect=_head_side_effect):
+    with patch("requests.Session.head", side_effect=_head_side_effect):
         version = downloader._detect_mathjax_version()
     assert version == "2"
 
@@ -189,7 +191,7 @@ def test_detect_mathjax_version_405_returns_unknown(tmp_path: Path) -> None:
     downloader = _make_downloader(tmp_path)
     mock_resp = MagicMock()
     mock_resp.status_code = 405
-    with patch("requests.head", return_value=mock_resp):
+    with patch("requests.Session.head", return_value=mock_resp):
         version = downloader._detect_mathjax_version()
     assert version == "unknown"
 
@@ -199,7 +201,7 @@ def test_detect_mathjax_version_403_returns_unknown(tmp_path: Path) -> None:
     downloader = _make_downloader(tmp_path)
     mock_resp = MagicMock()
     mock_resp.status_code = 403
-    with patch("requests.head", return_value=mock_resp):
+    with patch("requests.Session.head", return_value=mock_resp):
         version = downloader._detect_mathjax_version()
     assert version == "unknown"
 
@@ -210,7 +212,7 @@ def test_detect_mathjax_version_does_not_follow_redirects(tmp_path: Path) -> Non
     mock_resp = MagicMock()
     mock_resp.status_code = 302
 
-    with patch("requests.head", return_value=mock_resp) as mock_head:
+    with patch("requests.Session.head", return_value=mock_resp) as mock_head:
         version = downloader._detect_mathjax_version()
 
     assert version == "unknown"
@@ -222,7 +224,7 @@ def test_detect_mathjax_version_does_not_follow_redirects(tmp_path: Path) -> Non
 def test_detect_mathjax_version_connection_error_returns_unknown(tmp_path: Path) -> None:
     """HEAD raising ConnectionError for all sentinels -> "unknown"."""
     downloader = _make_downloader(tmp_path)
-    with patch("requests.head", side_effect=requests.ConnectionError("unreachable")):
+    with patch("requests.Session.head", side_effect=requests.ConnectionError("unreachable")):
         version = downloader._detect_mathjax_version()
     assert version == "unknown"
 
@@ -230,7 +232,7 @@ def test_detect_mathjax_version_connection_error_returns_unknown(tmp_path: Path)
 def test_detect_mathjax_version_timeout_returns_unknown(tmp_path: Path) -> None:
     """HEAD raising Timeout for all sentinels -> "unknown"."""
     downloader = _make_downloader(tmp_path)
-    with patch("requests.head", side_effect=requests.Timeout("timed out")):
+    with patch("requests.Session.head", side_effect=requests.Timeout("timed out")):
         version = downloader._detect_mathjax_version()
     assert version == "unknown"
 
@@ -238,7 +240,7 @@ def test_detect_mathjax_version_timeout_returns_unknown(tmp_path: Path) -> None:
 def test_detect_mathjax_version_request_exception_returns_unknown(tmp_path: Path) -> None:
     """HEAD raising RequestException for all sentinels should return unknown."""
     downloader = _make_downloader(tmp_path)
-    with patch("requests.head", side_effect=requests.RequestException("generic failure")):
+    with patch("requests.Session.head", side_effect=requests.RequestException("generic failure")):
         version = downloader._detect_mathjax_version()
     assert version == "unknown"
 
@@ -281,7 +283,7 @@ def test_download_uses_report_html_for_mathjax_directory_selection(tmp_path) ->
         '<script src="/static/website/scripts/mathjax/MathJax.js"></script>',
     )
 
-    with patch("requests.get", return_value=html_response):
+    with patch("requests.Session.get", return_value=html_response):
         with patch.object(
             downloader,
             "_detect_mathjax_version_from_installation",
@@ -317,7 +319,7 @@ def test_download_special_files_only_requests_detected_4x_assets(tmp_path) -> No
     with patch.object(downloader, "_detect_mathjax_version", return_value="4"):
         # Stub unrelated asset downloads so this test only exercises MathJax behavior.
         with patch.object(downloader, "_download_static_files"):
-            with patch("requests.get", side_effect=_get_side_effect):
+            with patch("requests.Session.get", side_effect=_get_side_effect):
                 with patch("builtins.print") as mock_print:
                     downloader._download_special_files()
 
@@ -343,7 +345,7 @@ def test_download_special_files_writes_2x_loader_and_ui_assets(tmp_path) -> None
     with patch.object(downloader, "_detect_mathjax_version", return_value="2"):
         # Stub unrelated asset downloads so this test only exercises MathJax behavior.
         with patch.object(downloader, "_download_static_files"):
-            with patch("requests.get", side_effect=_get_side_effect):
+            with patch("requests.Session.get", side_effect=_get_side_effect):
                 with patch("builtins.print") as mock_print:
                     downloader._download_special_files()
 
@@ -481,3 +483,184 @@ def test_download_unknown_version_skips_all_version_specific_mathjax_dirs(tmp_pa
             "media/images",
         ),
     )
+
+
+def test_download_prefetches_assets_through_shared_session(tmp_path) -> None:
+    """Assets are fetched once each via the session and substituted in document order."""
+    base_url = "http://localhost:8000"
+    html = (
+        '<img src="/media/g1/proxy.png">'
+        '<img src="/media/g2/proxy.png">'
+        '<a href="/media/notes.txt">notes</a>'
+        '<img src="/media/g1/proxy.png">'
+    )
+    assets = {
+        f"{base_url}/media/g1/proxy.png": b"first",
+        f"{base_url}/media/g2/proxy.png": b"second",
+        f"{base_url}/media/notes.txt": b"notes",
+    }
+    session = MagicMock()
+
+    def _get_side_effect(url, **kwargs):
+        if url in assets:
+            return _make_response(requests.codes.ok, content=assets[url])
+        return _make_text_response(requests.codes.ok, html)
+
+    session.get.side_effect = _get_side_effect
+    downloader = rd.ReportDownloadHTML(
+        url=f"{base_url}/reports/report_display/",
+        directory=str(tmp_path),
+        session=session,
+        max_workers=4,
+    )
+
+    with patch.object(downloader, "_detect_mathjax_version", return_value="4"):
+        with patch.object(downloader, "_download_special_files"):
+            downloader._download()
+
+    requested = [c.args[0] for c in session.get.call_args_list]
+    assert sorted(url for url in requested if url in assets) == sorted(assets)
+    output = (tmp_path / "index.html").read_text()
+    assert output == (
+        '<img src="./media/proxy.png">'
+        '<img src="./media/1_proxy.png">'
+        '<a href="./media/notes.txt">notes</a>'
+        '<img src="./media/proxy.png">'
+    )
+    assert (tmp_path / "media" / "proxy.png").read_bytes() == b"first"
+    assert (tmp_path / "media" / "1_proxy.png").read_bytes() == b"second"
+    # the prefetch spool directory is removed once the HTML has been rewritten
+    assert not [p for p in tmp_path.iterdir() if p.name.startswith(".prefetch_")]
+
+
+def test_download_special_files_reraises_worker_errors(tmp_path) -> None:
+    """Errors raised on the download pool surface from _download_special_files()."""
+    session = MagicMock()
+    session.get.side_effect = requests.ConnectionError("unreachable")
+    downloader = rd.ReportDownloadHTML(
+        url="http://localhost:8000/reports/report_display/",
+        directory=str(tmp_path),
+        session=session,
+    )
+
+    with patch.object(downloader, "_detect_mathjax_version", return_value="4"):
+        try:
+            downloader._download_special_files()
+            success = False
+        except requests.ConnectionError:
+            success = True
+    assert success
+
+
+def _make_chunked_response(chunks: list[bytes]) -> MagicMock:
+    """Create a fake streamed response that yields ``chunks`` once."""
+    response = MagicMock()
+    response.status_code = requests.codes.ok
+    response.headers = {}
+    response.iter_content = lambda chunk_size: iter(chunks)
+    return response
+
+
+def test_get_file_streams_non_inlined_media_to_disk(tmp_path) -> None:
+    """Plain media is written chunk by chunk to the media directory."""
+    chunks = [bytes([i]) * 1000 for i in range(5)]
+    session = MagicMock()
+    session.get.return_value = _make_chunked_response(chunks)
+    downloader = rd.ReportDownloadHTML(
+        url="http://localhost:8000/reports/report_display/",
+        directory=str(tmp_path),
+        session=session,
+    )
+
+    result = downloader._get_file("/media/g1_movie.mp4?x=1", "/media/g1_movie.mp4")
+
+    assert result == "./media/g1_movie.mp4"
+    assert (tmp_path / "media" / "g1_movie.mp4").read_bytes() == b"".join(chunks)
+
+
+def test_get_file_inlines_scene_within_budget(tmp_path) -> None:
+    """Scene files that fit the inline budget become data URIs."""
+    session = MagicMock()
+    session.get.return_value = _make_chunked_response([b"abc", b"def"])
+    downloader = rd.ReportDownloadHTML(
+        url="http://localhost:8000/reports/report_display/",
+        directory=str(tmp_path),
+        session=session,
+    )
+
+    result = downloader._get_file("/media/g1_scene.avz", "/media/g1_scene.avz")
+
+    assert result == "data:application/octet-stream;base64,YWJjZGVm"
+    assert downloader._total_data_uri_size == 8
+    assert not (tmp_path / "media" / "g1_scene.avz").exists()
+
+
+def test_get_file_spills_over_budget_scene_to_disk(tmp_path) -> None:
+    """A scene larger than the inline budget stops buffering and is saved as a file."""
+    session = MagicMock()
+    session.get.return_value = _make_chunked_response([b"x" * 10] * 10)
+    downloader = rd.ReportDownloadHTML(
+        url="http://localhost:8000/reports/report_display/",
+        directory=str(tmp_path),
+        session=session,
+    )
+    downloader._max_inline_size = 40
+
+    result = downloader._get_file("/media/g1_scene.avz", "/media/g1_scene.avz", inline=True)
+
+    assert result == "./media/g1_scene.avz"
+    assert downloader._inline_size_exception
+    assert downloader._total_data_uri_size == 0
+    # the buffered head and the rest of the stream both end up in the file
+    assert (tmp_path / "media" / "g1_scene.avz").read_bytes() == b"x" * 100
+
+
+def test_download_static_files_reuse_asset_cache(tmp_path) -> None:
+    """A later export links cached static files once the server confirms them."""
+    cache = AssetCache(directory=str(tmp_path / "cache"))
+    session = MagicMock()
+    headers = {"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+    session.get.return_value = _make_response(requests.codes.ok, content=b"js", headers=headers)
+    files = ["js-inflate.js", "js-unzip.js"]
+
+    def export(name, url="http://localhost:8000/reports/report_display/"):
+        downloader = rd.ReportDownloadHTML(
+            url=url,
+            directory=str(tmp_path / name),
+            session=session,
+            ansys_version=271,
+            asset_cache=cache,
+        )
+        downloader._download_static_files(files, "/ansys271/nexus/utils/", "utils", "support")
+
+    export("first")
+    assert session.get.call_count == len(files)
+
+    # the cached copies are revalidated with conditional requests
+    session.get.reset_mock()
+    session.get.return_value = _make_response(requests.codes.not_modified, content=b"")
+    export("second")
+    for call in session.get.call_args_list:
+        assert call[1]["headers"] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+        }
+    for f in files:
+        assert (tmp_path / "second" / "utils" / f).read_bytes() == b"js"
+
+    # a patched server sends new content, which replaces the cached copy
+    session.get.return_value = _make_response(
+        requests.codes.ok, content=b"patched", headers={"ETag": '"v2"'}
+    )
+    export("third")
+    for f in files:
+        assert (tmp_path / "third" / "utils" / f).read_bytes() == b"patched"
+    assert cache.get_stamp(271, "http://localhost:8000/ansys271/nexus/utils/js-inflate.js") == {
+        "etag": '"v2"',
+        "last_modified": None,
+    }
+
+    # another server of the same version does not share the entries
+    session.get.reset_mock()
+    export("other", url="http://otherhost:8000/reports/report_display/")
+    assert all("headers" not in call[1] for call in session.get.call_args_list)
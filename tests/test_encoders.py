@@ -67,3 +67,71 @@ def test_dict() -> None:
 def test_nparray() -> None:
     a = en.PayloaddataEncoder()
     assert isinstance(a.default(obj=np.ndarray(shape=(1, 1))), list)
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.arange(12, dtype="f8").reshape(3, 4) / 7.0,
+        np.arange(6, dtype=">i4").reshape(2, 3),
+        np.array([[b"a", b"bc"], [b"def", b""]], dtype="S3"),
+    ],
+)
+def test_binary_array_round_trip(array) -> None:
+    encoded = en.encode_binary_array(array)
+    assert en.is_binary_array(encoded)
+    assert encoded["dtype"][0] in "<|"
+    decoded = en.decode_binary_array(encoded)
+    assert decoded.flags.writeable
+    np.testing.assert_array_equal(decoded, array)
+
+
+def test_binary_array_without_numpy(monkeypatch) -> None:
+    floats = en.encode_binary_array(np.array([[1.5, 2.0], [3.0, 4.25]]))
+    strings = en.encode_binary_array(np.array([[b"x", b"yz"]], dtype="S2"))
+    halves = en.encode_binary_array(np.array([[0.5, -2.0]], dtype=">f2"))
+    monkeypatch.setattr(en, "has_numpy", False)
+    assert en.decode_binary_array(floats) == [[1.5, 2.0], [3.0, 4.25]]
+    assert en.decode_binary_array(strings) == [["x", "yz"]]
+    assert halves["dtype"] == "<f2"
+    assert en.decode_binary_array(halves) == [[0.5, -2.0]]
+
+
+def test_binary_array_falls_back_for_other_types() -> None:
+    assert en.encode_binary_array(np.array([["a", None]], dtype=object)) is None
+    assert en.encode_binary_array([[1.0, 2.0]]) is None
+    # no struct format to decode it without numpy
+    assert en.encode_binary_array(np.array([[1 + 2j]])) is None
+
+
+@pytest.mark.parametrize("backend", en.JSON_BACKENDS)
+def test_dumps_backends(backend, monkeypatch) -> None:
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(en, "_json_backend", en.get_json_backend())
+    en.set_json_backend(backend)
+    obj = {
+        "date": datetime.datetime(2024, 5, 1, 12, 30, tzinfo=datetime.timezone.utc),
+        "guid": uuid.UUID(int=1),
+        "array": np.arange(4, dtype="i4").reshape(2, 2),
+        "strings": np.array([b"ab", b"c"], dtype="S2"),
+        "nexus": ru.nexus_array(),
+        "bytes": b"x",
+    }
+    assert en.json.loads(en.dumps(obj, sort_keys=True)) == {
+        "array": [[0, 1], [2, 3]],
+        "bytes": "x",
+        "date": "2024-05-01T12:30:00Z",
+        "guid": "00000000-0000-0000-0000-000000000001",
+        "nexus": [[0.0]],
+        "strings": ["ab", "c"],
+    }
+
+
+def test_set_json_backend_validates(monkeypatch) -> None:
+    with pytest.raises(ValueError):
+        en.set_json_backend("yaml")
+    monkeypatch.setattr(en, "has_orjson", False)
+    with pytest.raises(ImportError):
+        en.set_json_backend("orjson")
+    assert en.get_json_backend() == "json"
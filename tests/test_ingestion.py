@@ -0,0 +1,132 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import json
+from unittest.mock import Mock
+
+import numpy as np
+import requests
+
+from ansys.dynamicreporting.core.utils import report_objects as ro
+from ansys.dynamicreporting.core.utils.ingestion import IngestionRunner
+
+
+def _templates(n):
+    templates = []
+    for i in range(n):
+        template = ro.TemplateREST()
+        template.name = f"T{i}"
+        templates.append(template)
+    return templates
+
+
+def test_run_resumes_from_journal(tmp_path) -> None:
+    journal = tmp_path / "ingest.journal"
+    templates = _templates(5)
+    server = Mock()
+    # the connection drops on the second batch
+    server.put_objects.side_effect = [requests.codes.ok, requests.ConnectionError("down")] + [
+        requests.ConnectionError("down")
+    ] * 10
+    runner = IngestionRunner(
+        server, str(journal), batch_size=2, max_retries=1, backoff_factor=0, key=lambda t: t.name
+    )
+
+    result = runner.run(templates)
+    assert result["pushed"] == 2
+    assert set(result["failed"]) == {"T2", "T3", "T4"}
+    pushed, failed = runner.load_journal()
+    assert pushed == {"T0", "T1"}
+    assert set(failed) == {"T2", "T3", "T4"}
+
+    # the next run only pushes what is left
+    server.put_objects.side_effect = None
+    server.put_objects.return_value = requests.codes.ok
+    server.put_objects.reset_mock()
+    result = runner.run(templates)
+    assert result == {"pushed": 3, "skipped": 2, "failed": {}}
+    names = [t.name for call in server.put_objects.call_args_list for t in call[0][0]]
+    assert names == ["T2", "T3", "T4"]
+    assert runner.load_journal() == ({"T0", "T1", "T2", "T3", "T4"}, {})
+
+
+def test_run_retries_transient_errors_only(tmp_path) -> None:
+    journal = tmp_path / "ingest.journal"
+    templates = _templates(2)
+    statuses = {
+        "T0": [requests.codes.service_unavailable, requests.codes.ok],
+        "T1": [requests.codes.forbidden, requests.codes.ok],
+    }
+
+    def fake_put_objects(objects, max_workers=None):
+        if len(objects) > 1:
+            return requests.codes.service_unavailable
+        return statuses[objects[0].name].pop(0)
+
+    server = Mock()
+    server.put_objects.side_effect = fake_put_objects
+    runner = IngestionRunner(server, str(journal), backoff_factor=0, key=lambda t: t.name)
+
+    result = runner.run(templates)
+    assert result["pushed"] == 1
+    assert result["failed"] == {"T1": "HTTP status 403"}
+    # a partly written last record is ignored
+    with open(journal, "a", encoding="utf-8") as f:
+        f.write('{"key": "T1", "sta')
+    assert runner.load_journal()[0] == {"T0"}
+    lines = journal.read_text().splitlines()
+    assert json.loads(lines[0]) == {"key": "T0", "status": "pushed"}
+
+    statuses["T1"] = [requests.codes.ok]
+    assert runner.run(templates) == {"pushed": 1, "skipped": 1, "failed": {}}
+    assert runner.load_journal() == ({"T0", "T1"}, {})
+
+
+def test_rerun_with_rebuilt_objects_resumes(tmp_path) -> None:
+    journal = tmp_path / "ingest.journal"
+
+    def build():
+        # every run builds new objects, with new GUIDs and dates
+        templates = _templates(3) + _templates(1)
+        item = ro.ItemREST()
+        item.name = "table"
+        item.set_payload_table_values(np.arange(4, dtype="f8").reshape(2, 2))
+        return templates + [item]
+
+    server = Mock()
+    server.put_objects.side_effect = [requests.codes.ok, requests.ConnectionError("down")] + [
+        requests.ConnectionError("down")
+    ] * 10
+    runner = IngestionRunner(server, str(journal), batch_size=2, max_retries=0, backoff_factor=0)
+    result = runner.run(build())
+    assert result["pushed"] == 2 and len(result["failed"]) == 3
+    # the second "T0" has the same content as the first and is numbered
+    assert any(key.endswith("#2") for key in result["failed"])
+
+    server.put_objects.side_effect = None
+    server.put_objects.return_value = requests.codes.ok
+    server.put_objects.reset_mock()
+    assert runner.run(build()) == {"pushed": 3, "skipped": 2, "failed": {}}
+    names = [o.name for call in server.put_objects.call_args_list for o in call[0][0]]
+    assert names == ["T2", "T0", "table"]
+    assert runner.run(build()) == {"pushed": 0, "skipped": 5, "failed": {}}
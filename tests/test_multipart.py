@@ -0,0 +1,113 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from email.parser import BytesParser
+import io
+
+import pytest
+import requests
+
+from ansys.dynamicreporting.core.utils.multipart import MultipartFileEncoder
+
+
+def _parse(body, content_type):
+    message = BytesParser().parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode("utf-8") + body
+    )
+    return message.get_payload()
+
+
+def test_streams_file_in_chunks() -> None:
+    data = bytes(range(256)) * 40
+    progress = []
+    encoder = MultipartFileEncoder(
+        "file",
+        "scene.avz",
+        io.BytesIO(data),
+        chunk_size=4096,
+        progress=lambda *a: progress.append(a),
+    )
+    chunks = list(encoder)
+    body = b"".join(chunks)
+
+    assert len(encoder) == len(body)
+    assert max(len(c) for c in chunks) <= 4096
+    assert progress == [(4096, len(data)), (8192, len(data)), (len(data), len(data))]
+    parts = _parse(body, encoder.content_type)
+    assert len(parts) == 1
+    assert parts[0].get_param("filename", header="content-disposition") == "scene.avz"
+    assert parts[0].get_param("name", header="content-disposition") == "file"
+    assert parts[0].get_payload(decode=True) == data
+    # iterating again (e.g. on a retry) produces the same body
+    assert b"".join(encoder) == body
+
+
+def test_unknown_size_uses_chunked_transfer() -> None:
+    class Stream:
+        def __init__(self, data):
+            self._buffer = io.BytesIO(data)
+
+        def read(self, size):
+            return self._buffer.read(size)
+
+    encoder = MultipartFileEncoder("file", "movie.mp4", Stream(b"abc"))
+    assert encoder.file_size is None
+    assert len(encoder) == 0
+    prepared = requests.Request(
+        "PUT", "http://127.0.0.1:8000/item/api_payload/x", data=encoder
+    ).prepare()
+    assert prepared.headers["Transfer-Encoding"] == "chunked"
+    assert _parse(b"".join(encoder), encoder.content_type)[0].get_payload(decode=True) == b"abc"
+
+
+def test_known_size_sets_content_length() -> None:
+    encoder = MultipartFileEncoder("file", "file.txt", io.BytesIO(b"hello"))
+    prepared = requests.Request(
+        "PUT", "http://127.0.0.1:8000/item/api_payload/x", data=encoder
+    ).prepare()
+    assert prepared.headers["Content-Length"] == str(len(encoder))
+
+
+def test_invalid_chunk_size() -> None:
+    with pytest.raises(ValueError, match="positive integer"):
+        MultipartFileEncoder("file", "file.txt", io.BytesIO(b""), chunk_size=0)
+
+
+def test_stream_without_seek_is_sent_once() -> None:
+    encoder = MultipartFileEncoder("file", "file.txt", io.BytesIO(b"abc"))
+    assert encoder.rewindable
+    assert b"".join(encoder) == b"".join(encoder)
+
+    class Stream:
+        len = 3
+
+        def __init__(self, data):
+            self._buffer = io.BytesIO(data)
+
+        def read(self, size):
+            return self._buffer.read(size)
+
+    encoder = MultipartFileEncoder("file", "file.txt", Stream(b"abc"))
+    assert not encoder.rewindable
+    assert b"abc" in b"".join(encoder)
+    with pytest.raises(io.UnsupportedOperation):
+        b"".join(encoder)
@@ -25,6 +25,7 @@ import json
 import os
 import uuid
 
+import numpy as np
 import pytest
 
 from ansys.dynamicreporting.core.exceptions import TemplateDoesNotExist, TemplateReorderOutOfBounds
@@ -272,6 +273,72 @@ def test_table_payload_item() -> None:
     assert succ1 and succ2
 
 
+@pytest.mark.ado_test
+def test_table_string_cells_are_validated(monkeypatch) -> None:
+    monkeypatch.setenv("ADR_VALIDATION_BETAFLAG_ANSYS", "1")
+    a = ro.ItemREST()
+    labels = np.array([[b"Phase 1", b"Phase 2"] * 500] * 100, dtype="S20")
+    a.set_payload_table_values(labels)
+    assert a.get_payload_content()["array"].shape == (100, 1000)
+
+    with pytest.raises(ValueError, match="contains HTML content"):
+        a.set_payload_table_values([["ok", "<script>bad</script>"]], dtype="S30")
+    with pytest.raises(ValueError, match="valid UTF-8"):
+        a.set_payload_table_values(np.array([[b"\xff"]], dtype="S1"))
+
+    # the cells are only checked with the validation flag
+    monkeypatch.delenv("ADR_VALIDATION_BETAFLAG_ANSYS")
+    a.set_payload_table_values([["ok", "<script>bad</script>"]], dtype="S30")
+    a.set_payload_table_values(np.array([[b"\xff\xfe"]], dtype="S2"))
+    assert a.get_payload_content()["array"][0, 0] == b"\xff\xfe"
+
+
+@pytest.mark.ado_test
+def test_table_payload_readonly_view() -> None:
+    a = ro.ItemREST()
+    array = np.arange(6, dtype="f8").reshape(3, 2)
+    a.set_payload_table_values(array)
+    view = a.get_payload_content(readonly=True)["array"]
+    assert np.shares_memory(view, array) and not view.flags.writeable
+    with pytest.raises(ValueError):
+        view[0, 0] = 1.0
+
+    # arrays received as lists are converted once
+    b = ro.ItemREST()
+    b.from_json({"type": "table", "payloaddata": {"array": [[1.0, 2.0]], "dtype": "f8"}})
+    first = b.get_payload_content(readonly=True)["array"]
+    second = b.get_payload_content(readonly=True)["array"]
+    assert np.shares_memory(first, second) and second.tolist() == [[1.0, 2.0]]
+    assert b.get_payload_content(as_list=True)["array"] == [[1.0, 2.0]]
+
+    # the cached conversion is not handed out by plain reads
+    mutable = b.get_payload_content()["array"]
+    assert not np.shares_memory(mutable, first)
+    mutable[0, 0] = 9.0
+    assert b.get_payload_content()["array"].tolist() == [[1.0, 2.0]]
+    assert b.get_payload_content(readonly=True)["array"].tolist() == [[1.0, 2.0]]
+    assert b.payloaddata["array"] == [[1.0, 2.0]]
+
+    # replacing the payload drops the cached conversion
+    b.set_payload_table_values(np.zeros((1, 1)))
+    assert b.get_payload_content(readonly=True)["array"].tolist() == [[0.0]]
+
+
+@pytest.mark.ado_test
+def test_table_payload_row_iterator() -> None:
+    a = ro.ItemREST()
+    array = np.arange(10, dtype="f8").reshape(5, 2)
+    a.set_payload_table_values(array)
+    assert list(a.iter_payload_rows(chunk_size=2)) == array.tolist()
+    nexus = ro.report_utils.nexus_array(dtype="f8")
+    nexus.from_2dlist([[1.0], [2.0], [3.0]])
+    a._payloaddata["array"] = nexus
+    assert list(a.iter_payload_rows(chunk_size=2)) == [[1.0], [2.0], [3.0]]
+    a.set_payload_string(s="text")
+    with pytest.raises(ValueError):
+        a.iter_payload_rows()
+
+
 @pytest.mark.ado_test
 def test_string_payload_item() -> None:
     a = ro.ItemREST()
@@ -2154,3 +2221,28 @@ def test_item_payload(adr_service_query) -> None:
         print(f"Exception received: {str(e)}")
         succ = False
     assert succ
+
+
+@pytest.mark.ado_test
+def test_item_deferred_payload() -> None:
+    calls = []
+
+    def loader(item):
+        calls.append(item)
+        return "loaded"
+
+    a = ro.ItemREST()
+    a.type = ro.ItemREST.type_str
+    a.set_payload_loader(loader)
+    assert a.payload_deferred
+    assert a.payloaddata == "loaded"
+    assert a.get_payload_content() == "loaded"
+    assert calls == [a]
+    assert not a.payload_deferred
+
+    b = ro.ItemREST()
+    b.set_payload_loader(loader)
+    b.set_payload_string("mine")
+    assert not b.payload_deferred
+    assert b.payloaddata == "mine"
+    assert calls == [a]
@@ -20,15 +20,22 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import gzip
+import http.server
+import io
+import json
 import logging
 from os import environ
 from pathlib import Path
 from random import randint
 import re
 import sys
+import threading
 import uuid
 from unittest.mock import Mock
+import zlib
 
+import numpy as np
 import pytest
 import requests
 
@@ -37,6 +44,7 @@ from ansys.dynamicreporting.core.compatibility import AUTO_DETECT_INSTALL_VERSIO
 from ansys.dynamicreporting.core.constants import DOCKER_DEV_REPO_URL
 from ansys.dynamicreporting.core.exceptions import ADRException
 from ansys.dynamicreporting.core.utils import exceptions as e
+from ansys.dynamicreporting.core.utils import push_queue
 from ansys.dynamicreporting.core.utils import report_objects as ro
 from ansys.dynamicreporting.core.utils import report_remote_server as r
 from ansys.dynamicreporting.core.utils.exceptions import BadRequestError, DBCreationFailedError
@@ -1865,3 +1873,903 @@ def test_put_objects_bad_request_se_application(adr_service_create) -> bool:
         BadRequestError, match=re.escape("Ensure application has no more than 40 characters.")
     ):
         server.put_objects(test_session)
+
+
+def _mock_server(**api_info):
+    """Build a server whose HTTP session is a mock and whose api_version is already known."""
+    server = r.Server(url="http://127.0.0.1:8000", username="nexus", password="cei")
+    server._http_session = Mock()
+    server._api_info = {"version": "1.0", **api_info}
+    server._api_version = float(server._api_info["version"])
+    return server
+
+
+def test_put_objects_bulk_batches_requests() -> None:
+    server = _mock_server(bulk_push=True)
+    templates = [server.create_template(name=f"T{i}") for i in range(3)]
+
+    def fake_post(uri, auth=None, data=None, headers=None):
+        entries = json.loads(data)["objects"]
+        results = [{"status": requests.codes.created} for _ in entries]
+        results[-1] = {"status": requests.codes.bad_request, "detail": "bad name"}
+        return Mock(status_code=requests.codes.ok, json=Mock(return_value=results))
+
+    server._http_session.post.side_effect = fake_post
+    status = server.put_objects_bulk(templates, batch_size=2)
+
+    assert server._http_session.post.call_count == 2
+    assert server._http_session.post.call_args[0][0] == "http://127.0.0.1:8000/api/bulk-push/"
+    assert status == {
+        templates[0].guid: requests.codes.ok,
+        templates[1].guid: requests.codes.bad_request,
+        templates[2].guid: requests.codes.bad_request,
+    }
+    assert server.get_last_error() == "bad name"
+    server._http_session.put.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "results",
+    [{"detail": "wrapped"}, [{"status": requests.codes.created}], ["ok", "ok"], ValueError()],
+)
+def test_put_objects_bulk_fails_batch_on_unexpected_response(results) -> None:
+    server = _mock_server(bulk_push=True)
+    templates = [server.create_template(name=f"T{i}") for i in range(2)]
+    response = Mock(status_code=requests.codes.ok, text="unexpected")
+    if isinstance(results, Exception):
+        response.json.side_effect = results
+    else:
+        response.json.return_value = results
+    server._http_session.post.return_value = response
+
+    status = server.put_objects_bulk(templates)
+
+    assert status == {t.guid: requests.codes.bad_gateway for t in templates}
+    assert server.get_last_error() == "unexpected"
+    assert server.push_digests == {}
+
+
+def test_put_objects_bulk_falls_back_without_server_support() -> None:
+    server = _mock_server()
+    templates = [server.create_template(name=f"T{i}") for i in range(3)]
+    server._http_session.put.return_value = Mock(status_code=requests.codes.ok)
+
+    status = server.put_objects_bulk(templates, batch_size=2)
+
+    assert status == {t.guid: requests.codes.ok for t in templates}
+    assert server._http_session.put.call_count == 3
+    server._http_session.post.assert_not_called()
+    with pytest.raises(ValueError, match="positive integer"):
+        server.put_objects_bulk(templates, batch_size=0)
+
+
+def test_get_push_levels_orders_parents_first() -> None:
+    server = r.Server()
+    root = server.create_template(name="root")
+    child = server.create_template(name="child", parent=root)
+    grandchild = server.create_template(name="grandchild", parent=child)
+    item = ro.ItemREST()
+    dataset = ro.DatasetREST()
+
+    levels = r.Server._get_push_levels([grandchild, item, child, dataset, root])
+
+    assert levels == [[dataset], [item, root], [child], [grandchild]]
+
+
+def test_put_and_del_objects_with_workers() -> None:
+    server = _mock_server()
+    root = server.create_template(name="root")
+    children = [server.create_template(name=f"C{i}", parent=root) for i in range(4)]
+    pushed = []
+
+    def fake_put(uri, **kwargs):
+        pushed.append(uri)
+        return Mock(status_code=requests.codes.ok)
+
+    server._http_session.put.side_effect = fake_put
+    assert server.put_objects(children + [root], max_workers=4) == requests.codes.ok
+    assert len(pushed) == 5
+    assert root.guid in pushed[0]
+
+    server._http_session.delete.return_value = Mock(status_code=requests.codes.no_content)
+    assert server.del_objects(children + [root], max_workers=4) == requests.codes.ok
+    assert root.guid in server._http_session.delete.call_args_list[-1][0][0]
+
+
+def test_put_objects_streams_file_payloads(tmp_path) -> None:
+    server = _mock_server()
+    scene = tmp_path / "scene.avz"
+    scene.write_bytes(b"x" * 1000)
+    item = server.create_item(name="scene")
+    item.set_payload_scene(str(scene))
+    server._default_session_digest = r.Server.get_object_digest(server.get_default_session())
+    server._default_dataset_digest = r.Server.get_object_digest(server.get_default_dataset())
+    server._http_session.put.return_value = Mock(status_code=requests.codes.ok)
+    progress = []
+
+    ret = server.put_objects(item, upload_progress=lambda *args: progress.append(args))
+
+    assert ret == requests.codes.ok
+    file_call = server._http_session.put.call_args
+    assert file_call[0][0] == f"http://127.0.0.1:8000/item/api_payload/{item.guid}"
+    body = file_call[1]["data"]
+    assert file_call[1]["headers"]["Content-Type"] == body.content_type
+    assert body.file_size == 1000
+    assert progress == []
+    assert b"x" * 1000 in b"".join(body)
+    assert progress == [(item, 1000, 1000)]
+    item.fileobj.close()
+
+
+def test_iter_objects_pages_through_results() -> None:
+    server = _mock_server(pagination=True)
+    templates = [{"guid": str(uuid.uuid1()), "name": f"T{i}"} for i in range(5)]
+    pages = {
+        0: templates[:2],
+        2: {"results": templates[2:4], "next": "more"},
+        4: {"results": templates[4:], "next": None},
+    }
+
+    def fake_get(uri, auth=None):
+        offset = int(uri.rsplit("offset=", 1)[1])
+        assert "limit=2" in uri
+        return Mock(status_code=requests.codes.ok, json=Mock(return_value=pages[offset]))
+
+    server._http_session.get.side_effect = fake_get
+    objects = server.iter_objects(objtype=ro.TemplateREST, query="A|t_name|cont|T;", page_size=2)
+
+    server._http_session.get.assert_not_called()
+    first = next(objects)
+    assert first.name == "T0" and first.saved
+    assert server._http_session.get.call_count == 1
+    assert [o.name for o in objects] == ["T1", "T2", "T3", "T4"]
+    assert server._http_session.get.call_count == 3
+    assert "query=A%7Ct_name%7Ccont%7CT%3B" in server._http_session.get.call_args[0][0]
+
+
+def test_iter_objects_without_server_pagination() -> None:
+    server = _mock_server()
+    templates = [{"guid": str(uuid.uuid1()), "name": f"T{i}"} for i in range(3)]
+    server._http_session.get.return_value = Mock(
+        status_code=requests.codes.ok, json=Mock(return_value=templates)
+    )
+
+    assert [o.name for o in server.iter_objects(objtype=ro.TemplateREST, page_size=1)] == [
+        "T0",
+        "T1",
+        "T2",
+    ]
+    assert "limit=" not in server._http_session.get.call_args[0][0]
+    with pytest.raises(ValueError, match="positive integer"):
+        server.iter_objects(page_size=0)
+
+
+def test_get_objects_with_fields_and_deferred_payload() -> None:
+    server = _mock_server(field_selection=True)
+    guid = str(uuid.uuid1())
+    listing = Mock(
+        status_code=requests.codes.ok,
+        json=Mock(return_value=[{"guid": guid, "name": "table", "type": "string"}]),
+    )
+    detail = Mock(
+        status_code=requests.codes.ok,
+        json=Mock(return_value={"guid": guid, "type": "string", "payloaddata": "hello"}),
+    )
+    server._http_session.get.side_effect = [listing, detail]
+
+    items = server.get_objects(
+        objtype=ro.ItemREST, fields=["name", "type", "payloaddata"], defer_payload=True
+    )
+
+    assert "fields=guid,name,type&" in server._http_session.get.call_args[0][0] + "&"
+    assert items[0].name == "table" and items[0].payload_deferred
+    assert server._http_session.get.call_count == 1
+    assert items[0].get_payload_content() == "hello"
+    assert f"/item/api_detail/{guid}" in server._http_session.get.call_args[0][0]
+
+    server._api_info["field_selection"] = False
+    server._http_session.get.side_effect = None
+    server._http_session.get.return_value = listing
+    server.get_objects(objtype=ro.ItemREST, fields=["name"])
+    assert "fields=" not in server._http_session.get.call_args[0][0]
+
+
+def test_get_objects_by_guids_batches_queries(monkeypatch) -> None:
+    server = _mock_server()
+    monkeypatch.setattr(server, "GUID_QUERY_CHUNK_SIZE", 2)
+    guids = [str(uuid.uuid1()) for _ in range(3)]
+
+    def fake_get(uri, auth=None):
+        query = uri.split("query=", 1)[1]
+        assert query.startswith("A%7Cd_guid%7Ceq%7C")
+        found = [g for g in guids if g in query and g != guids[1]]
+        return Mock(
+            status_code=requests.codes.ok,
+            json=Mock(return_value=[{"guid": g.upper()} for g in reversed(found)]),
+        )
+
+    server._http_session.get.side_effect = fake_get
+    datasets = server.get_objects_by_guids(guids + guids[:1], objtype=ro.DatasetREST)
+
+    assert server._http_session.get.call_count == 2
+    assert [d.guid.lower() for d in datasets] == [guids[0], guids[2]]
+    assert all(isinstance(d, ro.DatasetREST) for d in datasets)
+    with pytest.raises(ValueError, match="cannot be queried by GUID"):
+        server.get_objects_by_guids(guids, objtype=ro.ItemCategoryREST)
+
+
+def test_copy_items_streams_files_with_workers(monkeypatch) -> None:
+    source = _mock_server()
+    dest = _mock_server()
+    session_guid, dataset_guid = str(uuid.uuid1()), str(uuid.uuid1())
+    items = [
+        {
+            "guid": str(uuid.uuid1()),
+            "name": f"img{i}",
+            "type": "file",
+            "session": session_guid,
+            "dataset": dataset_guid,
+            "fileurl": f"/media/file{i}.txt",
+        }
+        for i in range(3)
+    ]
+
+    def fake_get(uri, auth=None):
+        if "/item/" in uri:
+            data = items
+        elif "s_guid" in uri:
+            data = [{"guid": session_guid}]
+        else:
+            data = [{"guid": dataset_guid}]
+        return Mock(status_code=requests.codes.ok, json=Mock(return_value=data))
+
+    source._http_session.get.side_effect = fake_get
+
+    class FakeResponse:
+        status_code = requests.codes.ok
+
+        def __init__(self, content):
+            self.headers = {"Content-Length": str(len(content))}
+            self._content = content
+            self.closed = False
+
+        def iter_content(self, chunk_size):
+            for i in range(0, len(self._content), 2):
+                yield self._content[i : i + 2]
+
+        def close(self):
+            self.closed = True
+
+    responses = []
+
+    def fake_web_request(method, server, relative_url, stream=False):
+        assert server is source and stream
+        responses.append(FakeResponse(relative_url.encode("utf-8")))
+        return responses[-1]
+
+    monkeypatch.setattr(r.report_utils, "run_web_request", fake_web_request)
+    uploads = {}
+    pushed = []
+
+    def fake_put(uri, auth=None, data=None, headers=None):
+        pushed.append(uri)
+        if "/item/api_payload/" in uri:
+            assert len(data) > data.file_size
+            uploads[uri.rsplit("/", 1)[1]] = b"".join(data)
+        return Mock(status_code=requests.codes.ok)
+
+    dest._http_session.put.side_effect = fake_put
+    progress = Mock()
+
+    assert dest.copy_items(
+        source, progress=progress, progress_qt=False, max_workers=3, stream_files=True
+    )
+
+    # the session and dataset go first
+    assert session_guid in pushed[0] or session_guid in pushed[1]
+    assert dataset_guid in pushed[0] or dataset_guid in pushed[1]
+    assert len(uploads) == 3
+    for item in items:
+        assert item["fileurl"].encode("utf-8") in uploads[item["guid"]]
+    assert all(resp.closed for resp in responses)
+    assert progress.setValue.call_args[0][0] == 3
+
+
+def test_response_file_reads_forward_only() -> None:
+    response = Mock()
+    response.iter_content.return_value = iter([b"abc", b"de", b"f"])
+    stream = r._ResponseFile(response, 6, chunk_size=3)
+
+    assert stream.seek(0) == 0
+    assert stream.read(4) == b"abcd"
+    assert stream.tell() == 4
+    with pytest.raises(OSError):
+        stream.seek(0)
+    assert stream.read() == b"ef"
+    stream.close()
+    response.close.assert_called_once()
+
+
+def test_cached_get_revalidates_with_etag() -> None:
+    server = _mock_server()
+    server.enable_cache(max_entries=4, ttl=0.0)
+    listing = [{"guid": "a" * 36, "name": "T0"}]
+    first = Mock(status_code=requests.codes.ok, headers={"ETag": '"v1"'})
+    first.json.return_value = listing
+    not_modified = Mock(status_code=requests.codes.not_modified, headers={})
+    server._http_session.get.side_effect = [first, not_modified]
+
+    assert server._cached_get("http://127.0.0.1:8000/reports/api_list", None) is first
+    assert server._cached_get("http://127.0.0.1:8000/reports/api_list", None) is first
+    headers = server._http_session.get.call_args[1]["headers"]
+    assert headers == {"If-None-Match": '"v1"'}
+
+
+def test_cached_get_serves_fresh_entries_and_invalidates_on_push() -> None:
+    server = _mock_server()
+    server.enable_cache(max_entries=1, ttl=60.0)
+    ok = Mock(status_code=requests.codes.ok, headers={})
+    server._http_session.get.return_value = ok
+    uri = "http://127.0.0.1:8000/reports/api_list"
+
+    server._cached_get(uri, None)
+    server._cached_get(uri, None)
+    assert server._http_session.get.call_count == 1
+
+    # LRU eviction keeps a single entry
+    server._cached_get("http://127.0.0.1:8000/item/api_list", None)
+    assert len(server._response_cache) == 1
+    server._cached_get(uri, None)
+    assert server._http_session.get.call_count == 3
+
+    server._http_session.put.return_value = Mock(status_code=requests.codes.ok)
+    server.put_objects([server.create_template(name="T0")])
+    assert len(server._response_cache) == 0
+
+
+def test_cached_get_does_not_keep_responses_fetched_during_push() -> None:
+    server = _mock_server()
+    server.enable_cache(max_entries=4, ttl=60.0)
+    stale = Mock(status_code=requests.codes.ok, headers={})
+    fresh = Mock(status_code=requests.codes.ok, headers={})
+    uri = "http://127.0.0.1:8000/reports/api_list"
+
+    def fake_put(uri_, auth=None, data=None, headers=None):
+        # a concurrent listing caches the old data while the push is in flight
+        assert server._cached_get(uri, None) is stale
+        return Mock(status_code=requests.codes.ok)
+
+    server._http_session.get.side_effect = [stale, fresh]
+    server._http_session.put.side_effect = fake_put
+    server.put_objects([server.create_template(name="T0")])
+    assert server._cached_get(uri, None) is fresh
+
+    # a listing sent before the push and answered after it is not kept either
+    cache = server._response_cache
+    generation = cache.generation
+    server._http_session.delete.return_value = Mock(status_code=requests.codes.no_content)
+    server.del_objects([server.create_template(name="T1")])
+    cache.put(("http://127.0.0.1:8000/reports/api_detail/x", None), stale, generation)
+    assert len(cache) == 0
+
+
+def test_get_templates_by_name_queries_server() -> None:
+    server = _mock_server()
+    root = server.create_template(name="Report")
+    child = server.create_template(name="Report", parent=root)
+    copy = server.create_template(name="Report (2)")
+    server.get_objects = Mock(return_value=[root, child, copy])
+
+    assert server.get_templates_by_name("Report") == [root, child]
+    assert server.get_objects.call_args[1]["query"] == "A|t_name|eq|Report;"
+    assert server.get_templates_by_name("Report", root_only=True, startswith=True) == [root, copy]
+    assert server.get_objects.call_args[1]["query"] == "A|t_name|cont|Report;"
+
+    # names that cannot be expressed in a query are filtered locally
+    server.get_templates_by_name("a;b")
+    assert "query" not in server.get_objects.call_args[1]
+
+
+def test_get_templates_by_name_encodes_url_characters() -> None:
+    server = _mock_server()
+    report = server.create_template(name="R&D 100% + more=1")
+    server.get_objects = Mock(return_value=[report])
+
+    assert server.get_templates_by_name("R&D 100% + more=1") == [report]
+    query = server.get_objects.call_args[1]["query"]
+    assert query == "A|t_name|eq|R%26D%20100%25%20%2B%20more%3D1;"
+    uri = server._get_list_uri(r.report_objects.TemplateREST, query=query)
+    assert uri.endswith("&query=A%7Ct_name%7Ceq%7CR%26D%20100%25%20%2B%20more%3D1%3B")
+
+
+def test_get_templates_as_dict_fetches_subtree_by_level() -> None:
+    server = _mock_server()
+    root = server.create_template(name="root")
+    left = server.create_template(name="left", parent=root)
+    right = server.create_template(name="right", parent=root)
+    # a chain deeper than the recursion limit
+    chain = [left]
+    for i in range(sys.getrecursionlimit() + 10):
+        chain.append(server.create_template(name=f"deep{i}", parent=chain[-1]))
+    unrelated = server.create_template(name="unrelated")
+    by_guid = {t.guid: t for t in [root, right, unrelated, *chain]}
+    queries = []
+
+    def fake_get_objects(objtype=None, query=None):
+        queries.append(query)
+        guids = query.split("|")[3].rstrip(";").split(",")
+        return [by_guid[g] for g in guids]
+
+    server.get_objects = fake_get_objects
+    templates_json = server.get_templates_as_dict(root.guid)
+
+    assert len(templates_json) == len(chain) + 2
+    assert all(unrelated.guid not in q for q in queries)
+    assert templates_json["Template_0"]["children"] == ["Template_1", "Template_2"]
+    assert templates_json["Template_1"]["name"] == "left"
+    assert templates_json["Template_1"]["children"] == ["Template_3"]
+    # the first subtree is walked before the second sibling
+    assert templates_json["Template_3"]["name"] == "deep0"
+    assert list(templates_json)[-1] == "Template_2"
+    assert templates_json["Template_2"]["parent"] == "Template_0"
+
+
+def test_load_templates_pushes_levels_breadth_first() -> None:
+    server = _mock_server()
+
+    def node(name, parent, children):
+        return {
+            "name": name,
+            "report_type": "Layout:basic",
+            "parent": parent,
+            "children": children,
+            "item_filter": "",
+        }
+
+    templates_json = {
+        "Template_0": node("root", None, ["Template_1", "Template_2"]),
+        "Template_1": node("a", "Template_0", ["Template_3"]),
+        "Template_2": node("b", "Template_0", ["Template_4"]),
+        "Template_3": node("a1", "Template_1", []),
+        "Template_4": node("b1", "Template_2", []),
+    }
+    pushed = []
+
+    def fake_put(uri, auth=None, data=None, headers=None):
+        pushed.append(json.loads(data))
+        return Mock(status_code=requests.codes.ok)
+
+    server._http_session.put.side_effect = fake_put
+    logger = Mock()
+    assert server.load_templates(templates_json, logger, max_workers=2) == requests.codes.ok
+
+    # three levels without children, then the two levels of parents with them
+    names = [p["name"] for p in pushed]
+    assert names[0] == "root"
+    assert set(names[1:3]) == {"a", "b"}
+    assert set(names[3:5]) == {"a1", "b1"}
+    assert all(p["children"] == [] for p in pushed[:5])
+    assert set(names[5:]) == {"root", "a", "b"}
+    by_name = {p["name"]: p for p in pushed[5:]}
+    by_name.update({p["name"]: p for p in pushed[3:5]})
+    # every child points at its own parent
+    assert by_name["a1"]["parent"] == by_name["a"]["guid"]
+    assert by_name["b1"]["parent"] == by_name["b"]["guid"]
+    assert by_name["b"]["children"] == [by_name["b1"]["guid"]]
+    assert logger.info.call_count == 4
+
+
+def test_load_templates_validates_before_pushing() -> None:
+    server = _mock_server()
+    templates_json = {
+        "Template_0": {
+            "name": "root",
+            "report_type": "Layout:basic",
+            "parent": None,
+            "children": ["Template_1"],
+            "item_filter": "",
+        },
+        "Template_1": {
+            "name": "bad",
+            "report_type": "Layout:unknown",
+            "parent": "Template_0",
+            "children": [],
+            "item_filter": "",
+        },
+    }
+    with pytest.raises(e.TemplateEditorJSONLoadingError):
+        server.load_templates(templates_json)
+    server._http_session.put.assert_not_called()
+
+
+def test_http_session_pooling_and_timeout_configuration() -> None:
+    server = r.Server(
+        url="http://127.0.0.1:8000", pool_maxsize=32, max_retries=5, timeout=(1.0, 2.0)
+    )
+    adapter = server._http_session.get_adapter("http://127.0.0.1:8000")
+    assert adapter._pool_maxsize == 32
+    assert adapter.max_retries.status == 5
+    assert requests.codes.too_many_requests in adapter.max_retries.status_forcelist
+    assert adapter.timeout == (1.0, 2.0)
+
+    old_session = server._http_session
+    server.configure_http(timeout=None)
+    assert server._http_session is not old_session
+    adapter = server._http_session.get_adapter("http://127.0.0.1:8000")
+    assert adapter._pool_maxsize == r.Server.DEFAULT_POOL_MAXSIZE
+    assert adapter.timeout is None
+    # requests wait forever unless a timeout is set
+    assert r.Server(url="http://127.0.0.1:8000").timeout is None
+
+
+def test_http_session_retries_overloaded_server() -> None:
+    statuses = [503, 429, 200]
+    seen = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            status = statuses[len(seen)]
+            seen.append(status)
+            self.send_response(status)
+            if status != 200:
+                self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"[]")
+
+        def log_message(self, *args):
+            pass
+
+    httpd = http.server.HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        server = r.Server(url=f"http://127.0.0.1:{httpd.server_port}", backoff_factor=0)
+        response = server._http_session.get(server.build_request_url("/item/api_list"))
+        assert response.status_code == requests.codes.ok
+        assert seen == statuses
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+@pytest.mark.parametrize(
+    "compression, decompress",
+    [("gzip", gzip.decompress), ("deflate", zlib.decompress)],
+)
+def test_push_bodies_are_compressed_when_negotiated(compression, decompress) -> None:
+    server = _mock_server(request_encodings=["gzip", "deflate"])
+    server.set_compression(compression)
+    template = server.create_template(name="T" * 2000)
+
+    data, headers = server._encode_push_body(template.get_url_data()[1])
+    assert headers["Content-Encoding"] == compression
+    assert json.loads(decompress(data))["name"] == "T" * 2000
+
+    # small bodies are sent as is
+    data, headers = server._encode_push_body({"name": "T"})
+    assert "Content-Encoding" not in headers
+    assert json.loads(data) == {"name": "T"}
+
+
+def test_push_bodies_are_not_compressed_without_server_support() -> None:
+    server = _mock_server()
+    server.set_compression("gzip")
+    data, headers = server._encode_push_body({"name": "T" * 2000})
+    assert "Content-Encoding" not in headers
+    assert isinstance(data, str)
+    with pytest.raises(ValueError):
+        server.set_compression("br")
+    assert "gzip" in r.Server()._http_session.headers["Accept-Encoding"]
+
+
+def test_push_queue_spills_and_keeps_order(tmp_path) -> None:
+    server = _mock_server()
+    release = threading.Event()
+    pushed = []
+
+    def fake_put_objects(objects, **kwargs):
+        release.wait(5)
+        pushed.extend(o.name for o in objects)
+        return requests.codes.ok
+
+    server.put_objects = fake_put_objects
+    queue = server.start_push_queue(max_pending=2, batch_size=2, spill_dir=str(tmp_path))
+    names = [f"T{i}" for i in range(7)]
+    for name in names:
+        server.enqueue(server.create_template(name=name))
+    # the worker is blocked, so the objects beyond max_pending are spilled
+    assert queue.spilled >= 3
+    assert not server.flush(timeout=0.01)
+    release.set()
+    assert server.flush(timeout=5)
+    assert pushed == names
+    assert len(queue) == 0 and queue.spilled == 0
+    server.close_push_queue()
+    with pytest.raises(RuntimeError):
+        queue.enqueue(server.create_template(name="late"))
+
+
+def test_push_queue_reports_errors() -> None:
+    server = _mock_server()
+    calls = []
+
+    def fake_put_objects(objects, **kwargs):
+        calls.append(len(objects))
+        if len(calls) == 1:
+            raise requests.ConnectionError("down")
+        return requests.codes.bad_request
+
+    server.put_objects = fake_put_objects
+    errors = []
+    server.start_push_queue(batch_size=1, on_error=lambda objs, err: errors.append(err))
+    server.enqueue(server.create_template(name="A"))
+    server.enqueue(server.create_template(name="B"))
+    server.close_push_queue()
+    assert isinstance(errors[0], requests.ConnectionError)
+    assert errors[1] == requests.codes.bad_request
+
+
+def test_push_queue_requeue_from_error_callback(monkeypatch) -> None:
+    monkeypatch.setattr(push_queue, "atexit", Mock())
+    server = _mock_server()
+    taken = threading.Event()
+    queued = threading.Event()
+    pushed = []
+
+    def fake_put_objects(objects, **kwargs):
+        if objects[0].name == "A" and not pushed:
+            taken.set()
+            queued.wait(5)
+            pushed.append("failed")
+            return requests.codes.service_unavailable
+        pushed.extend(o.name for o in objects)
+        return requests.codes.ok
+
+    unpicklable = server.create_template(name="C")
+    unpicklable.lock = threading.Lock()
+    errors = []
+
+    def on_error(objects, error):
+        for o in objects:
+            queue.enqueue(o)
+        try:
+            queue.enqueue(unpicklable)
+        except RuntimeError as e:
+            errors.append(e)
+
+    server.put_objects = fake_put_objects
+    queue = server.start_push_queue(max_pending=1, batch_size=1, on_error=on_error)
+    push_queue.atexit.register.assert_called_once_with(queue.close)
+    server.enqueue(server.create_template(name="A"))
+    taken.wait(5)
+    server.enqueue(server.create_template(name="B"))
+    queued.set()
+    # the failed object is queued again while the queue is closing, and is pushed
+    server.close_push_queue()
+    assert pushed == ["failed", "B", "A"]
+    # the worker cannot wait for room for an object it cannot spill
+    assert len(errors) == 1
+    push_queue.atexit.unregister.assert_called_once_with(queue.close)
+
+
+def test_put_objects_skips_unchanged_objects(tmp_path) -> None:
+    server = _mock_server()
+    server._http_session.put.return_value = Mock(status_code=requests.codes.ok)
+    template = server.create_template(name="T")
+
+    assert server.put_objects(template) == requests.codes.ok
+    assert server.put_objects(template) == requests.codes.ok
+    assert server._http_session.put.call_count == 1
+    assert server.put_objects(template, force=True) == requests.codes.ok
+    assert server._http_session.put.call_count == 2
+    template.name = "changed"
+    server.put_objects(template)
+    assert server._http_session.put.call_count == 3
+
+    # the file content is part of the digest
+    scene = tmp_path / "scene.avz"
+    scene.write_bytes(b"x" * 100)
+    item = server.create_item(name="scene")
+    item.set_payload_scene(str(scene))
+    server._default_session_digest = r.Server.get_object_digest(server.get_default_session())
+    server._default_dataset_digest = r.Server.get_object_digest(server.get_default_dataset())
+    server._http_session.put.reset_mock()
+    server.put_objects(item)
+    server.put_objects(item)
+    assert server._http_session.put.call_count == 2
+    item.fileobj.close()
+    scene.write_bytes(b"y" * 100)
+    item.fileobj = open(scene, "rb")
+    server.put_objects(item)
+    assert server._http_session.put.call_count == 4
+    item.fileobj.close()
+
+    # deleting an object forgets its digest
+    server._http_session.delete.return_value = Mock(status_code=requests.codes.no_content)
+    server.del_objects(template)
+    server.put_objects(template)
+    assert server._http_session.put.call_count == 5
+
+
+def test_push_digests_survive_concurrent_deletes() -> None:
+    server = _mock_server()
+    server._http_session.put.return_value = Mock(status_code=requests.codes.ok)
+    server._http_session.delete.return_value = Mock(status_code=requests.codes.no_content)
+    templates = [server.create_template(name=f"T{i}") for i in range(200)]
+    items = [server.create_item(name=f"I{i}") for i in range(200)]
+    server._default_session_digest = r.Server.get_object_digest(server.get_default_session())
+    server._default_dataset_digest = r.Server.get_object_digest(server.get_default_dataset())
+    assert server.put_objects(templates + items, max_workers=8) == requests.codes.ok
+    assert len(server.push_digests) == 400
+
+    # deleting templates sweeps the template digests while items are forgotten
+    assert server.del_objects(templates + items, max_workers=8) == requests.codes.ok
+    assert server.push_digests == {}
+
+
+def test_push_digests_are_forgotten_when_the_url_changes() -> None:
+    server = _mock_server()
+    server._http_session.put.return_value = Mock(status_code=requests.codes.ok)
+    template = server.create_template(name="T0")
+    assert server.put_objects([template]) == requests.codes.ok
+    assert server.put_objects([template]) == requests.codes.ok
+    assert server._http_session.put.call_count == 1
+
+    # the same URL keeps the digests
+    server.set_URL("http://127.0.0.1:8000")
+    assert len(server.push_digests) == 1
+    # another database has none of the objects
+    server.set_URL("http://127.0.0.1:8001")
+    server._api_info = {"version": "1.0"}
+    assert server.push_digests == {}
+    assert server.put_objects([template]) == requests.codes.ok
+    assert server._http_session.put.call_count == 2
+    assert server._http_session.put.call_args[0][0].startswith("http://127.0.0.1:8001/")
+
+
+def test_put_objects_bulk_skips_unchanged_objects() -> None:
+    server = _mock_server(bulk_push=True)
+    templates = [server.create_template(name=f"T{i}") for i in range(3)]
+    sent = []
+
+    def fake_post(uri, auth=None, data=None, headers=None):
+        entries = json.loads(data)["objects"]
+        sent.append(len(entries))
+        return Mock(
+            status_code=requests.codes.ok,
+            json=Mock(return_value=[{"status": requests.codes.ok}] * len(entries)),
+        )
+
+    server._http_session.post.side_effect = fake_post
+    server.put_objects_bulk(templates)
+    templates[1].name = "changed"
+    status = server.put_objects_bulk(templates)
+    assert sent == [3, 1]
+    assert set(status.values()) == {requests.codes.ok}
+
+
+def test_table_push_uses_binary_arrays_when_negotiated() -> None:
+    array = np.arange(6, dtype="f8").reshape(2, 3)
+    server = _mock_server(binary_tables=True)
+    item = server.create_item(name="table")
+    item.set_payload_table_values(array)
+
+    _, _, data = server._get_push_request_spec(item)
+    payload = json.loads(data["payloaddata"])
+    assert "__ndarray__" in payload["array"]
+
+    received = r.report_objects.ItemREST()
+    received.type = r.report_objects.ItemREST.type_tbl
+    received._payloaddata = payload
+    content = received.get_payload_content()
+    np.testing.assert_array_equal(content["array"], array)
+    assert content["shape"] == (2, 3)
+    assert received.get_payload_content(as_list=True)["array"] == array.tolist()
+
+    # servers without the feature still get nested JSON lists
+    _, _, data = _mock_server()._get_push_request_spec(item)
+    assert json.loads(data["payloaddata"])["array"] == array.tolist()
+
+
+def test_item_payload_is_encoded_once_when_negotiated() -> None:
+    array = np.arange(6, dtype="f8").reshape(2, 3)
+    server = _mock_server(payload_objects=True)
+    item = server.create_item(name="table")
+    item.set_payload_table_values(array)
+
+    _, _, obj_data = server._get_push_request_spec(item)
+    assert obj_data["payloaddata"]["array"] is array
+    data, _ = server._encode_push_body(obj_data)
+    assert json.loads(data)["payloaddata"]["array"] == array.tolist()
+
+    # servers without the feature still get the payload as a JSON string
+    _, _, obj_data = _mock_server()._get_push_request_spec(item)
+    assert json.loads(obj_data["payloaddata"])["array"] == array.tolist()
+
+
+def test_copy_item_downloads_again_when_streamed_upload_is_rejected(monkeypatch) -> None:
+    source = _mock_server()
+    dest = _mock_server()
+    dest.backoff_factor = 0
+    item = ro.ItemREST()
+    item.from_json(
+        {
+            "guid": str(uuid.uuid1()),
+            "name": "img",
+            "type": "file",
+            "session": dest.get_default_session().guid,
+            "dataset": dest.get_default_dataset().guid,
+            "fileurl": "/media/file.txt",
+        }
+    )
+    downloads = []
+
+    def fake_web_request(method, server, relative_url, stream=False):
+        response = Mock(status_code=requests.codes.ok, headers={"Content-Length": "6"})
+        response.iter_content.return_value = iter([b"abc", b"def"])
+        downloads.append(response)
+        return response
+
+    monkeypatch.setattr(r.report_utils, "run_web_request", fake_web_request)
+    statuses = [requests.codes.service_unavailable, requests.codes.ok]
+    uploads = []
+
+    def fake_put(uri, auth=None, data=None, headers=None):
+        if "/item/api_payload/" not in uri:
+            return Mock(status_code=requests.codes.ok)
+        # the streamed body cannot be sent twice
+        assert not data.rewindable
+        uploads.append(b"".join(data))
+        with pytest.raises(OSError):
+            list(data)
+        return Mock(status_code=statuses[len(uploads) - 1])
+
+    dest._http_session.put.side_effect = fake_put
+
+    dest._copy_object(source, item, stream_files=True)
+    assert len(downloads) == 2 and all(d.close.called for d in downloads)
+    assert len(uploads) == 2 and all(b"abcdef" in u for u in uploads)
+
+
+def test_http_session_does_not_retry_streamed_uploads() -> None:
+    seen = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_PUT(self):
+            seen.append(self.rfile.read(int(self.headers["Content-Length"])))
+            self.send_response(503 if len(seen) == 1 else 200)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    httpd = http.server.HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        server = r.Server(url=f"http://127.0.0.1:{httpd.server_port}", backoff_factor=0)
+        url = server.build_request_url("/item/api_payload/a")
+        response = Mock()
+        response.iter_content.return_value = iter([b"abc", b"def"])
+        body = r.MultipartFileEncoder("file", "a.txt", r._ResponseFile(response, 6, 3))
+        # the first attempt is returned, instead of sending the consumed stream again
+        assert server._http_session.put(url, data=body).status_code == 503
+        assert len(seen) == 1 and b"abcdef" in seen[0]
+        # through a single adapter, closed along with the session
+        stream_adapter = server._http_session.get_adapter(url).stream_adapter
+        assert stream_adapter.max_retries.status == 0
+        assert stream_adapter._pool_maxsize == server.pool_maxsize
+        assert len(stream_adapter.poolmanager.pools) == 1
+        # bodies that can be rewound are retried
+        seen.clear()
+        body = r.MultipartFileEncoder("file", "a.txt", io.BytesIO(b"abcdef"))
+        assert server._http_session.put(url, data=body).status_code == 200
+        assert len(seen) == 2 and all(b"abcdef" in s for s in seen)
+        server._http_session.close()
+        assert len(stream_adapter.poolmanager.pools) == 0
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
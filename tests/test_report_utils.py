@@ -174,6 +174,40 @@ def test_narray_getitem() -> None:
     assert myval == 10 and type(myb) is bytes
 
 
+@pytest.mark.ado_test
+def test_narray_rows() -> None:
+    a = ru.nexus_array(dtype="i4")
+    a.from_2dlist(value=[[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+    assert a.to_2dlist() == [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    assert a.get_rows(start=1, stop=2) == [[4, 5, 6]]
+    a.set_rows(rows=[[0, 0, 0]], start=2)
+    assert a[2, 1] == 0 and a.element_size() == 4
+    with pytest.raises(ValueError):
+        a.set_rows(rows=[[1, 2]])
+    s = ru.nexus_array(dtype="S3")
+    s.from_2dlist(value=[["a", "bcde"], [b"x", 1]])
+    assert s.to_2dlist() == [[b"a  ", b"bcd"], [b"x  ", b"1  "]]
+
+
+@pytest.mark.ado_test
+def test_narray_buffer() -> None:
+    a = ru.nexus_array(dtype="f8", shape=(2, 2))
+    a.from_2dlist(value=[[1.0, 2.0], [3.0, 4.0]])
+    assert a.to_memoryview().shape == (2, 2)
+    view = a.to_numpy()
+    assert not view.flags.writeable and np.shares_memory(view, np.asarray(a))
+    copy = a.to_numpy(writeable=True)
+    copy[0, 0] = 5.0
+    assert a[0, 0] == 1.0
+    np.asarray(a)[1, 1] = 6.0
+    assert view[1, 1] == 6.0
+    b = ru.nexus_array()
+    b.from_numpy(value=np.array([[1, 2]], dtype=">u4"))
+    assert b.dtype == "u4" and b.element_size() == 4 and b.to_2dlist() == [[1, 2]]
+    b.from_numpy(value=np.array([[b"ab", b"cd"]], dtype="S2"))
+    assert b.dtype == "S2" and b.to_2dlist() == [[b"ab", b"cd"]]
+
+
 @pytest.mark.ado_test
 def test_settings() -> None:
     try: